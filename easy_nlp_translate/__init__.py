@@ -1,6 +1,27 @@
 from .initialize import initialize_translator
+from .cache import CachedTranslator, TranslationCache
+from .rate_limit import configure_rate_limit
+from .client_pool import configure_client_pool
+from .router import RouterTranslator
+from .metrics import (
+    OpenTelemetryMetricsHook,
+    add_metrics_hook,
+    remove_metrics_hook,
+)
+from .prompt_config import preload_prompt_templates
 import logging
 
 logging.getLogger(__name__).addHandler(logging.NullHandler())
 
-__all__ = ["initialize_translator"]
+__all__ = [
+    "initialize_translator",
+    "CachedTranslator",
+    "TranslationCache",
+    "configure_rate_limit",
+    "configure_client_pool",
+    "RouterTranslator",
+    "add_metrics_hook",
+    "remove_metrics_hook",
+    "OpenTelemetryMetricsHook",
+    "preload_prompt_templates",
+]
@@ -0,0 +1,131 @@
+import json
+import logging
+import time
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from .config import DEFAULT_CACHE_DIR
+
+logger = logging.getLogger(__name__)
+
+BATCH_JOBS_DIR = DEFAULT_CACHE_DIR / "batch_jobs"
+
+# Provider-independent job states reported by `LLMTranslator.poll`.
+BATCH_IN_PROGRESS = "in_progress"
+BATCH_COMPLETED = "completed"
+BATCH_FAILED = "failed"
+
+
+class BatchJob:
+    """
+    A job submitted to a provider's asynchronous batch API.
+
+    The job is stored as a JSON manifest on disk, so a later process can resume
+    polling and collecting it with `BatchJob.load`.
+    """
+
+    def __init__(
+        self,
+        provider: str,
+        model_name: str,
+        batch_id: str,
+        count: int,
+        path: Union[str, Path],
+        status: str = BATCH_IN_PROGRESS,
+        created_at: Optional[float] = None,
+    ):
+        """
+        Initializes the job.
+
+        Args:
+            provider (str): The class name of the translator that submitted the job.
+            model_name (str): The model the job runs on.
+            batch_id (str): The provider's id of the batch.
+            count (int): The number of texts in the batch.
+            path (Union[str, Path]): The path of the manifest file.
+            status (str): The last known status. Defaults to "in_progress".
+            created_at (Optional[float]): The submission time as a Unix timestamp.
+                Defaults to now.
+        """
+        self.provider = provider
+        self.model_name = model_name
+        self.batch_id = batch_id
+        self.count = count
+        self.path = Path(path)
+        self.status = status
+        self.created_at = created_at if created_at is not None else time.time()
+
+    @staticmethod
+    def custom_id(index: int) -> str:
+        """
+        Returns the id identifying a text within the batch.
+
+        Args:
+            index (int): The index of the text in the submitted list.
+
+        Returns:
+            str: The custom id sent to the provider.
+        """
+        return f"item-{index}"
+
+    @property
+    def custom_ids(self) -> list[str]:
+        """
+        The custom ids of all texts, in input order.
+        """
+        return [self.custom_id(index) for index in range(self.count)]
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Returns the manifest contents.
+
+        Returns:
+            dict[str, Any]: A JSON-serializable representation of the job.
+        """
+        return {
+            "provider": self.provider,
+            "model_name": self.model_name,
+            "batch_id": self.batch_id,
+            "count": self.count,
+            "status": self.status,
+            "created_at": self.created_at,
+        }
+
+    def save(self):
+        """
+        Writes the manifest to `path`, replacing it atomically.
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp_path.write_text(json.dumps(self.to_dict(), indent=2))
+        tmp_path.replace(self.path)
+        logger.debug(f"Saved batch job manifest to {self.path}")
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "BatchJob":
+        """
+        Loads a job from its manifest.
+
+        Args:
+            path (Union[str, Path]): The path of the manifest file.
+
+        Returns:
+            BatchJob: The loaded job.
+
+        Raises:
+            FileNotFoundError: If the manifest does not exist.
+            ValueError: If the manifest is not a valid batch job manifest.
+        """
+        data = json.loads(Path(path).read_text())
+        try:
+            return cls(path=path, **data)
+        except TypeError as e:
+            raise ValueError(
+                f"Invalid batch job manifest '{path}': {e}"
+            ) from e
+
+    def __repr__(self) -> str:
+        return (
+            f"BatchJob(provider={self.provider!r}, batch_id={self.batch_id!r}, "
+            f"count={self.count}, status={self.status!r})"
+        )
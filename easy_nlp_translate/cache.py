@@ -0,0 +1,456 @@
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+import unicodedata
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from .config import DEFAULT_CACHE_DIR
+from .exceptions import BatchTranslationError
+from .metrics import attribute_cache_hits, measure
+from .translator_base import TranslatorBase
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = DEFAULT_CACHE_DIR / "translations.sqlite3"
+
+
+class TranslationCache:
+    """
+    A persistent translation cache backed by a local SQLite file.
+
+    Entries are evicted least-recently-used first once more than `max_entries`
+    are stored, and entries older than `ttl` seconds are treated as misses.
+    Hit and miss counters are kept per process.
+
+    Lookups and stores only use indexed queries. The number of entries is
+    tracked in memory and only recounted after an eviction, which removes
+    `EVICTION_FRACTION` of `max_entries` beyond the overflow at once, so the
+    cost of counting and evicting is spread over many stores.
+    """
+
+    # Share of max_entries evicted in addition to the overflow.
+    EVICTION_FRACTION: float = 0.01
+
+    def __init__(
+        self,
+        path: Union[str, Path] = DEFAULT_CACHE_PATH,
+        max_entries: Optional[int] = 100_000,
+        ttl: Optional[float] = None,
+    ):
+        """
+        Opens (or creates) the cache file.
+
+        Args:
+            path (Union[str, Path]): The SQLite file to store the cache in.
+                Defaults to `~/.cache/easy_nlp_translate/translations.sqlite3`.
+            max_entries (Optional[int]): The maximum number of stored translations.
+                None means no limit. Defaults to 100000.
+            ttl (Optional[float]): The number of seconds an entry stays valid.
+                None means entries never expire. Defaults to None.
+
+        Raises:
+            ValueError: If max_entries or ttl is not positive.
+        """
+        if max_entries is not None and (
+            not isinstance(max_entries, int) or max_entries <= 0
+        ):
+            raise ValueError("max_entries must be a positive integer.")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be a positive number of seconds.")
+
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            self.path, check_same_thread=False, isolation_level=None
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS translations ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+            "created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS translations_accessed_at "
+            "ON translations (accessed_at)"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS translations_created_at "
+            "ON translations (created_at)"
+        )
+        self._size = self._count()
+
+        logger.info(f"Opened translation cache at {self.path}")
+
+    @staticmethod
+    def normalize_text(text: str) -> str:
+        """
+        Normalizes a text for use in a cache key.
+
+        Args:
+            text (str): The text to normalize.
+
+        Returns:
+            str: The NFC-normalized text without leading and trailing whitespace.
+        """
+        return unicodedata.normalize("NFC", text).strip()
+
+    @staticmethod
+    def make_key(**components: Any) -> str:
+        """
+        Builds a cache key from the given components.
+
+        Args:
+            **components: JSON-serializable values identifying a translation,
+                e.g. text, languages, model and generation settings.
+
+        Returns:
+            str: The SHA-256 hex digest of the components.
+        """
+        payload = json.dumps(components, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get_many(self, keys: list[str]) -> dict[str, str]:
+        """
+        Looks up several keys at once and counts hits and misses.
+
+        Args:
+            keys (list[str]): The keys to look up.
+
+        Returns:
+            dict[str, str]: The cached translations for the keys that were found.
+        """
+        unique_keys = list(dict.fromkeys(keys))
+        if not unique_keys:
+            return {}
+
+        now = time.time()
+        found: dict[str, str] = {}
+        with self._lock:
+            for start in range(0, len(unique_keys), 500):
+                chunk = unique_keys[start : start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._connection.execute(
+                    "SELECT key, value, created_at FROM translations "
+                    f"WHERE key IN ({placeholders})",
+                    chunk,
+                ).fetchall()
+                for key, value, created_at in rows:
+                    if self.ttl is not None and now - created_at > self.ttl:
+                        continue
+                    found[key] = value
+
+            if self.ttl is not None:
+                expired = self._connection.execute(
+                    "DELETE FROM translations WHERE created_at < ?",
+                    (now - self.ttl,),
+                ).rowcount
+                self._size = max(self._size - expired, 0)
+            if found:
+                self._connection.executemany(
+                    "UPDATE translations SET accessed_at = ? WHERE key = ?",
+                    [(now, key) for key in found],
+                )
+
+            hits = sum(1 for key in keys if key in found)
+            self.hits += hits
+            self.misses += len(keys) - hits
+
+        return found
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Looks up a single key.
+
+        Args:
+            key (str): The key to look up.
+
+        Returns:
+            Optional[str]: The cached translation, or None on a miss.
+        """
+        return self.get_many([key]).get(key)
+
+    def set_many(self, items: dict[str, str]):
+        """
+        Stores several translations and evicts the least recently used
+        entries if the size cap is exceeded.
+
+        Args:
+            items (dict[str, str]): A mapping from key to translation.
+        """
+        if not items:
+            return
+
+        now = time.time()
+        keys = list(items)
+        with self._lock:
+            existing = 0
+            for start in range(0, len(keys), 500):
+                chunk = keys[start : start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                existing += self._connection.execute(
+                    "SELECT COUNT(*) FROM translations "
+                    f"WHERE key IN ({placeholders})",
+                    chunk,
+                ).fetchone()[0]
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO translations "
+                "(key, value, created_at, accessed_at) VALUES (?, ?, ?, ?)",
+                [(key, value, now, now) for key, value in items.items()],
+            )
+            self._size += len(keys) - existing
+
+            if self.max_entries is not None and self._size > self.max_entries:
+                evicted = self._connection.execute(
+                    "DELETE FROM translations WHERE key IN ("
+                    "SELECT key FROM translations "
+                    "ORDER BY accessed_at ASC LIMIT ?)",
+                    (
+                        self._size
+                        - self.max_entries
+                        + int(self.max_entries * self.EVICTION_FRACTION),
+                    ),
+                ).rowcount
+                self.evictions += evicted
+                # Other processes may write to the same file, so resynchronize.
+                self._size = self._count()
+                logger.debug(f"Evicted {evicted} cached translations")
+
+    def set(self, key: str, value: str):
+        """
+        Stores a single translation.
+
+        Args:
+            key (str): The cache key.
+            value (str): The translation.
+        """
+        self.set_many({key: value})
+
+    def clear(self):
+        """
+        Removes all cached translations and resets the counters.
+        """
+        with self._lock:
+            self._connection.execute("DELETE FROM translations")
+            self._size = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def _count(self) -> int:
+        return self._connection.execute(
+            "SELECT COUNT(*) FROM translations"
+        ).fetchone()[0]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._count()
+
+    @property
+    def stats(self) -> dict[str, float]:
+        """
+        The hit and miss counters of this process.
+
+        Returns:
+            dict[str, float]: hits, misses, evictions, hit_rate and the current size.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "size": len(self),
+        }
+
+    def close(self):
+        """
+        Closes the underlying SQLite connection.
+        """
+        with self._lock:
+            self._connection.close()
+
+
+class CachedTranslator(TranslatorBase):
+    """
+    Wraps any translator with a persistent translation cache.
+
+    Cache keys cover the normalized text, the language pair, the wrapped
+    translator's class and its output-relevant settings (model, prompt style,
+    generation parameters). Batch calls only send the cache misses to the
+    wrapped translator.
+
+    Only `translate` and `translate_batch` are cached. Other translation methods
+    of the wrapped translator (e.g. `translate_document`, `translate_packed`,
+    `translate_stream`, `atranslate`) are not forwarded, so they cannot bypass
+    the cache unnoticed; call them on `translator` instead. All other attributes
+    are delegated to the wrapped translator.
+    """
+
+    def __init__(
+        self,
+        translator: TranslatorBase,
+        cache: Optional[TranslationCache] = None,
+    ):
+        """
+        Initializes the cached translator.
+
+        Args:
+            translator (TranslatorBase): The translator to wrap.
+            cache (Optional[TranslationCache]): The cache to use. Defaults to a
+                `TranslationCache` at the default path.
+        """
+        self.translator = translator
+        self.cache = cache if cache is not None else TranslationCache()
+        self.LANGUAGE_CODES = translator.LANGUAGE_CODES
+
+        super().__init__(translator.target_lang, translator.source_lang)
+
+    def __getattr__(self, name: str):
+        if name == "translator":
+            raise AttributeError(name)
+        if name.startswith(("translate", "atranslate")):
+            raise AttributeError(
+                f"{type(self).__name__} does not cache '{name}'. "
+                f"Call it on the wrapped translator (`.translator.{name}`) instead."
+            )
+        return getattr(self.translator, name)
+
+    def _cache_key(self, text: str) -> str:
+        """
+        Builds the cache key for a text.
+
+        Args:
+            text (str): The text to translate.
+
+        Returns:
+            str: The cache key.
+        """
+        return TranslationCache.make_key(
+            text=TranslationCache.normalize_text(text),
+            source_lang=self.translator.source_lang or "auto",
+            target_lang=self.translator.target_lang,
+            translator=type(self.translator).__qualname__,
+            **self.translator._get_cache_params(),
+        )
+
+    def _record_cache_hits(self, operation: str, count: int):
+        """
+        Reports cache hits that no measured call of the wrapped translator claimed.
+
+        Args:
+            operation (str): The name of the call.
+            count (int): The number of texts answered from the cache.
+        """
+        with measure(self, operation, items=count) as metrics:
+            metrics.cache_hits = count
+
+    def translate(self, text: str) -> str:
+        """
+        Returns the cached translation or translates and stores it.
+
+        A cache hit is reported as its own measurement. On a miss, only the wrapped
+        translator reports one.
+
+        Args:
+            text (str): The text to be translated.
+
+        Returns:
+            str: The translated text.
+        """
+        self._validate_basic_text_to_translate(text)
+
+        key = self._cache_key(text)
+        cached = self.cache.get(key)
+        if cached is not None:
+            self._record_cache_hits("translate", 1)
+            return cached
+
+        translated_text = self.translator.translate(text)
+        self.cache.set(key, translated_text)
+        return translated_text
+
+    def translate_batch(self, texts: list, **kwargs: Any) -> list:
+        """
+        Translates a batch of texts, sending only the cache misses to the
+        wrapped translator. Duplicate misses are translated once.
+
+        If all texts are cache hits, they are reported as one measurement.
+        Otherwise the hits are added to the first measurement of the wrapped
+        translator, so every batch is reported once.
+
+        Args:
+            texts (list): A list of texts to be translated.
+            **kwargs: Passed on to the wrapped translator's `translate_batch`,
+                e.g. `batch_size` or `max_concurrency`.
+
+        Returns:
+            list: A list of translated texts, in the same order as the input.
+
+        Raises:
+            BatchTranslationError: If the wrapped translator failed for some texts.
+                The successful translations are cached, and `results` and `errors`
+                refer to positions in `texts`.
+        """
+        for text in texts:
+            self._validate_basic_text_to_translate(text)
+
+        keys = [self._cache_key(text) for text in texts]
+        found = self.cache.get_many(keys)
+        hits = sum(1 for key in keys if key in found)
+
+        missing: dict[str, str] = {}
+        for key, text in zip(keys, texts):
+            if key not in found:
+                missing.setdefault(key, text)
+
+        if not missing:
+            self._record_cache_hits("translate_batch", hits)
+            return [found[key] for key in keys]
+
+        logger.info(
+            f"Translation cache: {hits} hits, "
+            f"{len(missing)} texts sent to {type(self.translator).__name__}"
+        )
+        missing_keys = list(missing)
+        unclaimed = [hits]
+        try:
+            with attribute_cache_hits(hits) as unclaimed:
+                translations = self.translator.translate_batch(
+                    list(missing.values()), **kwargs
+                )
+        except BatchTranslationError as e:
+            new_entries = {
+                key: translation
+                for key, translation in zip(missing_keys, e.results)
+                if translation is not None
+            }
+            self.cache.set_many(new_entries)
+            found.update(new_entries)
+            failed = {
+                missing_keys[index]: error for index, error in e.errors.items()
+            }
+            raise BatchTranslationError(
+                {
+                    index: failed[key]
+                    for index, key in enumerate(keys)
+                    if key in failed
+                },
+                [found.get(key) for key in keys],
+            ) from e
+        finally:
+            if unclaimed[0]:
+                self._record_cache_hits("translate_batch", unclaimed[0])
+
+        new_entries = dict(zip(missing_keys, translations))
+        self.cache.set_many(new_entries)
+        found.update(new_entries)
+        return [found[key] for key in keys]
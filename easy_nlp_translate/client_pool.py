@@ -0,0 +1,178 @@
+import hashlib
+import logging
+import threading
+from typing import TYPE_CHECKING, Any, Callable, Hashable, Optional
+
+if TYPE_CHECKING:
+    import httpx
+
+logger = logging.getLogger(__name__)
+
+
+class SharedClientPool:
+    """
+    A process-wide pool of synchronous provider SDK clients.
+
+    Clients are keyed on provider, a hash of the credentials and any other
+    settings that change the client (e.g. a base URL), and are shared by all
+    translator instances and threads. Each client keeps its HTTP connections
+    alive between requests, so TLS handshakes are not repeated for every
+    translator. Async clients are not pooled, as they are bound to an event loop.
+    httpx is only imported when the first client is created, so importing the
+    package stays fast.
+    """
+
+    def __init__(
+        self,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 20,
+        keepalive_expiry: Optional[float] = 30.0,
+    ):
+        """
+        Initializes an empty pool.
+
+        Args:
+            max_connections (Optional[int]): The maximum number of concurrent connections
+                per client. None means no limit. Defaults to 100.
+            max_keepalive_connections (Optional[int]): The maximum number of idle connections
+                kept open per client. None means no limit. Defaults to 20.
+            keepalive_expiry (Optional[float]): The number of seconds an idle connection is
+                kept open. None means forever. Defaults to 30.
+        """
+        self._clients: dict[Hashable, Any] = {}
+        self._lock = threading.Lock()
+        self._limits: Optional["httpx.Limits"] = None
+        self.configure(
+            max_connections, max_keepalive_connections, keepalive_expiry
+        )
+
+    def configure(
+        self,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 20,
+        keepalive_expiry: Optional[float] = 30.0,
+    ):
+        """
+        Sets the connection limits of clients created from now on.
+
+        Existing clients keep their limits, call `clear` to recreate them.
+
+        Args:
+            max_connections (Optional[int]): The maximum number of concurrent connections
+                per client. None means no limit. Defaults to 100.
+            max_keepalive_connections (Optional[int]): The maximum number of idle connections
+                kept open per client. None means no limit. Defaults to 20.
+            keepalive_expiry (Optional[float]): The number of seconds an idle connection is
+                kept open. None means forever. Defaults to 30.
+
+        Raises:
+            ValueError: If a limit is not positive.
+        """
+        for name, value in (
+            ("max_connections", max_connections),
+            ("max_keepalive_connections", max_keepalive_connections),
+            ("keepalive_expiry", keepalive_expiry),
+        ):
+            if value is not None and value <= 0:
+                raise ValueError(f"{name} must be positive.")
+
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry = keepalive_expiry
+        self._limits = None
+
+    @property
+    def limits(self) -> "httpx.Limits":
+        """
+        The connection limits passed to new clients.
+        """
+        if self._limits is None:
+            import httpx
+
+            self._limits = httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+                keepalive_expiry=self.keepalive_expiry,
+            )
+        return self._limits
+
+    @staticmethod
+    def make_key(
+        provider: str, credentials: Optional[str], *settings: Hashable
+    ) -> tuple:
+        """
+        Builds the pool key of a client.
+
+        Args:
+            provider (str): The provider name.
+            credentials (Optional[str]): The API key. Only its hash is part of the key.
+            *settings (Hashable): Other settings that change the client.
+
+        Returns:
+            tuple: The pool key.
+        """
+        credentials_hash = (
+            hashlib.sha256(credentials.encode("utf-8")).hexdigest()
+            if credentials
+            else None
+        )
+        return (provider, credentials_hash, *settings)
+
+    def get(
+        self, key: Hashable, factory: Callable[["httpx.Limits"], Any]
+    ) -> Any:
+        """
+        Returns the client registered under `key`, creating it first if needed.
+
+        Args:
+            key (Hashable): The pool key, see `make_key`.
+            factory (Callable[[httpx.Limits], Any]): Creates the client with the given
+                connection limits.
+
+        Returns:
+            Any: The shared client.
+        """
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                logger.info(f"Creating pooled client for {key[0]}")
+                client = factory(self.limits)
+                self._clients[key] = client
+            return client
+
+    def clear(self):
+        """
+        Drops all pooled clients. Translators keep the clients they already hold.
+        """
+        with self._lock:
+            self._clients.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._clients)
+
+
+shared_client_pool = SharedClientPool()
+
+
+def configure_client_pool(
+    max_connections: Optional[int] = 100,
+    max_keepalive_connections: Optional[int] = 20,
+    keepalive_expiry: Optional[float] = 30.0,
+):
+    """
+    Sets the connection limits of the shared client pool and drops existing clients,
+    so new translators get clients with the new limits.
+
+    Args:
+        max_connections (Optional[int]): The maximum number of concurrent connections
+            per client. None means no limit. Defaults to 100.
+        max_keepalive_connections (Optional[int]): The maximum number of idle connections
+            kept open per client. None means no limit. Defaults to 20.
+        keepalive_expiry (Optional[float]): The number of seconds an idle connection is
+            kept open. None means forever. Defaults to 30.
+    """
+    shared_client_pool.configure(
+        max_connections, max_keepalive_connections, keepalive_expiry
+    )
+    shared_client_pool.clear()
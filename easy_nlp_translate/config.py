@@ -1,3 +1,13 @@
+import os
+from pathlib import Path
+
+DEFAULT_CACHE_DIR = Path(
+    os.getenv(
+        "EASY_NLP_TRANSLATE_CACHE_DIR",
+        Path.home() / ".cache" / "easy_nlp_translate",
+    )
+)
+
 available_language_codes = [
     "af",  # Afrikaans
     "ar",  # Arabic
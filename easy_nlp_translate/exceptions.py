@@ -1,4 +1,50 @@
+from typing import Optional
+
+
 class DetectionError(Exception):
     """Base class for all detection errors."""
 
     pass
+
+
+class BatchTranslationError(Exception):
+    """
+    Raised when one or more items of a batch translation fail.
+
+    Attributes:
+        errors (dict[int, Exception]): The exception of every failed item, keyed by input index.
+        results (list[Optional[str]]): The translations in input order, None for failed items.
+    """
+
+    def __init__(
+        self, errors: dict[int, Exception], results: list[Optional[str]]
+    ):
+        self.errors = errors
+        self.results = results
+        details = "; ".join(
+            f"item {index}: {error}" for index, error in sorted(errors.items())
+        )
+        super().__init__(
+            f"{len(errors)} of {len(results)} translations failed: {details}"
+        )
+
+
+class RoutingError(Exception):
+    """
+    Raised when no backend of a router translator returned a translation.
+
+    Attributes:
+        errors (dict[str, Exception]): The exception of every failed backend, keyed by
+            "{index}:{provider}:{model_name}" of the backend.
+    """
+
+    def __init__(
+        self, errors: dict[str, Exception], message: Optional[str] = None
+    ):
+        self.errors = errors
+        details = "; ".join(
+            f"{name}: {error}" for name, error in errors.items()
+        )
+        super().__init__(
+            message or f"All {len(errors)} backends failed: {details}"
+        )
@@ -1,3 +1,20 @@
-from .mbart import MBARTTranslator
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .mbart import MBARTTranslator
+
+# Translators are imported on first access so that importing this package
+# does not pull in torch and transformers.
+_LAZY_IMPORTS = {
+    "MBARTTranslator": ".mbart",
+}
 
 __all__ = ["MBARTTranslator"]
+
+
+def __getattr__(name: str):
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,15 +1,26 @@
 import logging
-from typing import Optional, Any, Union, Dict
+import threading
+from typing import Iterator, Optional, Any, Union, Dict
 
 import torch
-from transformers import MBart50Tokenizer, MBartForConditionalGeneration
+from transformers import (
+    BatchEncoding,
+    MBart50Tokenizer,
+    MBartForConditionalGeneration,
+    TextIteratorStreamer,
+)
 
 from ..huggingface_translator_base import HuggingFaceTranslator
 from ..translator_base import TranslatorBase
 from ..config import generic_to_mbart_code_map
+from ..metrics import current_metrics, measure, record_usage, stage
 
 logger = logging.getLogger(__name__)
 
+# The source language is stored on the (possibly shared) tokenizer,
+# so setting it and tokenizing has to happen atomically.
+_TOKENIZER_LOCK = threading.Lock()
+
 
 class MBARTTranslator(HuggingFaceTranslator):
     """
@@ -30,6 +41,10 @@ class MBARTTranslator(HuggingFaceTranslator):
         num_beams: Optional[int] = 4,
         tokenizer_kwargs: Optional[Dict[str, Any]] = None,  # Changed to Dict
         model_kwargs: Optional[Dict[str, Any]] = None,  # Changed to Dict
+        share_model: bool = True,
+        quantization: Optional[str] = None,
+        backend: str = "torch",
+        lazy: bool = False,
     ):
         """
         Initializes the MBARTTranslator.
@@ -53,6 +68,14 @@ class MBARTTranslator(HuggingFaceTranslator):
                 Defaults to None.
             model_kwargs (Optional[Dict[str, Any]]): Additional keyword arguments for the MBART model.
                 Defaults to None.
+            share_model (bool): Whether to share the loaded MBART model and tokenizer with other
+                translators on the same dtype and device, e.g. for other language pairs. Defaults to True.
+            quantization (Optional[str]): Set to "int8" to apply dynamic int8 quantization to the
+                linear layers of the MBART model at load time. Only supported on CPU. Defaults to None.
+            backend (str): Set to "onnx" to export MBART to ONNX once (cached on disk) and run
+                generation with ONNX Runtime on CPU. Requires the `onnx` extra. Defaults to "torch".
+            lazy (bool): Whether to load the MBART weights on first use instead of in the constructor.
+                Use `warmup()` to load them in the background. Defaults to False.
         """
         super().__init__(
             target_lang=target_lang,
@@ -62,6 +85,10 @@ class MBARTTranslator(HuggingFaceTranslator):
             num_beams=num_beams,
             tokenizer_kwargs=tokenizer_kwargs,
             model_kwargs=model_kwargs,
+            share_model=share_model,
+            quantization=quantization,
+            backend=backend,
+            lazy=lazy,
         )
 
     def _convert_lang_code(self, lang_code: str) -> str:
@@ -113,6 +140,9 @@ class MBARTTranslator(HuggingFaceTranslator):
         Args:
             model_kwargs (Optional[dict[str, Any]]): Additional arguments for the model.
         """
+        if self.backend == "onnx":
+            return self._init_onnx_model(model_kwargs)
+
         if model_kwargs is None:
             model_kwargs = {}
 
@@ -120,54 +150,280 @@ class MBARTTranslator(HuggingFaceTranslator):
             self.MODEL_NAME, **model_kwargs
         )
 
-    def translate(self, text: str) -> str:
+    def _encode(
+        self, texts: list[str], src_lang_code: Optional[str] = None
+    ) -> BatchEncoding:
         """
-        Translate the input text.
+        Tokenize texts of one source language into padded model inputs on the device.
 
         Args:
-            text (str): The text to translate.
+            texts (list[str]): The texts to tokenize.
+            src_lang_code (Optional[str]): The MBART code of the source language.
+                Defaults to the code of `self.source_lang`.
 
         Returns:
-            str: The translated text.
+            BatchEncoding: The model inputs.
         """
-        TranslatorBase._validate_basic_text_to_translate(text)
+        if src_lang_code is None:
+            src_lang_code = self._convert_lang_code(self.source_lang)
 
-        if self.source_lang is None:
-            self.tokenizer.src_lang = self._convert_lang_code(
-                self.detect_language(text)
-            )
-            logger.info(f"Detected source language: {self.tokenizer.src_lang}")
-
-        inputs = self.tokenizer(
-            text,
-            return_tensors="pt",
-            padding=True,
-            truncation=True,
-            max_length=self.max_length,
-        ).to(self.device)
+        with _TOKENIZER_LOCK:
+            self.tokenizer.src_lang = src_lang_code
+            inputs = self.tokenizer(
+                texts,
+                return_tensors="pt",
+                padding=True,
+                truncation=True,
+                max_length=self.max_length,
+            ).to(self.device)
         logger.debug(f"Tokenized inputs: {inputs}")
+        return inputs
+
+    def _forced_bos_token_id(self) -> Optional[int]:
+        """
+        Get the token id that forces MBART to generate in the target language.
 
+        Returns:
+            Optional[int]: The id of the target language token.
+        """
         forced_bos_token_id = self.tokenizer.lang_code_to_id.get(
             self._convert_lang_code(self.target_lang)
         )
         logger.info(
             f"Using forced_bos_token_id: {forced_bos_token_id} for target language: {self.target_lang}"
         )
+        return forced_bos_token_id
+
+    def _generate_translations(
+        self, texts: list[str], src_lang_code: Optional[str] = None
+    ) -> list[str]:
+        """
+        Translate a list of texts with a single padded `generate` call.
+
+        Args:
+            texts (list[str]): The texts to translate. All texts must share the same source language.
+            src_lang_code (Optional[str]): The MBART code of the source language.
+                Defaults to the code of `self.source_lang`.
 
-        with torch.no_grad():
+        Returns:
+            list[str]: The translated texts, in the same order as the input.
+        """
+        with stage("tokenize"):
+            inputs = self._encode(texts, src_lang_code)
+
+        with stage("generate"), torch.no_grad():
             outputs = self.model.generate(
                 **inputs,
-                forced_bos_token_id=forced_bos_token_id,
+                forced_bos_token_id=self._forced_bos_token_id(),
                 num_beams=self.num_beams,
                 max_length=self.max_length,
                 early_stopping=True,
             )
             logger.debug(f"Generated token IDs: {outputs}")
 
-        output = self.tokenizer.batch_decode(
-            outputs, skip_special_tokens=True
-        )[0]
+        if current_metrics() is not None:
+            record_usage(
+                input_tokens=int(inputs["attention_mask"].sum()),
+                output_tokens=int(
+                    (outputs != self.tokenizer.pad_token_id).sum()
+                ),
+            )
+
+        with stage("decode"):
+            output = self.tokenizer.batch_decode(
+                outputs, skip_special_tokens=True
+            )
 
         logger.debug(f"Output: {output}")
 
         return output
+
+    def _run_warmup(self):
+        """
+        Runs one dummy MBART generation, using English as source language
+        if no source language is set.
+        """
+        self._generate_translations(
+            [self.WARMUP_TEXT],
+            self._convert_lang_code(self.source_lang or "en"),
+        )
+
+    def translate(self, text: str) -> str:
+        """
+        Translate the input text.
+
+        Args:
+            text (str): The text to translate.
+
+        Returns:
+            str: The translated text.
+        """
+        TranslatorBase._validate_basic_text_to_translate(text)
+
+        with measure(self, "translate"):
+            src_lang_code = None
+            if self.source_lang is None:
+                src_lang_code = self._convert_lang_code(
+                    self.detect_language(text)
+                )
+                logger.info(f"Detected source language: {src_lang_code}")
+
+            return self._generate_translations([text], src_lang_code)[0]
+
+    def translate_stream(
+        self, text: str, timeout: Optional[float] = None
+    ) -> Iterator[str]:
+        """
+        Translate the input text and yield the translation in pieces while it is generated.
+
+        Generation runs in a background thread and feeds a `TextIteratorStreamer`, so
+        the first words are available long before the full translation. Streaming
+        requires greedy decoding, so `num_beams` is not used and the result can
+        differ slightly from `translate`.
+
+        Args:
+            text (str): The text to translate.
+            timeout (Optional[float]): The maximum number of seconds to wait for the
+                next piece. Defaults to None, which waits indefinitely.
+
+        Yields:
+            str: The translated text in consecutive pieces.
+
+        Raises:
+            ValueError: If the text is invalid.
+            RuntimeError: If generation fails.
+        """
+        TranslatorBase._validate_basic_text_to_translate(text)
+
+        src_lang_code = None
+        if self.source_lang is None:
+            src_lang_code = self._convert_lang_code(self.detect_language(text))
+            logger.info(f"Detected source language: {src_lang_code}")
+
+        inputs = self._encode([text], src_lang_code)
+        streamer = TextIteratorStreamer(
+            self.tokenizer,
+            skip_prompt=True,
+            timeout=timeout,
+            skip_special_tokens=True,
+        )
+        errors: list[Exception] = []
+
+        def generate():
+            try:
+                with torch.no_grad():
+                    self.model.generate(
+                        **inputs,
+                        forced_bos_token_id=self._forced_bos_token_id(),
+                        num_beams=1,
+                        max_length=self.max_length,
+                        streamer=streamer,
+                    )
+            except Exception as e:
+                errors.append(e)
+                # Unblocks the consumer without decoding the possibly broken token cache.
+                streamer.on_finalized_text("", stream_end=True)
+
+        thread = threading.Thread(
+            target=generate,
+            name=f"{self.__class__.__name__}-stream",
+            daemon=True,
+        )
+        thread.start()
+
+        for piece in streamer:
+            if piece:
+                yield piece
+        thread.join()
+
+        if errors:
+            raise RuntimeError(
+                f"Failed to generate translation with '{self.MODEL_NAME}': {errors[0]}"
+            ) from errors[0]
+
+    def _document_generate_kwargs(self, text: str) -> dict[str, Any]:
+        """
+        Detects the source language of the whole document once, if no source language is set.
+
+        Args:
+            text (str): The whole document.
+
+        Returns:
+            dict[str, Any]: The MBART source code for `_generate_translations`, if detected.
+        """
+        if self.source_lang is not None:
+            return {}
+
+        src_lang_code = self._convert_lang_code(self.detect_language(text))
+        logger.info(f"Detected source language: {src_lang_code}")
+        return {"src_lang_code": src_lang_code}
+
+    def _group_by_source_language(
+        self, texts: list[str]
+    ) -> dict[str, list[int]]:
+        """
+        Detects the language of every text and groups the text indices by MBART source code.
+
+        Args:
+            texts (list[str]): The texts to group.
+
+        Returns:
+            dict[str, list[int]]: A mapping from MBART source language code to the indices
+                of the texts in that language, in input order.
+        """
+        groups: dict[str, list[int]] = {}
+        for index, lang in enumerate(self.detect_languages(texts)):
+            groups.setdefault(self._convert_lang_code(lang), []).append(index)
+
+        logger.info(
+            f"Detected source languages: { {code: len(indices) for code, indices in groups.items()} }"
+        )
+        return groups
+
+    def translate_batch(
+        self,
+        texts: list,
+        batch_size: Optional[int] = 8,
+        max_batch_tokens: Optional[int] = None,
+    ) -> list:
+        """
+        Translate a batch of texts using padded, batched generation.
+
+        See `HuggingFaceTranslator.translate_batch` for the batching options.
+        If no source language is set, the languages of all texts are detected up
+        front and the texts are grouped by source language, since a batch can only
+        have one source language. Each group is then translated in batches of its own.
+
+        Args:
+            texts (list): A list of texts to be translated.
+            batch_size (Optional[int]): The maximum number of texts per `generate` call. Defaults to 8.
+            max_batch_tokens (Optional[int]): The maximum number of padded tokens per
+                `generate` call. Defaults to None.
+
+        Returns:
+            list: A list of translated texts, in the same order as the input.
+
+        Raises:
+            ValueError: If the batching parameters are not positive integers or any text is invalid.
+        """
+        if self.source_lang is not None:
+            return super().translate_batch(texts, batch_size, max_batch_tokens)
+
+        self._validate_batch_parameters(batch_size, max_batch_tokens)
+        for text in texts:
+            self._validate_basic_text_to_translate(text)
+
+        translations: list[Optional[str]] = [None] * len(texts)
+        with measure(self, "translate_batch", items=len(texts)):
+            groups = self._group_by_source_language(texts)
+            for src_code, indices in groups.items():
+                outputs = self._translate_in_batches(
+                    [texts[i] for i in indices],
+                    batch_size,
+                    max_batch_tokens,
+                    src_lang_code=src_code,
+                )
+                for index, output in zip(indices, outputs):
+                    translations[index] = output
+
+        return translations
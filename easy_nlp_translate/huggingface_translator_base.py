@@ -1,5 +1,17 @@
+import hashlib
+import json
 import logging
+import os
+import shutil
+import tempfile
+import threading
+import weakref
+from pathlib import Path
 from .translator_base import TranslatorBase
+from .model_registry import shared_model_registry
+from .config import DEFAULT_CACHE_DIR
+from .text_chunking import ChunkedText
+from .metrics import measure, stage
 from typing import Optional, Union, Any
 
 from transformers import PreTrainedTokenizer, PreTrainedModel
@@ -8,12 +20,22 @@ import torch
 
 logger = logging.getLogger(__name__)
 
+ONNX_CACHE_DIR = DEFAULT_CACHE_DIR / "onnx"
+
 
 class HuggingFaceTranslator(TranslatorBase):
     """
     A base class for Hugging Face-based translators, inheriting from TranslatorBase.
+
+    Loaded models and tokenizers are shared between instances through the process-wide
+    `shared_model_registry`, keyed on model name, dtype and device.
     """
 
+    MODEL_NAME: str = NotImplemented
+    SUPPORTED_QUANTIZATIONS: tuple[str, ...] = ("int8",)
+    SUPPORTED_BACKENDS: tuple[str, ...] = ("torch", "onnx")
+    WARMUP_TEXT: str = "Hello world."
+
     def __init__(
         self,
         target_lang: str,
@@ -25,6 +47,10 @@ class HuggingFaceTranslator(TranslatorBase):
         num_beams: Optional[int] = 4,
         tokenizer_kwargs: Optional[dict[str, Any]] = None,
         model_kwargs: Optional[dict[str, Any]] = None,
+        share_model: bool = True,
+        quantization: Optional[str] = None,
+        backend: str = "torch",
+        lazy: bool = False,
     ):
         """
         Initializes the HuggingFaceTranslator with target and optional source languages,
@@ -42,24 +68,406 @@ class HuggingFaceTranslator(TranslatorBase):
                 Defaults to 4.
             tokenizer_kwargs (Optional[dict[str, Any]]): Additional arguments for the tokenizer.
             model_kwargs (Optional[dict[str, Any]]): Additional arguments for the model.
+            share_model (bool): Whether to share the loaded model and tokenizer with other
+                instances using the same model name, dtype and device. Defaults to True.
+            quantization (Optional[str]): The quantization to apply to the model at load time.
+                "int8" applies dynamic int8 quantization to the linear layers, which is only
+                supported on CPU. Defaults to None.
+            backend (str): The inference backend. "torch" runs the PyTorch model, "onnx" exports
+                the model to ONNX once and runs it with ONNX Runtime on CPU. Defaults to "torch".
+            lazy (bool): Whether to defer loading the tokenizer and model until they are first
+                used or `warmup` is called. Defaults to False.
         """
         super().__init__(target_lang, source_lang)
 
         self._validate_generation_parameters(max_length, num_beams)
+        self._validate_quantization(quantization, device)
+        self._validate_backend(backend, device, quantization)
 
         self.device = device
         self.max_length = max_length
         self.num_beams = num_beams
+        self.quantization = quantization
+        self.backend = backend
+        self.share_model = share_model
+        self.model_key = self._get_model_key(model_kwargs, tokenizer_kwargs)
+        self._finalizer: Optional[weakref.finalize] = None
 
-        self.tokenizer: PreTrainedTokenizer = self._init_tokenizer(
-            tokenizer_kwargs
-        )
-        self.model: PreTrainedModel = self._init_model(model_kwargs)
+        self._tokenizer_kwargs = tokenizer_kwargs
+        self._model_kwargs = model_kwargs
+        self._tokenizer: Optional[PreTrainedTokenizer] = None
+        self._model: Optional[PreTrainedModel] = None
+        self._load_lock = threading.Lock()
+        self._warmup_thread: Optional[threading.Thread] = None
+        self._warmup_error: Optional[Exception] = None
+
+        if not lazy:
+            self._ensure_loaded()
 
         logger.info(
             f"Initialized {self.__class__.__name__} with target language '{target_lang}'"
         )
 
+    @property
+    def tokenizer(self) -> PreTrainedTokenizer:
+        """
+        The tokenizer, loaded on first access in lazy mode.
+        """
+        self._ensure_loaded()
+        return self._tokenizer
+
+    @property
+    def model(self) -> PreTrainedModel:
+        """
+        The model, loaded on first access in lazy mode.
+        """
+        self._ensure_loaded()
+        return self._model
+
+    @property
+    def is_loaded(self) -> bool:
+        """
+        Whether the tokenizer and model are loaded.
+        """
+        return self._model is not None
+
+    @property
+    def is_ready(self) -> bool:
+        """
+        Whether the translator can serve requests without a cold start.
+
+        True once the model is loaded and, if `warmup` was called, the warm-up
+        generation has finished successfully. Meant to be polled by health checks.
+        """
+        if not self.is_loaded or self._warmup_error is not None:
+            return False
+        return (
+            self._warmup_thread is None or not self._warmup_thread.is_alive()
+        )
+
+    def _ensure_loaded(self):
+        """
+        Loads the tokenizer and model if they are not loaded yet.
+
+        Safe to call from several threads, the loading only happens once.
+        """
+        if self._model is not None:
+            return
+
+        with self._load_lock:
+            if self._model is not None:
+                return
+
+            if self.share_model:
+                tokenizer, model = shared_model_registry.acquire(
+                    self.model_key,
+                    lambda: self._load_tokenizer_and_model(
+                        self._tokenizer_kwargs, self._model_kwargs
+                    ),
+                )
+                self._finalizer = weakref.finalize(
+                    self, shared_model_registry.release, self.model_key
+                )
+            else:
+                tokenizer, model = self._load_tokenizer_and_model(
+                    self._tokenizer_kwargs, self._model_kwargs
+                )
+
+            self._tokenizer = tokenizer
+            self._model = model
+
+    def _run_warmup(self):
+        """
+        Runs one dummy generation so that the first real request is not a cold one.
+        """
+        self._generate_translations([self.WARMUP_TEXT])
+
+    def _warmup(self):
+        """
+        Loads the model and runs the warm-up generation, recording any error.
+        """
+        try:
+            self._ensure_loaded()
+            self._run_warmup()
+            logger.info(f"{self.__class__.__name__} is warmed up and ready")
+        except Exception as e:
+            self._warmup_error = e
+            logger.exception(f"Warm-up of {self.__class__.__name__} failed")
+
+    def warmup(self, background: bool = True) -> Optional[threading.Thread]:
+        """
+        Loads the model and runs one dummy generation.
+
+        Args:
+            background (bool): Whether to warm up in a background thread. Defaults to True.
+
+        Returns:
+            Optional[threading.Thread]: The warm-up thread, or None if `background` is False.
+
+        Raises:
+            Exception: Any loading or generation error, if `background` is False.
+        """
+        self._warmup_error = None
+
+        if not background:
+            self._ensure_loaded()
+            self._run_warmup()
+            return None
+
+        self._warmup_thread = threading.Thread(
+            target=self._warmup,
+            name=f"{self.__class__.__name__}-warmup",
+            daemon=True,
+        )
+        self._warmup_thread.start()
+        return self._warmup_thread
+
+    def wait_until_ready(self, timeout: Optional[float] = None) -> bool:
+        """
+        Blocks until a running background warm-up has finished.
+
+        Args:
+            timeout (Optional[float]): The maximum number of seconds to wait. Defaults to None (no limit).
+
+        Returns:
+            bool: The value of `is_ready` after waiting.
+        """
+        if self._warmup_thread is not None:
+            self._warmup_thread.join(timeout)
+        return self.is_ready
+
+    def _get_model_key(
+        self,
+        model_kwargs: Optional[dict[str, Any]] = None,
+        tokenizer_kwargs: Optional[dict[str, Any]] = None,
+    ) -> tuple[str, str, str, str, str, str]:
+        """
+        Builds the key under which the model and tokenizer are shared.
+
+        Translators only share a model if they load it with the same arguments,
+        so the key ends with a stable hash of all model and tokenizer arguments
+        and `max_length` (which MBART passes to its tokenizer).
+
+        Args:
+            model_kwargs (Optional[dict[str, Any]]): Additional arguments for the model.
+            tokenizer_kwargs (Optional[dict[str, Any]]): Additional arguments for the tokenizer.
+
+        Returns:
+            tuple[str, str, str, str, str, str]: The model name, dtype, device, quantization,
+                backend and the hash of the loading arguments.
+        """
+        model_kwargs = model_kwargs or {}
+        dtype = model_kwargs.get("torch_dtype", model_kwargs.get("dtype"))
+        loading_arguments = json.dumps(
+            {
+                "model_kwargs": model_kwargs,
+                "tokenizer_kwargs": tokenizer_kwargs or {},
+                "max_length": self.max_length,
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return (
+            str(self.MODEL_NAME),
+            str(dtype) if dtype is not None else "default",
+            str(torch.device(self.device)),
+            self.quantization or "none",
+            self.backend,
+            hashlib.sha256(loading_arguments.encode("utf-8")).hexdigest()[:16],
+        )
+
+    def _load_tokenizer_and_model(
+        self,
+        tokenizer_kwargs: Optional[dict[str, Any]] = None,
+        model_kwargs: Optional[dict[str, Any]] = None,
+    ) -> tuple[PreTrainedTokenizer, PreTrainedModel]:
+        """
+        Loads the tokenizer and the model and moves the model to the configured device.
+
+        Args:
+            tokenizer_kwargs (Optional[dict[str, Any]]): Additional arguments for the tokenizer.
+            model_kwargs (Optional[dict[str, Any]]): Additional arguments for the model.
+
+        Returns:
+            tuple[PreTrainedTokenizer, PreTrainedModel]: The loaded tokenizer and model.
+        """
+        tokenizer = self._init_tokenizer(tokenizer_kwargs)
+        model = self._init_model(model_kwargs)
+        model.to(self.device)
+
+        if self.quantization == "int8":
+            # In place, so the fp32 model is not copied and peak memory stays at one model.
+            model = torch.ao.quantization.quantize_dynamic(
+                model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True
+            )
+            logger.info(
+                f"Applied dynamic int8 quantization to the linear layers of {self.MODEL_NAME}"
+            )
+
+        return tokenizer, model
+
+    def _get_onnx_export_dir(self) -> Path:
+        """
+        Returns the directory in which the ONNX export of `MODEL_NAME` is cached.
+
+        Returns:
+            Path: The cache directory for this model.
+        """
+        return ONNX_CACHE_DIR / str(self.MODEL_NAME).replace("/", "--")
+
+    def _init_onnx_model(self, model_kwargs: Optional[dict[str, Any]] = None):
+        """
+        Loads the model with ONNX Runtime, exporting it to ONNX on first use.
+
+        The encoder and the decoder (with past key values) are exported once and cached
+        on disk under `ONNX_CACHE_DIR`, later loads reuse the cached graphs. The export
+        is written to a temporary directory and moved into place with `os.replace`, so
+        concurrent exports from several processes never leave a half-written cache.
+
+        Args:
+            model_kwargs (Optional[dict[str, Any]]): Additional arguments for the ONNX Runtime model.
+
+        Returns:
+            ORTModelForSeq2SeqLM: The ONNX Runtime model running on the CPU execution provider.
+
+        Raises:
+            ImportError: If the optional ONNX dependencies are not installed.
+        """
+        try:
+            from optimum.onnxruntime import ORTModelForSeq2SeqLM
+        except ImportError as e:
+            raise ImportError(
+                "The 'onnx' backend requires optimum with ONNX Runtime. "
+                "Install it with `pip install easy-nlp-translate[onnx]`."
+            ) from e
+
+        if model_kwargs is None:
+            model_kwargs = {}
+
+        export_dir = self._get_onnx_export_dir()
+        if (export_dir / "config.json").exists():
+            logger.info(f"Loading cached ONNX export from {export_dir}")
+            return ORTModelForSeq2SeqLM.from_pretrained(
+                export_dir,
+                use_cache=True,
+                provider="CPUExecutionProvider",
+                **model_kwargs,
+            )
+
+        logger.info(
+            f"Exporting {self.MODEL_NAME} to ONNX, this only happens once"
+        )
+        model = ORTModelForSeq2SeqLM.from_pretrained(
+            self.MODEL_NAME,
+            export=True,
+            use_cache=True,
+            provider="CPUExecutionProvider",
+            **model_kwargs,
+        )
+        export_dir.parent.mkdir(parents=True, exist_ok=True)
+        tmp_dir = Path(
+            tempfile.mkdtemp(
+                prefix=f".{export_dir.name}-", dir=export_dir.parent
+            )
+        )
+        try:
+            model.save_pretrained(tmp_dir)
+            if (
+                export_dir.exists()
+                and not (export_dir / "config.json").exists()
+            ):
+                # Left over from an interrupted export of an older version.
+                shutil.rmtree(export_dir, ignore_errors=True)
+            try:
+                os.replace(tmp_dir, export_dir)
+                logger.info(f"Saved ONNX export to {export_dir}")
+            except OSError:
+                logger.info(
+                    f"ONNX export of {self.MODEL_NAME} was saved by another process"
+                )
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+        return model
+
+    def _get_cache_params(self) -> dict:
+        """
+        Returns the model and generation settings that influence the translation output.
+
+        Returns:
+            dict: A JSON-serializable mapping of setting names to values.
+        """
+        return {
+            "model_name": str(self.MODEL_NAME),
+            "max_length": self.max_length,
+            "num_beams": self.num_beams,
+            "quantization": self.quantization,
+            "backend": self.backend,
+        }
+
+    def close(self):
+        """
+        Releases this instance's reference to the shared model and tokenizer.
+
+        The shared objects are dropped from the registry once the last instance using
+        them is closed or garbage collected. Calling `close` more than once has no effect.
+        """
+        with self._load_lock:
+            if self._finalizer is not None:
+                self._finalizer()
+            self._tokenizer = None
+            self._model = None
+
+    def _validate_quantization(
+        self,
+        quantization: Optional[str],
+        device: Optional[Union[str, torch.device]],
+    ):
+        """
+        Validates the quantization mode.
+        Args:
+            quantization (Optional[str]): The requested quantization mode.
+            device (Optional[Union[str, torch.device]]): The device the model will run on.
+        Raises:
+            ValueError: If the quantization mode is unknown or not supported on the device.
+        """
+        if quantization is None:
+            return
+        if quantization not in self.SUPPORTED_QUANTIZATIONS:
+            raise ValueError(
+                f"Quantization '{quantization}' is not supported. Supported modes are: {list(self.SUPPORTED_QUANTIZATIONS)}"
+            )
+        if torch.device(device).type != "cpu":
+            raise ValueError(
+                f"Quantization '{quantization}' is only supported on CPU."
+            )
+
+    def _validate_backend(
+        self,
+        backend: str,
+        device: Optional[Union[str, torch.device]],
+        quantization: Optional[str],
+    ):
+        """
+        Validates the inference backend.
+        Args:
+            backend (str): The requested backend.
+            device (Optional[Union[str, torch.device]]): The device the model will run on.
+            quantization (Optional[str]): The requested quantization mode.
+        Raises:
+            ValueError: If the backend is unknown or cannot be combined with the device or quantization.
+        """
+        if backend not in self.SUPPORTED_BACKENDS:
+            raise ValueError(
+                f"Backend '{backend}' is not supported. Supported backends are: {list(self.SUPPORTED_BACKENDS)}"
+            )
+        if backend == "onnx":
+            if torch.device(device).type != "cpu":
+                raise ValueError("The 'onnx' backend only supports CPU.")
+            if quantization is not None:
+                raise ValueError(
+                    "Quantization is not supported with the 'onnx' backend."
+                )
+
     def _validate_generation_parameters(
         self, max_length: Optional[int], num_beams: Optional[int]
     ):
@@ -105,3 +513,268 @@ class HuggingFaceTranslator(TranslatorBase):
         raise NotImplementedError(
             "This method should be implemented in subclasses."
         )
+
+    def _generate_translations(
+        self, texts: list[str], **generate_kwargs: Any
+    ) -> list[str]:
+        """
+        Translate a list of texts with a single batched `generate` call.
+
+        Args:
+            texts (list[str]): The texts to translate.
+            **generate_kwargs: Subclass-specific options, e.g. the source language of the texts.
+
+        Returns:
+            list[str]: The translated texts, in the same order as the input.
+        """
+        raise NotImplementedError(
+            "This method should be implemented in subclasses."
+        )
+
+    @staticmethod
+    def _validate_batch_parameters(
+        batch_size: Optional[int], max_batch_tokens: Optional[int]
+    ):
+        """
+        Validates the batching parameters.
+        Args:
+            batch_size (Optional[int]): The maximum number of texts per batch.
+            max_batch_tokens (Optional[int]): The maximum number of padded tokens per batch.
+        Raises:
+            ValueError: If batch_size or max_batch_tokens is not a positive integer.
+        """
+        if batch_size is not None and (
+            not isinstance(batch_size, int) or batch_size <= 0
+        ):
+            raise ValueError("batch_size must be a positive integer.")
+        if max_batch_tokens is not None and (
+            not isinstance(max_batch_tokens, int) or max_batch_tokens <= 0
+        ):
+            raise ValueError("max_batch_tokens must be a positive integer.")
+
+    def _token_lengths(self, texts: list[str]) -> list[int]:
+        """
+        Computes the tokenized length of each text, capped at `max_length`.
+
+        Args:
+            texts (list[str]): The texts to measure.
+
+        Returns:
+            list[int]: The number of tokens for each text.
+        """
+        encodings = self.tokenizer(
+            texts, truncation=True, max_length=self.max_length
+        )
+        return [len(input_ids) for input_ids in encodings["input_ids"]]
+
+    @staticmethod
+    def _build_batches(
+        lengths: list[int],
+        batch_size: Optional[int] = None,
+        max_batch_tokens: Optional[int] = None,
+    ) -> list[list[int]]:
+        """
+        Groups text indices into batches.
+
+        Without a token budget the indices are chunked in input order. With a
+        token budget, the indices are sorted by tokenized length and greedily packed
+        so that the padded size of a batch (longest text times number of texts)
+        stays within `max_batch_tokens`. A single text longer than the budget
+        gets a batch of its own.
+
+        Args:
+            lengths (list[int]): The tokenized length of each text.
+            batch_size (Optional[int]): The maximum number of texts per batch. None means no limit.
+            max_batch_tokens (Optional[int]): The maximum number of padded tokens per batch.
+
+        Returns:
+            list[list[int]]: The batches as lists of indices into `lengths`.
+        """
+        if max_batch_tokens is None:
+            indices = list(range(len(lengths)))
+            step = batch_size or len(indices) or 1
+            return [
+                indices[start : start + step]
+                for start in range(0, len(indices), step)
+            ]
+
+        batches: list[list[int]] = []
+        current: list[int] = []
+        current_max = 0
+        for index in sorted(range(len(lengths)), key=lambda i: lengths[i]):
+            longest = max(current_max, lengths[index])
+            if current and (
+                longest * (len(current) + 1) > max_batch_tokens
+                or (batch_size is not None and len(current) >= batch_size)
+            ):
+                batches.append(current)
+                current, longest = [], lengths[index]
+            current.append(index)
+            current_max = longest
+
+        if current:
+            batches.append(current)
+
+        return batches
+
+    def _translate_in_batches(
+        self,
+        texts: list[str],
+        batch_size: Optional[int] = 8,
+        max_batch_tokens: Optional[int] = None,
+        **generate_kwargs: Any,
+    ) -> list[str]:
+        """
+        Runs the texts through `_generate_translations` batch by batch and
+        restores the original order.
+
+        Args:
+            texts (list[str]): The validated texts to translate.
+            batch_size (Optional[int]): The maximum number of texts per batch.
+            max_batch_tokens (Optional[int]): The maximum number of padded tokens per batch.
+            **generate_kwargs: Passed on to `_generate_translations`.
+
+        Returns:
+            list[str]: The translated texts, in the same order as the input.
+        """
+        lengths = (
+            self._token_lengths(texts)
+            if max_batch_tokens is not None
+            else [0] * len(texts)
+        )
+        batches = self._build_batches(lengths, batch_size, max_batch_tokens)
+
+        translations: list[Optional[str]] = [None] * len(texts)
+        for number, batch in enumerate(batches, start=1):
+            logger.info(
+                f"Translating batch {number}/{len(batches)} with {len(batch)} texts"
+            )
+            outputs = self._generate_translations(
+                [texts[i] for i in batch], **generate_kwargs
+            )
+            for index, output in zip(batch, outputs):
+                translations[index] = output
+
+        return translations
+
+    def translate_batch(
+        self,
+        texts: list,
+        batch_size: Optional[int] = 8,
+        max_batch_tokens: Optional[int] = None,
+    ) -> list:
+        """
+        Translate a batch of texts using padded, batched generation.
+
+        By default the texts are split into chunks of `batch_size`. If
+        `max_batch_tokens` is given, texts are bucketed by tokenized length instead,
+        so short and long texts are not padded to the same length.
+
+        Args:
+            texts (list): A list of texts to be translated.
+            batch_size (Optional[int]): The maximum number of texts per `generate` call.
+                Defaults to 8. None means no limit when `max_batch_tokens` is set.
+            max_batch_tokens (Optional[int]): The maximum number of padded tokens per
+                `generate` call. Defaults to None.
+
+        Returns:
+            list: A list of translated texts, in the same order as the input.
+
+        Raises:
+            ValueError: If the batching parameters are not positive integers or any text is invalid.
+        """
+        self._validate_batch_parameters(batch_size, max_batch_tokens)
+
+        for text in texts:
+            self._validate_basic_text_to_translate(text)
+
+        with measure(self, "translate_batch", items=len(texts)):
+            return self._translate_in_batches(
+                texts, batch_size, max_batch_tokens
+            )
+
+    def _count_tokens(self, texts: list[str]) -> list[int]:
+        """
+        Counts the tokens of each text without special tokens and without truncation.
+
+        Args:
+            texts (list[str]): The texts to measure.
+
+        Returns:
+            list[int]: The number of tokens for each text.
+        """
+        encodings = self.tokenizer(texts, add_special_tokens=False)
+        return [len(input_ids) for input_ids in encodings["input_ids"]]
+
+    def _document_generate_kwargs(self, text: str) -> dict[str, Any]:
+        """
+        Returns the keyword arguments for `_generate_translations` that apply to
+        all chunks of a document, e.g. a detected source language.
+
+        Args:
+            text (str): The whole document.
+
+        Returns:
+            dict[str, Any]: The keyword arguments. Empty by default.
+        """
+        return {}
+
+    def translate_document(
+        self,
+        text: str,
+        max_chunk_tokens: Optional[int] = None,
+        batch_size: Optional[int] = 8,
+        max_batch_tokens: Optional[int] = None,
+    ) -> str:
+        """
+        Translate a text of any length.
+
+        `translate` truncates its input at `max_length` tokens. This method instead
+        splits the text at line breaks and sentence boundaries into chunks that fit
+        the token budget, translates all chunks as one batched job and reassembles
+        them with the original whitespace and line breaks.
+
+        Args:
+            text (str): The text to be translated.
+            max_chunk_tokens (Optional[int]): The maximum number of tokens per chunk.
+                Defaults to `max_length` (or the tokenizer's `model_max_length` if
+                `max_length` is None) minus the special tokens added by the tokenizer.
+            batch_size (Optional[int]): The maximum number of chunks per `generate` call. Defaults to 8.
+            max_batch_tokens (Optional[int]): The maximum number of padded tokens per
+                `generate` call. Defaults to None.
+
+        Returns:
+            str: The translated text.
+
+        Raises:
+            ValueError: If the text is invalid or the chunking or batching parameters
+                are not positive integers.
+        """
+        self._validate_basic_text_to_translate(text)
+        self._validate_batch_parameters(batch_size, max_batch_tokens)
+
+        if max_chunk_tokens is None:
+            max_length = self.max_length or self.tokenizer.model_max_length
+            max_chunk_tokens = (
+                max_length - self.tokenizer.num_special_tokens_to_add()
+            )
+        if not isinstance(max_chunk_tokens, int) or max_chunk_tokens <= 0:
+            raise ValueError("max_chunk_tokens must be a positive integer.")
+
+        with measure(self, "translate_document") as metrics:
+            with stage("chunk"):
+                chunked = ChunkedText.split(
+                    text, max_chunk_tokens, self._count_tokens
+                )
+            metrics.items = len(chunked)
+            logger.info(
+                f"Translating document in {len(chunked)} chunks of at most {max_chunk_tokens} tokens"
+            )
+
+            translations = self._translate_in_batches(
+                chunked.chunks,
+                batch_size,
+                max_batch_tokens,
+                **self._document_generate_kwargs(text),
+            )
+            return chunked.join(translations)
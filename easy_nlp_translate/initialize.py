@@ -1,27 +1,47 @@
+import importlib
 import logging
-from typing import Any, Optional, overload, Literal
+from typing import TYPE_CHECKING, Any, Optional, Union, overload, Literal
 
 from .translator_base import TranslatorBase
-from .huggingface_models import MBARTTranslator
-from .llm_translator_base import LLMTranslator
-from .llm_provider import (
-    GeminiTranslator,
-    GPTTranslator,
-    ClaudeTranslator,
-    OllamaTranslator,
-)
+
+if TYPE_CHECKING:
+    from .huggingface_models import MBARTTranslator
+    from .llm_translator_base import LLMTranslator
+    from .router import RouterTranslator
 
 logger = logging.getLogger(__name__)
 
-TRANSLATOR_REGISTRY: dict[str, type[TranslatorBase]] = {
-    "mbart": MBARTTranslator,
-    "gemini": GeminiTranslator,
-    "gpt": GPTTranslator,
-    "claude": ClaudeTranslator,
-    "ollama": OllamaTranslator,
+# Entries are import paths so that torch, transformers and the provider SDKs
+# are only imported once a translator is actually initialized.
+TRANSLATOR_REGISTRY: dict[str, Union[str, type[TranslatorBase]]] = {
+    "mbart": "easy_nlp_translate.huggingface_models.mbart.MBARTTranslator",
+    "gemini": "easy_nlp_translate.llm_provider.gemini.GeminiTranslator",
+    "gpt": "easy_nlp_translate.llm_provider.openai.GPTTranslator",
+    "claude": "easy_nlp_translate.llm_provider.anthropic.ClaudeTranslator",
+    "ollama": "easy_nlp_translate.llm_provider.ollama.OllamaTranslator",
+    "router": "easy_nlp_translate.router.RouterTranslator",
 }
 
 
+def _resolve_translator_class(translator_name: str) -> type[TranslatorBase]:
+    """
+    Returns the translator class registered under the given name, importing it on first use.
+
+    Args:
+        translator_name (str): The name of the translator in `TRANSLATOR_REGISTRY`.
+
+    Returns:
+        type[TranslatorBase]: The translator class.
+    """
+    entry = TRANSLATOR_REGISTRY[translator_name]
+    if isinstance(entry, str):
+        module_path, class_name = entry.rsplit(".", 1)
+        logger.debug(f"Importing translator '{translator_name}' from {entry}")
+        entry = getattr(importlib.import_module(module_path), class_name)
+        TRANSLATOR_REGISTRY[translator_name] = entry
+    return entry
+
+
 @overload
 def initialize_translator(
     translator_name: Literal["mbart"],
@@ -32,7 +52,11 @@ def initialize_translator(
     num_beams: Optional[int] = 4,
     tokenizer_kwargs: Optional[dict[str, Any]] = None,
     model_kwargs: Optional[dict[str, Any]] = None,
-) -> MBARTTranslator: ...
+    share_model: bool = True,
+    quantization: Optional[Literal["int8"]] = None,
+    backend: Literal["torch", "onnx"] = "torch",
+    lazy: bool = False,
+) -> "MBARTTranslator": ...
 
 
 @overload
@@ -45,7 +69,20 @@ def initialize_translator(
     costum_prompt: Optional[str] = None,
     temperature: float = 0.7,
     max_tokens: int = 1000,
-) -> LLMTranslator: ...
+) -> "LLMTranslator": ...
+
+
+@overload
+def initialize_translator(
+    translator_name: Literal["router"],
+    translators: list[TranslatorBase],
+    hedge_after: Optional[float] = 2.0,
+    timeout: Optional[float] = None,
+    reorder: bool = True,
+    latency_quantile: float = 0.95,
+    min_samples: int = 5,
+    max_workers: int = 32,
+) -> "RouterTranslator": ...
 
 
 def initialize_translator(
@@ -69,6 +106,6 @@ def initialize_translator(
             f"Unknown translator name: {translator_name}. Available: {list(TRANSLATOR_REGISTRY.keys())}"
         )
 
-    translator_class = TRANSLATOR_REGISTRY[translator_name]
+    translator_class = _resolve_translator_class(translator_name)
 
     return translator_class(*args, **kwargs)
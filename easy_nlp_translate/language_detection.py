@@ -0,0 +1,405 @@
+import hashlib
+import logging
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Optional
+
+from .config import available_language_codes
+
+logger = logging.getLogger(__name__)
+
+
+class LanguageDetector(ABC):
+    """
+    Abstract base class for language detection backends.
+
+    Backends return generic language codes as used in `available_language_codes`
+    (e.g. 'en', 'zh-cn'). Codes that differ in the backend are translated through
+    `CODE_MAPPER`.
+    """
+
+    CODE_MAPPER: dict[str, str] = {}
+
+    @property
+    def cache_id(self) -> str:
+        """
+        Identifies the backend and its settings in `DetectionCache` keys, so
+        detectors that may disagree never share cached results.
+        """
+        return type(self).__qualname__
+
+    def _normalize_code(self, code: str) -> str:
+        """
+        Maps a backend-specific language code onto the generic language codes.
+
+        Args:
+            code (str): The code returned by the backend.
+
+        Returns:
+            str: The generic language code.
+        """
+        code = code.lower()
+        return self.CODE_MAPPER.get(code, code)
+
+    @abstractmethod
+    def detect(self, text: str) -> str:
+        """
+        Detects the language of a single text.
+
+        Args:
+            text (str): The text to detect.
+
+        Returns:
+            str: The generic language code.
+
+        Raises:
+            Exception: If the backend cannot detect a language.
+        """
+        raise NotImplementedError(
+            "This method should be implemented in subclasses."
+        )
+
+    def detect_batch(self, texts: list[str]) -> list[str]:
+        """
+        Detects the languages of many texts. Backends with a vectorized
+        implementation override this method.
+
+        Args:
+            texts (list[str]): The texts to detect.
+
+        Returns:
+            list[str]: The generic language codes, in the same order as the input.
+
+        Raises:
+            Exception: If the backend cannot detect the language of a text.
+        """
+        return [self.detect(text) for text in texts]
+
+
+class LangdetectDetector(LanguageDetector):
+    """
+    The default detector, based on `langdetect`.
+
+    Unlike `langdetect.detect`, it uses its own seeded factory, so results are
+    deterministic. The n-gram profiles are loaded once, on first use, and then
+    reused for every text. Traditional Chinese is detected as 'zh-tw', which is
+    not a supported language code.
+    """
+
+    def __init__(self, seed: Optional[int] = 0):
+        """
+        Initializes the detector.
+
+        Args:
+            seed (Optional[int]): The seed for langdetect's random sampling.
+                None makes detection non-deterministic. Defaults to 0.
+        """
+        self.seed = seed
+        self._factory = None
+        self._factory_lock = threading.Lock()
+
+    @property
+    def cache_id(self) -> str:
+        return f"{type(self).__qualname__}(seed={self.seed})"
+
+    def _get_factory(self):
+        """
+        Loads the langdetect profiles on first use.
+
+        Returns:
+            langdetect.detector_factory.DetectorFactory: The loaded factory.
+        """
+        if self._factory is None:
+            with self._factory_lock:
+                if self._factory is None:
+                    from langdetect.detector_factory import (
+                        PROFILES_DIRECTORY,
+                        DetectorFactory,
+                    )
+
+                    factory = DetectorFactory()
+                    factory.load_profile(PROFILES_DIRECTORY)
+                    factory.seed = self.seed
+                    self._factory = factory
+        return self._factory
+
+    def detect(self, text: str) -> str:
+        """
+        Detects the language of a single text.
+
+        Args:
+            text (str): The text to detect.
+
+        Returns:
+            str: The generic language code.
+
+        Raises:
+            LangDetectException: If langdetect finds no features in the text.
+        """
+        detector = self._get_factory().create()
+        detector.append(text)
+        return self._normalize_code(detector.detect())
+
+    def detect_batch(self, texts: list[str]) -> list[str]:
+        """
+        Detects the languages of many texts with one loaded factory.
+
+        langdetect has no vectorized scoring, so the texts are still scored one
+        after another. Only the profile lookup is shared; use `LinguaDetector`
+        for parallel batch scoring.
+
+        Args:
+            texts (list[str]): The texts to detect.
+
+        Returns:
+            list[str]: The generic language codes, in the same order as the input.
+
+        Raises:
+            LangDetectException: If langdetect finds no features in a text.
+        """
+        factory = self._get_factory()
+        langs = []
+        for text in texts:
+            detector = factory.create()
+            detector.append(text)
+            langs.append(self._normalize_code(detector.detect()))
+        return langs
+
+
+class LinguaDetector(LanguageDetector):
+    """
+    A detector based on `lingua-language-detector`.
+
+    It is deterministic, restricted to the supported languages (which makes it
+    faster and more accurate) and scores batches in parallel with
+    `detect_languages_in_parallel_of`. Requires the optional `lingua` extra.
+    """
+
+    CODE_MAPPER: dict[str, str] = {"zh": "zh-cn"}
+
+    def __init__(self, language_codes: Optional[list[str]] = None):
+        """
+        Builds the lingua detector.
+
+        Args:
+            language_codes (Optional[list[str]]): The generic codes to consider.
+                Codes lingua does not know are skipped. Defaults to `available_language_codes`.
+
+        Raises:
+            ImportError: If lingua is not installed.
+        """
+        try:
+            from lingua import IsoCode639_1, Language, LanguageDetectorBuilder
+        except ImportError as e:
+            raise ImportError(
+                "LinguaDetector requires lingua. Install it with `pip install easy-nlp-translate[lingua]`."
+            ) from e
+
+        known = {
+            language.iso_code_639_1.name.lower() for language in Language.all()
+        }
+        iso_codes = sorted(
+            {
+                code.split("-")[0]
+                for code in (language_codes or available_language_codes)
+                if code.split("-")[0] in known
+            }
+        )
+        self.iso_codes = iso_codes
+        self._detector = (
+            LanguageDetectorBuilder.from_iso_codes_639_1(
+                *(getattr(IsoCode639_1, code.upper()) for code in iso_codes)
+            )
+            .with_preloaded_language_models()
+            .build()
+        )
+
+    @property
+    def cache_id(self) -> str:
+        return f"{type(self).__qualname__}({','.join(self.iso_codes)})"
+
+    def _to_code(self, language) -> str:
+        if language is None:
+            raise ValueError("No language could be detected.")
+        return self._normalize_code(language.iso_code_639_1.name)
+
+    def detect(self, text: str) -> str:
+        """
+        Detects the language of a single text.
+
+        Args:
+            text (str): The text to detect.
+
+        Returns:
+            str: The generic language code.
+
+        Raises:
+            ValueError: If lingua cannot detect a language.
+        """
+        return self._to_code(self._detector.detect_language_of(text))
+
+    def detect_batch(self, texts: list[str]) -> list[str]:
+        """
+        Detects the languages of many texts in parallel.
+
+        Args:
+            texts (list[str]): The texts to detect.
+
+        Returns:
+            list[str]: The generic language codes, in the same order as the input.
+
+        Raises:
+            ValueError: If lingua cannot detect the language of a text.
+        """
+        return [
+            self._to_code(language)
+            for language in self._detector.detect_languages_in_parallel_of(
+                texts
+            )
+        ]
+
+
+class DetectionCache:
+    """
+    A thread-safe, bounded LRU cache for language detection results.
+
+    Entries are keyed by a 128-bit BLAKE2 hash of the detector's `cache_id` and
+    the text, so long inputs do not stay in memory and different detectors sharing
+    the cache do not see each other's results.
+    """
+
+    def __init__(self, maxsize: int = 4096, enabled: bool = True):
+        """
+        Initializes the cache.
+
+        Args:
+            maxsize (int): The maximum number of cached detections. Defaults to 4096.
+            enabled (bool): Whether lookups and stores are active. Defaults to True.
+
+        Raises:
+            ValueError: If maxsize is not a positive integer.
+        """
+        self._validate_maxsize(maxsize)
+        self.maxsize = maxsize
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[bytes, str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _validate_maxsize(maxsize: int):
+        """
+        Validates the cache size.
+        Args:
+            maxsize (int): The maximum number of cached detections.
+        Raises:
+            ValueError: If maxsize is not a positive integer.
+        """
+        if not isinstance(maxsize, int) or maxsize <= 0:
+            raise ValueError("maxsize must be a positive integer.")
+
+    @staticmethod
+    def _key(text: str, detector_id: str) -> bytes:
+        return hashlib.blake2b(
+            f"{detector_id}\0{text}".encode("utf-8"), digest_size=16
+        ).digest()
+
+    def get(self, text: str, detector_id: str = "") -> Optional[str]:
+        """
+        Returns the cached language of a text.
+
+        Args:
+            text (str): The text to look up.
+            detector_id (str): The `cache_id` of the detector. Defaults to "".
+
+        Returns:
+            Optional[str]: The cached language code, or None on a miss or if the cache is disabled.
+        """
+        if not self.enabled:
+            return None
+
+        key = self._key(text, detector_id)
+        with self._lock:
+            lang = self._entries.get(key)
+            if lang is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return lang
+
+    def put(self, text: str, lang: str, detector_id: str = ""):
+        """
+        Stores the detected language of a text, evicting the least recently used entry if full.
+
+        Args:
+            text (str): The text that was detected.
+            lang (str): The detected language code.
+            detector_id (str): The `cache_id` of the detector. Defaults to "".
+        """
+        if not self.enabled:
+            return
+
+        key = self._key(text, detector_id)
+        with self._lock:
+            self._entries[key] = lang
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def configure(
+        self, maxsize: Optional[int] = None, enabled: Optional[bool] = None
+    ):
+        """
+        Changes the cache size or turns the cache on or off.
+
+        Args:
+            maxsize (Optional[int]): The new maximum size. Entries beyond it are evicted.
+            enabled (Optional[bool]): Whether the cache is active. Disabling it clears it.
+        """
+        with self._lock:
+            if maxsize is not None:
+                self._validate_maxsize(maxsize)
+                self.maxsize = maxsize
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+            if enabled is not None:
+                self.enabled = enabled
+                if not enabled:
+                    self._entries.clear()
+
+    def clear(self):
+        """
+        Removes all entries and resets the counters.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    @property
+    def stats(self) -> dict[str, float]:
+        """
+        The hit and miss counters.
+
+        Returns:
+            dict[str, float]: hits, misses, hit_rate, the current size and maxsize.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "size": len(self),
+            "maxsize": self.maxsize,
+        }
+
+
+detection_cache = DetectionCache()
+default_language_detector = LangdetectDetector()
@@ -1,7 +1,20 @@
-from .gemini import GeminiTranslator
-from .openai import GPTTranslator
-from .anthropic import ClaudeTranslator
-from .ollama import OllamaTranslator
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .gemini import GeminiTranslator
+    from .openai import GPTTranslator
+    from .anthropic import ClaudeTranslator
+    from .ollama import OllamaTranslator
+
+# Translators are imported on first access so that only the SDK
+# of the provider actually in use gets imported.
+_LAZY_IMPORTS = {
+    "GeminiTranslator": ".gemini",
+    "GPTTranslator": ".openai",
+    "ClaudeTranslator": ".anthropic",
+    "OllamaTranslator": ".ollama",
+}
 
 __all__ = [
     "GeminiTranslator",
@@ -9,3 +22,10 @@ __all__ = [
     "ClaudeTranslator",
     "OllamaTranslator",
 ]
+
+
+def __getattr__(name: str):
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
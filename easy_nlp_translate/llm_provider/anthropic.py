@@ -1,11 +1,15 @@
 import logging
 import os
-from typing import Iterable, Optional
+from typing import Any, Iterable, Iterator, Optional
 import anthropic
 from anthropic.types import Message
 from dotenv import load_dotenv
 
 from ..llm_translator_base import LLMTranslator
+from ..metrics import record_usage
+from ..prompt_config import RenderedPrompt
+from ..batch_jobs import BATCH_COMPLETED, BATCH_IN_PROGRESS
+from ..client_pool import shared_client_pool
 from ..config import available_models_claude
 
 logger = logging.getLogger(__name__)
@@ -15,6 +19,10 @@ load_dotenv()
 
 class ClaudeTranslator(LLMTranslator):
     AVAILABLE_MODELS: list[str] = available_models_claude
+    CHARS_PER_TOKEN: float = 3.5
+    PROVIDER_NAME: str = "anthropic"
+    # Anthropic does not cache prompt prefixes below this length (2048 for Haiku models).
+    PROMPT_CACHE_MIN_TOKENS: int = 1024
 
     """
     A class for LLM-based translations using Anthropic's Claude models,
@@ -73,14 +81,132 @@ class ClaudeTranslator(LLMTranslator):
 
     def _init_model(self):
         """
-        Initializes the Anthropic Claude client using the API key stored in self.credentials.
+        Returns the shared Anthropic Claude client for the API key stored in self.credentials
+        from the client pool, creating it on first use.
         Assumes self.credentials is already populated by the base class calling _get_credentials.
 
         Returns:
-            anthropic.Anthropic: The initialized Anthropic client.
+            anthropic.Anthropic: The shared Anthropic client.
         """
-        client = anthropic.Anthropic(api_key=self.credentials)
-        return client
+        key = shared_client_pool.make_key(
+            self.PROVIDER_NAME,
+            self.credentials,
+            os.environ.get("ANTHROPIC_BASE_URL"),
+        )
+        # Retries are handled by `_call_with_retries`, together with the rate limiter.
+        return shared_client_pool.get(
+            key,
+            lambda limits: anthropic.Anthropic(
+                api_key=self.credentials,
+                max_retries=0,
+                http_client=anthropic.DefaultHttpxClient(limits=limits),
+            ),
+        )
+
+    def _init_async_model(self):
+        """
+        Initializes the async Anthropic Claude client using the API key stored in self.credentials.
+
+        Returns:
+            anthropic.AsyncAnthropic: The initialized async Anthropic client.
+        """
+        return anthropic.AsyncAnthropic(
+            api_key=self.credentials, max_retries=0
+        )
+
+    def _request_kwargs(self, input: str) -> dict:
+        """
+        Builds the Messages API request for the given prompt.
+
+        The prompt is sent as the user message. If the static part of a
+        `RenderedPrompt` (rules and language pair) is long enough to be cached
+        (see `_prompt_cache_min_tokens`), it is sent as a first content block marked
+        for prompt caching, followed by the text in `<text_to_translate>` tags.
+        The static parts of all built-in prompt styles are far below the minimum,
+        so for them no cache marker is sent and caching is a no-op. Only long
+        custom prompts (e.g. with glossaries or examples) are cached.
+
+        Args:
+            input (str): The fully formatted input prompt to be sent to the model.
+
+        Returns:
+            dict: The keyword arguments for `messages.create`.
+        """
+        content = input
+        if (
+            isinstance(input, RenderedPrompt)
+            and len(input.static) / self.CHARS_PER_TOKEN
+            >= self._prompt_cache_min_tokens()
+        ):
+            content = [
+                {
+                    "type": "text",
+                    "text": input.static,
+                    "cache_control": {"type": "ephemeral"},
+                },
+                {
+                    "type": "text",
+                    "text": f"<text_to_translate>\n{input.text}\n</text_to_translate>",
+                },
+            ]
+        return {
+            "model": self.model_name,
+            "temperature": self.temperature,
+            "max_tokens": self.max_tokens,
+            "messages": [{"role": "user", "content": content}],
+        }
+
+    def _prompt_cache_min_tokens(self) -> int:
+        """
+        Returns the minimum prompt prefix length Anthropic caches for the model.
+
+        Returns:
+            int: The minimum number of tokens.
+        """
+        if "haiku" in self.model_name:
+            return 2 * self.PROMPT_CACHE_MIN_TOKENS
+        return self.PROMPT_CACHE_MIN_TOKENS
+
+    def _response_usage(self, raw_response: Any) -> dict[str, Optional[int]]:
+        """
+        Extracts the token usage of a response, including prompt cache reads and writes.
+
+        Args:
+            raw_response (anthropic.types.Message): The raw Message object from the Claude model.
+
+        Returns:
+            dict[str, Optional[int]]: The input, output, cache read and cache write tokens.
+        """
+        usage = getattr(raw_response, "usage", None)
+        if usage is None:
+            return {}
+        return {
+            "input_tokens": usage.input_tokens,
+            "output_tokens": usage.output_tokens,
+            "cache_read_tokens": getattr(
+                usage, "cache_read_input_tokens", None
+            ),
+            "cache_write_tokens": getattr(
+                usage, "cache_creation_input_tokens", None
+            ),
+        }
+
+    def _report_usage(self, response: Message):
+        """
+        Logs the token usage of a response at DEBUG level, including prompt cache reads and writes.
+
+        Args:
+            response (anthropic.types.Message): The raw Message object from the Claude model.
+        """
+        usage = self._response_usage(response)
+        if not usage:
+            return
+        logger.debug(
+            f"Claude '{self.model_name}' usage - input: {usage['input_tokens']}, "
+            f"cache read: {usage['cache_read_tokens'] or 0}, "
+            f"cache write: {usage['cache_write_tokens'] or 0}, "
+            f"output: {usage['output_tokens']}"
+        )
 
     def _generate(self, input: str) -> Iterable[Message]:
         """
@@ -94,11 +220,11 @@ class ClaudeTranslator(LLMTranslator):
             anthropic.types.Message: The raw Message object from the Claude model.
         """
         try:
-            response = self.model.messages.create(
-                model=self.model_name,
-                temperature=self.temperature,
-                max_tokens=self.max_tokens,
-                messages=[{"role": "user", "content": input}],
+            response = self._call_with_retries(
+                lambda: self.model.messages.create(
+                    **self._request_kwargs(input)
+                ),
+                input,
             )
         except Exception as e:
             raise RuntimeError(
@@ -106,6 +232,124 @@ class ClaudeTranslator(LLMTranslator):
             )
         return response
 
+    async def _agenerate(self, input: str) -> Iterable[Message]:
+        """
+        Asynchronously generates a translation using the async Claude client.
+
+        Args:
+            input (str): The fully formatted input prompt to be sent to the model.
+
+        Returns:
+            anthropic.types.Message: The raw Message object from the Claude model.
+        """
+        try:
+            response = await self._acall_with_retries(
+                lambda: self.async_model.messages.create(
+                    **self._request_kwargs(input)
+                ),
+                input,
+            )
+        except Exception as e:
+            raise RuntimeError(
+                f"Failed to generate content with Claude model '{self.model_name}': {e}"
+            )
+        return response
+
+    def _generate_stream(self, input: str) -> Iterator[str]:
+        """
+        Streams a translation from the Claude model with `messages.stream`.
+        Opening the stream goes through the rate limiter and the retry policy.
+        The token usage is taken from the final message.
+
+        Args:
+            input (str): The fully formatted input prompt to be sent to the model.
+
+        Yields:
+            str: The generated text deltas.
+        """
+        try:
+            stream = self._call_with_retries(
+                lambda: self.model.messages.stream(
+                    **self._request_kwargs(input)
+                ).__enter__(),
+                input,
+            )
+            try:
+                yield from stream.text_stream
+                record_usage(
+                    **self._response_usage(stream.get_final_message())
+                )
+            finally:
+                stream.close()
+        except Exception as e:
+            raise RuntimeError(
+                f"Failed to stream content with Claude model '{self.model_name}': {e}"
+            )
+
+    def _submit_batch_requests(self, prompts: dict[str, str]) -> str:
+        """
+        Creates a Message Batch with one request per prompt.
+
+        Args:
+            prompts (dict[str, str]): A mapping from custom id to rendered prompt.
+
+        Returns:
+            str: The id of the created message batch.
+        """
+        try:
+            batch = self.model.messages.batches.create(
+                requests=[
+                    {
+                        "custom_id": custom_id,
+                        "params": self._request_kwargs(prompt),
+                    }
+                    for custom_id, prompt in prompts.items()
+                ]
+            )
+        except Exception as e:
+            raise RuntimeError(
+                f"Failed to submit batch for Claude model '{self.model_name}': {e}"
+            )
+        return batch.id
+
+    def _get_batch_status(self, batch_id: str) -> str:
+        """
+        Retrieves the status of a Message Batch. Ended batches are completed, their
+        canceled or expired requests are reported per item by `collect`.
+
+        Args:
+            batch_id (str): The id of the message batch.
+
+        Returns:
+            str: Either "in_progress" or "completed".
+        """
+        batch = self.model.messages.batches.retrieve(batch_id)
+        if batch.processing_status == "ended":
+            return BATCH_COMPLETED
+        return BATCH_IN_PROGRESS
+
+    def _get_batch_results(self, batch_id: str) -> dict[str, Any]:
+        """
+        Streams the results of an ended Message Batch.
+
+        Args:
+            batch_id (str): The id of the message batch.
+
+        Returns:
+            dict[str, Any]: A mapping from custom id to the Message, or to the
+                exception of a failed request.
+        """
+        results: dict[str, Any] = {}
+        for entry in self.model.messages.batches.results(batch_id):
+            if entry.result.type == "succeeded":
+                results[entry.custom_id] = entry.result.message
+            else:
+                results[entry.custom_id] = RuntimeError(
+                    f"Batch request {entry.result.type} with Claude model '{self.model_name}': "
+                    f"{getattr(entry.result, 'error', '')}"
+                )
+        return results
+
     def _post_process(self, raw_response: Iterable) -> str:
         """
         Post-processes the raw response from the Claude model to extract the translated text.
@@ -118,4 +362,5 @@ class ClaudeTranslator(LLMTranslator):
         Returns:
             str: The translated text extracted from the raw response.
         """
+        self._report_usage(raw_response)
         return raw_response.content[0].text.strip()
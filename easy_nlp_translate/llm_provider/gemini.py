@@ -1,11 +1,13 @@
 import logging
 import os
-from typing import Optional, Iterable
+from typing import Any, Iterator, Optional, Iterable
 from google import genai
 from google.genai import types
 from dotenv import load_dotenv
 
 from ..llm_translator_base import LLMTranslator
+from ..metrics import record_usage
+from ..client_pool import shared_client_pool
 from ..config import available_models_gemini
 
 logger = logging.getLogger(__name__)
@@ -15,6 +17,9 @@ load_dotenv()
 
 class GeminiTranslator(LLMTranslator):
     AVAILABLE_MODELS: list[str] = available_models_gemini
+    PROVIDER_NAME: str = "gemini"
+    # Extra `types.HttpOptions` fields of the client, e.g. {"api_version": "v1"}.
+    HTTP_OPTIONS: dict[str, Any] = {}
 
     """
     A base class for LLM-based translators, inheriting from TranslatorBase.
@@ -66,12 +71,56 @@ class GeminiTranslator(LLMTranslator):
 
     def _init_model(self):
         """
-        Initializes the Gemini model using the provided API key.
+        Returns the shared Gemini client for the API key, base URL
+        (`GOOGLE_GEMINI_BASE_URL`) and `HTTP_OPTIONS` from the client pool,
+        creating it on first use.
         Returns:
-            Any: The initialized Gemini model.
+            genai.Client: The shared Gemini client.
         """
-        client = genai.Client(api_key=self.credentials)
-        return client
+        http_options = types.HttpOptions(
+            base_url=os.environ.get("GOOGLE_GEMINI_BASE_URL"),
+            **self.HTTP_OPTIONS,
+        )
+        key = shared_client_pool.make_key(
+            self.PROVIDER_NAME,
+            self.credentials,
+            http_options.model_dump_json(exclude_none=True),
+        )
+        return shared_client_pool.get(
+            key,
+            lambda limits: genai.Client(
+                api_key=self.credentials,
+                http_options=http_options.model_copy(
+                    update={"client_args": {"limits": limits}}
+                ),
+            ),
+        )
+
+    def _init_async_model(self):
+        """
+        Initializes a Gemini client of this translator for async requests.
+        It is not pooled, as its connections are bound to an event loop.
+        Returns:
+            Any: The `aio` namespace of the initialized Gemini client.
+        """
+        return genai.Client(api_key=self.credentials).aio
+
+    def _request_kwargs(self, input: str) -> dict:
+        """
+        Builds the generate_content request for the given prompt.
+        Args:
+            input (str): The input text to be translated.
+        Returns:
+            dict: The keyword arguments for `models.generate_content`.
+        """
+        return {
+            "model": self.model_name,
+            "contents": input,
+            "config": types.GenerateContentConfig(
+                temperature=self.temperature,
+                max_output_tokens=self.max_tokens,
+            ),
+        }
 
     def _generate(self, input: str) -> Iterable:
         """
@@ -82,13 +131,11 @@ class GeminiTranslator(LLMTranslator):
             Iterable: An iterable containing the generated translation.
         """
         try:
-            response = self.model.models.generate_content(
-                model=self.model_name,
-                contents=input,
-                config=types.GenerateContentConfig(
-                    temperature=self.temperature,
-                    max_output_tokens=self.max_tokens,
+            response = self._call_with_retries(
+                lambda: self.model.models.generate_content(
+                    **self._request_kwargs(input)
                 ),
+                input,
             )
         except Exception as e:
             raise RuntimeError(
@@ -96,6 +143,73 @@ class GeminiTranslator(LLMTranslator):
             )
         return response
 
+    async def _agenerate(self, input: str) -> Iterable:
+        """
+        Asynchronously generates a translation using the Gemini async client.
+        Args:
+            input (str): The input text to be translated.
+        Returns:
+            Iterable: An iterable containing the generated translation.
+        """
+        try:
+            response = await self._acall_with_retries(
+                lambda: self.async_model.models.generate_content(
+                    **self._request_kwargs(input)
+                ),
+                input,
+            )
+        except Exception as e:
+            raise RuntimeError(
+                f"Failed to generate content with Gemini model '{self.model_name}': {e}"
+            )
+        return response
+
+    def _generate_stream(self, input: str) -> Iterator[str]:
+        """
+        Streams a translation from the Gemini model with `generate_content_stream`.
+        Opening the stream goes through the rate limiter and the retry policy.
+        The token usage is taken from the last chunk.
+        Args:
+            input (str): The input text to be translated.
+        Yields:
+            str: The generated text deltas.
+        """
+        try:
+            last_chunk = None
+            for chunk in self._open_stream(
+                lambda: self.model.models.generate_content_stream(
+                    **self._request_kwargs(input)
+                ),
+                input,
+            ):
+                last_chunk = chunk
+                if chunk.text:
+                    yield chunk.text
+            if last_chunk is not None:
+                record_usage(**self._response_usage(last_chunk))
+        except Exception as e:
+            raise RuntimeError(
+                f"Failed to stream content with Gemini model '{self.model_name}': {e}"
+            )
+
+    def _response_usage(self, raw_response: Any) -> dict[str, Optional[int]]:
+        """
+        Extracts the token usage of a Gemini response.
+
+        Args:
+            raw_response (Any): The raw response from the Gemini model.
+        Returns:
+            dict[str, Optional[int]]: The input, output and cached input tokens.
+        """
+        usage = getattr(raw_response, "usage_metadata", None)
+        if usage is None:
+            return {}
+        return {
+            "input_tokens": usage.prompt_token_count,
+            "output_tokens": usage.candidates_token_count,
+            "cache_read_tokens": usage.cached_content_token_count,
+        }
+
     def _post_process(self, raw_response: Iterable) -> str:
         """
         Post-processes the raw response from the Gemini model to extract the translated text.
@@ -1,28 +1,47 @@
 import logging
-from typing import Optional, Iterable
+import threading
+import time
+from typing import Any, Iterator, Optional, Iterable
 import ollama
-import os
 from dotenv import load_dotenv
 
 from ..llm_translator_base import LLMTranslator
+from ..metrics import record_usage
 
 logger = logging.getLogger(__name__)
 
 load_dotenv()
 
 
-class OllamaTranslator(LLMTranslator):
-    AVAILABLE_MODELS: list[str] = (
-        []
-        if os.environ.get("TEST_OLLAMA_LIST")
-        else [model_obj.model for model_obj in ollama.list()["models"]]
-    )
+class _AvailableModels:
+    """
+    A class-level descriptor resolving `AVAILABLE_MODELS` with
+    `get_available_models()` on access, so the daemon is not queried on import.
+    """
+
+    def __get__(self, instance, owner) -> list[str]:
+        return owner.get_available_models()
+
 
+class OllamaTranslator(LLMTranslator):
     """
     A class for LLM-based translations using local Ollama models,
     inheriting from LLMTranslator.
+
+    The locally installed models are discovered on first use and cached
+    for `MODELS_CACHE_TTL` seconds, so importing this module never talks
+    to the Ollama daemon. `AVAILABLE_MODELS` reads the same cached list.
     """
 
+    AVAILABLE_MODELS = _AvailableModels()
+    MODELS_CACHE_TTL: float = 300.0
+    CHARS_PER_TOKEN: float = 3.5
+    PROVIDER_NAME: str = "ollama"
+
+    _models_cache: Optional[list[str]] = None
+    _models_cache_time: float = 0.0
+    _models_cache_lock = threading.Lock()
+
     def __init__(
         self,
         model_name: str,
@@ -55,9 +74,48 @@ class OllamaTranslator(LLMTranslator):
             max_tokens,
         )
 
+    @classmethod
+    def get_available_models(cls, refresh: bool = False) -> list[str]:
+        """
+        Returns the models installed in the local Ollama daemon.
+
+        The list is fetched with `ollama.list()` on first use and cached for
+        `MODELS_CACHE_TTL` seconds.
+
+        Args:
+            refresh (bool): Whether to ignore the cache and query the daemon again. Defaults to False.
+
+        Returns:
+            list[str]: The names of the installed models.
+
+        Raises:
+            RuntimeError: If the Ollama daemon cannot be reached.
+        """
+        with cls._models_cache_lock:
+            expired = (
+                cls._models_cache is None
+                or time.monotonic() - cls._models_cache_time
+                > cls.MODELS_CACHE_TTL
+            )
+            if refresh or expired:
+                try:
+                    models = ollama.list()["models"]
+                except Exception as e:
+                    raise RuntimeError(
+                        f"Failed to list Ollama models. Ensure you have Ollama installed and running: {e}"
+                    ) from e
+                cls._models_cache = [model_obj.model for model_obj in models]
+                cls._models_cache_time = time.monotonic()
+                logger.info(f"Discovered Ollama models: {cls._models_cache}")
+
+            return list(cls._models_cache)
+
     def _validate_model_name(self, model_name: str) -> None:
         """
-        Validates the model name against the available models.
+        Validates the model name against the cached list of available models.
+
+        If the model is missing from the cached list, the list is refreshed once,
+        in case the model was pulled after the cache was filled.
 
         Args:
             model_name (str): The name of the model to validate.
@@ -65,9 +123,13 @@ class OllamaTranslator(LLMTranslator):
         Raises:
             ValueError: If the model name is not in the list of available models.
         """
-        if model_name not in self.AVAILABLE_MODELS:
+        available_models = self.get_available_models()
+        if model_name not in available_models:
+            available_models = self.get_available_models(refresh=True)
+
+        if model_name not in available_models:
             raise ValueError(
-                f"Model '{model_name}' is not available. Available models are: {self.AVAILABLE_MODELS}. If you haven't installed the model yet, please run `ollama pull model`, but ensure you have Ollama installed and running."
+                f"Model '{model_name}' is not available. Available models are: {available_models}. If you haven't installed the model yet, please run `ollama pull model`, but ensure you have Ollama installed and running."
             )
 
     def _get_credentials(self) -> None:
@@ -90,6 +152,34 @@ class OllamaTranslator(LLMTranslator):
         """
         return None
 
+    def _init_async_model(self):
+        """
+        Initializes the async Ollama client for the default local host.
+
+        Returns:
+            ollama.AsyncClient: The initialized async client.
+        """
+        return ollama.AsyncClient()
+
+    def _request_kwargs(self, input: str) -> dict:
+        """
+        Builds the generate request for the given prompt.
+
+        Args:
+            input (str): The fully formatted input prompt.
+
+        Returns:
+            dict: The keyword arguments for `generate`.
+        """
+        return {
+            "model": self.model_name,
+            "prompt": input,
+            "options": {
+                "temperature": self.temperature,
+                "num_predict": self.max_tokens,
+            },
+        }
+
     def _generate(self, input: str) -> Iterable:
         """
         Generates a translation using the Ollama model.
@@ -100,16 +190,32 @@ class OllamaTranslator(LLMTranslator):
         Returns:
             dict: The raw response dictionary from the Ollama model.
         """
-        options = {
-            "temperature": self.temperature,
-            "num_predict": self.max_tokens,
-        }
+        try:
+            response = self._call_with_retries(
+                lambda: ollama.generate(**self._request_kwargs(input)), input
+            )
+        except Exception as e:
+            raise RuntimeError(
+                f"Failed to generate response from Ollama model '{self.model_name}': {e}"
+            )
+        return response
 
+    async def _agenerate(self, input: str) -> Iterable:
+        """
+        Asynchronously generates a translation using the async Ollama client.
+
+        Args:
+            input (str): The fully formatted input prompt.
+
+        Returns:
+            dict: The raw response dictionary from the Ollama model.
+        """
         try:
-            response = ollama.generate(
-                model=self.model_name,
-                prompt=input,
-                options=options,
+            response = await self._acall_with_retries(
+                lambda: self.async_model.generate(
+                    **self._request_kwargs(input)
+                ),
+                input,
             )
         except Exception as e:
             raise RuntimeError(
@@ -117,6 +223,49 @@ class OllamaTranslator(LLMTranslator):
             )
         return response
 
+    def _generate_stream(self, input: str) -> Iterator[str]:
+        """
+        Streams a translation from the Ollama model with `stream=True`.
+        Opening the stream goes through the rate limiter and the retry policy.
+        The token usage is taken from the final chunk.
+
+        Args:
+            input (str): The fully formatted input prompt.
+
+        Yields:
+            str: The generated text deltas.
+        """
+        try:
+            for chunk in self._open_stream(
+                lambda: ollama.generate(
+                    **self._request_kwargs(input), stream=True
+                ),
+                input,
+            ):
+                if chunk.get("done"):
+                    record_usage(**self._response_usage(chunk))
+                if chunk.get("response"):
+                    yield chunk["response"]
+        except Exception as e:
+            raise RuntimeError(
+                f"Failed to stream response from Ollama model '{self.model_name}': {e}"
+            )
+
+    def _response_usage(self, raw_response: Any) -> dict[str, Optional[int]]:
+        """
+        Extracts the token usage of an Ollama response.
+
+        Args:
+            raw_response (Any): The raw response dictionary from Ollama.
+
+        Returns:
+            dict[str, Optional[int]]: The prompt and generated tokens.
+        """
+        return {
+            "input_tokens": raw_response.get("prompt_eval_count"),
+            "output_tokens": raw_response.get("eval_count"),
+        }
+
     def _post_process(self, raw_response: Iterable) -> str:
         """
         Post-processes the raw response from Ollama to extract the translated text.
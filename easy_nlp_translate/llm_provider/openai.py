@@ -1,19 +1,35 @@
+import json
 import logging
 import os
-from typing import Optional, Iterable
-from openai import OpenAI
+from typing import Any, Iterator, Optional, Iterable
+from openai import AsyncOpenAI, DefaultHttpxClient, OpenAI
+from openai.types.chat import ChatCompletion
 from dotenv import load_dotenv
 
 from ..llm_translator_base import LLMTranslator
+from ..metrics import record_usage
+from ..batch_jobs import BATCH_COMPLETED, BATCH_FAILED, BATCH_IN_PROGRESS
+from ..client_pool import shared_client_pool
 from ..config import available_models_openai
 
 logger = logging.getLogger(__name__)
 
 load_dotenv()
 
+_BATCH_ENDPOINT = "/v1/chat/completions"
+_BATCH_STATUS_MAP = {
+    "completed": BATCH_COMPLETED,
+    # Expired batches keep the results of the requests that finished in time.
+    "expired": BATCH_COMPLETED,
+    "failed": BATCH_FAILED,
+    "cancelling": BATCH_FAILED,
+    "cancelled": BATCH_FAILED,
+}
+
 
 class GPTTranslator(LLMTranslator):
     AVAILABLE_MODELS: list[str] = available_models_openai
+    PROVIDER_NAME: str = "openai"
 
     """
     A base class for LLM-based translators, inheriting from TranslatorBase.
@@ -65,12 +81,54 @@ class GPTTranslator(LLMTranslator):
 
     def _init_model(self):
         """
-        Initializes the GPT model using the provided API key.
+        Returns the shared GPT client for the API key from the client pool,
+        creating it on first use.
         Returns:
-            Any: The initialized GPT model.
+            OpenAI: The shared GPT client.
         """
-        client = OpenAI(api_key=self.credentials)
-        return client
+        key = shared_client_pool.make_key(
+            self.PROVIDER_NAME,
+            self.credentials,
+            os.environ.get("OPENAI_BASE_URL"),
+        )
+        # Retries are handled by `_call_with_retries`, together with the rate limiter.
+        return shared_client_pool.get(
+            key,
+            lambda limits: OpenAI(
+                api_key=self.credentials,
+                max_retries=0,
+                http_client=DefaultHttpxClient(limits=limits),
+            ),
+        )
+
+    def _init_async_model(self):
+        """
+        Initializes the async GPT client using the provided API key.
+        Returns:
+            AsyncOpenAI: The initialized async client.
+        """
+        return AsyncOpenAI(api_key=self.credentials, max_retries=0)
+
+    def _request_kwargs(self, input: str) -> dict:
+        """
+        Builds the chat completion request for the given prompt.
+        Args:
+            input (str): The input text to be translated.
+        Returns:
+            dict: The keyword arguments for `chat.completions.create`.
+        """
+        return {
+            "model": self.model_name,
+            "messages": [
+                {
+                    "role": "system",
+                    "content": f"You are a helpful translator that translates text to {self.target_lang}.",
+                },
+                {"role": "user", "content": input},
+            ],
+            "temperature": self.temperature,
+            "max_tokens": self.max_tokens,
+        }
 
     def _generate(self, input: str) -> Iterable:
         """
@@ -81,17 +139,11 @@ class GPTTranslator(LLMTranslator):
             Iterable: An iterable containing the generated translation.
         """
         try:
-            response = self.model.chat.completions.create(
-                model=self.model_name,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": f"You are a helpful translator that translates text to {self.target_lang}.",
-                    },
-                    {"role": "user", "content": input},
-                ],
-                temperature=self.temperature,
-                max_tokens=self.max_tokens,
+            response = self._call_with_retries(
+                lambda: self.model.chat.completions.create(
+                    **self._request_kwargs(input)
+                ),
+                input,
             )
         except Exception as e:
             raise RuntimeError(
@@ -99,6 +151,152 @@ class GPTTranslator(LLMTranslator):
             )
         return response
 
+    async def _agenerate(self, input: str) -> Iterable:
+        """
+        Asynchronously generates a translation using the async GPT client.
+        Args:
+            input (str): The input text to be translated.
+        Returns:
+            Iterable: An iterable containing the generated translation.
+        """
+        try:
+            response = await self._acall_with_retries(
+                lambda: self.async_model.chat.completions.create(
+                    **self._request_kwargs(input)
+                ),
+                input,
+            )
+        except Exception as e:
+            raise RuntimeError(
+                f"Failed to generate content with GPT model '{self.model_name}': {e}"
+            )
+        return response
+
+    def _generate_stream(self, input: str) -> Iterator[str]:
+        """
+        Streams a translation from the GPT model with `stream=True`. The token
+        usage is requested with `include_usage` and arrives in the last chunk.
+        Args:
+            input (str): The input text to be translated.
+        Yields:
+            str: The generated text deltas.
+        """
+        try:
+            stream = self._call_with_retries(
+                lambda: self.model.chat.completions.create(
+                    **self._request_kwargs(input),
+                    stream=True,
+                    stream_options={"include_usage": True},
+                ),
+                input,
+            )
+            for chunk in stream:
+                if getattr(chunk, "usage", None) is not None:
+                    record_usage(**self._response_usage(chunk))
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        except Exception as e:
+            raise RuntimeError(
+                f"Failed to stream content with GPT model '{self.model_name}': {e}"
+            )
+
+    def _submit_batch_requests(self, prompts: dict[str, str]) -> str:
+        """
+        Uploads the prompts as a JSONL file and creates an OpenAI batch for them.
+        Args:
+            prompts (dict[str, str]): A mapping from custom id to rendered prompt.
+        Returns:
+            str: The id of the created batch.
+        """
+        lines = [
+            json.dumps(
+                {
+                    "custom_id": custom_id,
+                    "method": "POST",
+                    "url": _BATCH_ENDPOINT,
+                    "body": self._request_kwargs(prompt),
+                },
+                ensure_ascii=False,
+            )
+            for custom_id, prompt in prompts.items()
+        ]
+        try:
+            input_file = self.model.files.create(
+                file=("batch_input.jsonl", "\n".join(lines).encode("utf-8")),
+                purpose="batch",
+            )
+            batch = self.model.batches.create(
+                input_file_id=input_file.id,
+                endpoint=_BATCH_ENDPOINT,
+                completion_window="24h",
+            )
+        except Exception as e:
+            raise RuntimeError(
+                f"Failed to submit batch for GPT model '{self.model_name}': {e}"
+            )
+        return batch.id
+
+    def _get_batch_status(self, batch_id: str) -> str:
+        """
+        Retrieves the status of an OpenAI batch.
+        Args:
+            batch_id (str): The id of the batch.
+        Returns:
+            str: One of "in_progress", "completed" or "failed".
+        """
+        batch = self.model.batches.retrieve(batch_id)
+        return _BATCH_STATUS_MAP.get(batch.status, BATCH_IN_PROGRESS)
+
+    def _get_batch_results(self, batch_id: str) -> dict[str, Any]:
+        """
+        Downloads the output and error files of a finished OpenAI batch.
+        Args:
+            batch_id (str): The id of the batch.
+        Returns:
+            dict[str, Any]: A mapping from custom id to the chat completion, or to
+                the exception of a failed request.
+        """
+        batch = self.model.batches.retrieve(batch_id)
+
+        results: dict[str, Any] = {}
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if not file_id:
+                continue
+            for line in self.model.files.content(file_id).text.splitlines():
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                response = entry.get("response") or {}
+                if response.get("status_code") == 200:
+                    results[entry["custom_id"]] = (
+                        ChatCompletion.model_validate(response["body"])
+                    )
+                else:
+                    results[entry["custom_id"]] = RuntimeError(
+                        f"Batch request failed with GPT model '{self.model_name}': "
+                        f"{entry.get('error') or response.get('body')}"
+                    )
+        return results
+
+    def _response_usage(self, raw_response: Any) -> dict[str, Optional[int]]:
+        """
+        Extracts the token usage of a chat completion.
+
+        Args:
+            raw_response (Any): The raw response from the GPT model.
+        Returns:
+            dict[str, Optional[int]]: The input, output and cached input tokens.
+        """
+        usage = getattr(raw_response, "usage", None)
+        if usage is None:
+            return {}
+        details = getattr(usage, "prompt_tokens_details", None)
+        return {
+            "input_tokens": usage.prompt_tokens,
+            "output_tokens": usage.completion_tokens,
+            "cache_read_tokens": getattr(details, "cached_tokens", None),
+        }
+
     def _post_process(self, raw_response: Iterable) -> str:
         """
         Post-processes the raw response from the GPT model to extract the translated text.
@@ -1,13 +1,40 @@
+import asyncio
+import contextvars
+import itertools
+import json
 import logging
+import math
+import time
 
 from abc import abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Iterable
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Iterator,
+    Optional,
+    Iterable,
+    Union,
+)
 from jinja2 import Template
 
 from .translator_base import TranslatorBase
-from .prompt_config import PromptStyle, SHARED_LLM_PROMPT_TEMPLATES_DIR
+from .batch_jobs import BATCH_COMPLETED, BATCH_JOBS_DIR, BatchJob
+from .rate_limit import RateLimiter, RetryPolicy, get_rate_limiter
+from .exceptions import BatchTranslationError
+from .metrics import measure, record_retry, record_usage, stage
+from .prompt_config import (
+    PACKED_SEGMENTS_TEMPLATE_PATH,
+    PromptStyle,
+    RenderedPrompt,
+    SHARED_LLM_PROMPT_TEMPLATES_DIR,
+    load_prompt_template,
+    render_prompt,
+)
 from .config import language_code_to_name_map
+from .text_chunking import PARAGRAPH_BREAK_PATTERN, ChunkedText
 
 
 logger = logging.getLogger(__name__)
@@ -21,6 +48,11 @@ class LLMTranslator(TranslatorBase):
     AVAILABLE_MODELS: list[str] = NotImplemented
     TEMPLATES_DIR: Path = SHARED_LLM_PROMPT_TEMPLATES_DIR
     LANGUAGE_MAPPER: dict[str, str] = language_code_to_name_map
+    # Average number of Latin-script characters per token, used to estimate token counts.
+    CHARS_PER_TOKEN: float = 4.0
+    # Name of the shared rate limiter, see `rate_limit.configure_rate_limit`.
+    PROVIDER_NAME: Optional[str] = None
+    retry_policy: RetryPolicy = RetryPolicy()
 
     def __init__(
         self,
@@ -53,6 +85,7 @@ class LLMTranslator(TranslatorBase):
         self.model_name = model_name
         self.credentials = self._get_credentials()
         self.model = self._init_model()
+        self._async_model = None
 
         try:
             self.prompt_style: PromptStyle = PromptStyle.from_code(prompt_type)
@@ -96,15 +129,14 @@ class LLMTranslator(TranslatorBase):
 
     def _get_prompt_template(self, prompt_path: Path) -> Template:
         """
-        Loads the prompt template from the specified file path.
+        Loads the prompt template from the specified file path. Templates are
+        compiled once per process and shared by all translators.
         Args:
             prompt_path (Path): The path to the prompt template file.
         Returns:
-            Template: A Jinja2 Template object initialized with the content of the prompt file.
+            Template: The compiled Jinja2 Template object of the prompt file.
         """
-        with open(prompt_path, "r") as file:
-            prompt_template = file.read()
-        return Template(prompt_template)
+        return load_prompt_template(prompt_path)
 
     def _init_prompt(self) -> Template:
         """
@@ -116,10 +148,24 @@ class LLMTranslator(TranslatorBase):
             self.TEMPLATES_DIR / self.prompt_style.template_filename
         )
 
-        logger.info(f"Loading prompt template from {prompt_path}")
+        logger.debug(f"Loading prompt template from {prompt_path}")
 
         return self._get_prompt_template(prompt_path)
 
+    def _get_cache_params(self) -> dict:
+        """
+        Returns the model, prompt and generation settings that influence the translation output.
+        Returns:
+            dict: A JSON-serializable mapping of setting names to values.
+        """
+        return {
+            "model_name": self.model_name,
+            "prompt_style": self.prompt_style.value,
+            "custom_prompt": self.costum_prompt,
+            "temperature": self.temperature,
+            "max_tokens": self.max_tokens,
+        }
+
     def _validate_model_name(self, model_name: str):
         """
         Validates if the given model name is available.
@@ -133,24 +179,30 @@ class LLMTranslator(TranslatorBase):
                 f"Model '{model_name}' is not available. Available models are: {self.AVAILABLE_MODELS}"
             )
 
-    def _render_prompt(self, text_to_translate: str) -> str:
+    def _render_prompt(
+        self, text_to_translate: str, source_lang: Optional[str] = None
+    ) -> RenderedPrompt:
         """
         Renders the prompt template with the provided text and language information.
         Args:
             text_to_translate (str): The text to be translated.
+            source_lang (Optional[str]): The source language to use instead of
+                `self.source_lang`, e.g. one detected for a whole document. Defaults to None.
         Returns:
-            str: The rendered prompt string.
+            RenderedPrompt: The rendered prompt string, which also carries its static
+                part (rules and language pair) and the text separately.
         Raises:
             ValueError: If the source language cannot be detected and is not provided.
         """
-        if self.source_lang is None:
+        if source_lang is None:
+            source_lang = self.source_lang
+
+        if source_lang is None:
             source_lang = self.detect_language(text_to_translate)
             if source_lang is None:
                 raise ValueError(
                     "Source language could not be detected. Please provide a valid source language."
                 )
-        else:
-            source_lang = self.source_lang
 
         long_source_lang = self.LANGUAGE_MAPPER.get(source_lang)
         long_target_lang = self.LANGUAGE_MAPPER.get(self.target_lang)
@@ -159,19 +211,14 @@ class LLMTranslator(TranslatorBase):
             f"Detected source language: {long_source_lang}, target language: {long_target_lang}"
         )
 
+        template_kwargs = {
+            "source_language": long_source_lang,
+            "target_language": long_target_lang,
+        }
         if self.prompt_style == PromptStyle.CUSTOM:
-            return self.prompt.render(
-                source_language=long_source_lang,
-                target_language=long_target_lang,
-                text_to_translate=text_to_translate,
-                custom_prompt=self.costum_prompt,
-            )
-        else:
-            return self.prompt.render(
-                source_language=long_source_lang,
-                target_language=long_target_lang,
-                text_to_translate=text_to_translate,
-            )
+            template_kwargs["custom_prompt"] = self.costum_prompt
+
+        return render_prompt(self.prompt, text_to_translate, **template_kwargs)
 
     @abstractmethod
     def _get_credentials(self):
@@ -197,6 +244,150 @@ class LLMTranslator(TranslatorBase):
             "This method should be implemented in subclasses."
         )
 
+    def _init_async_model(self):
+        """
+        Initializes the asynchronous client used by `_agenerate`.
+        Providers with an async SDK client override this method.
+        Returns:
+            The initialized async client, or None if the provider has none.
+        """
+        return None
+
+    @property
+    def async_model(self):
+        """
+        The asynchronous client, created on first use.
+
+        Async clients hold connections bound to the event loop they are first used on,
+        so a translator should be used with async methods from a single event loop.
+        """
+        if self._async_model is None:
+            self._async_model = self._init_async_model()
+        return self._async_model
+
+    @property
+    def rate_limiter(self) -> RateLimiter:
+        """
+        The rate limiter shared by all translators of this provider in the process.
+        """
+        return get_rate_limiter(self.PROVIDER_NAME or self.__class__.__name__)
+
+    def _request_tokens(self, input: str) -> int:
+        """
+        Estimates the tokens a request counts against the provider's limit.
+        Args:
+            input (str): The input prompt.
+        Returns:
+            int: The estimated prompt tokens plus `max_tokens`.
+        """
+        return self._estimate_tokens([input])[0] + self.max_tokens
+
+    def _call_with_retries(self, call: Callable[[], Any], input: str) -> Any:
+        """
+        Sends a request through the provider's rate limiter and retries it with
+        jittered exponential backoff on rate-limit, server and connection errors,
+        honoring Retry-After.
+        Args:
+            call (Callable[[], Any]): Sends the request with the provider SDK.
+            input (str): The input prompt, used to estimate the request's tokens.
+        Returns:
+            Any: The return value of `call`.
+        Raises:
+            Exception: The last error if it is not retryable or retries are exhausted.
+        """
+        tokens = self._request_tokens(input)
+        for attempt in range(self.retry_policy.max_retries + 1):
+            with stage("rate_limit"):
+                self.rate_limiter.acquire(tokens)
+            try:
+                with stage("request"):
+                    return call()
+            except Exception as e:
+                if (
+                    attempt >= self.retry_policy.max_retries
+                    or not self.retry_policy.is_retryable(e)
+                ):
+                    raise
+                delay = self.retry_policy.delay(attempt, e)
+                logger.warning(
+                    f"Request to '{self.model_name}' failed ({e}), retrying in {delay:.1f}s "
+                    f"(retry {attempt + 1}/{self.retry_policy.max_retries})"
+                )
+                record_retry()
+                with stage("retry_backoff"):
+                    time.sleep(delay)
+
+    async def _acall_with_retries(
+        self, call: Callable[[], Awaitable[Any]], input: str
+    ) -> Any:
+        """
+        Asynchronous version of `_call_with_retries`.
+        Args:
+            call (Callable[[], Awaitable[Any]]): Sends the request with the provider's async client.
+            input (str): The input prompt, used to estimate the request's tokens.
+        Returns:
+            Any: The awaited return value of `call`.
+        Raises:
+            Exception: The last error if it is not retryable or retries are exhausted.
+        """
+        tokens = self._request_tokens(input)
+        for attempt in range(self.retry_policy.max_retries + 1):
+            with stage("rate_limit"):
+                await self.rate_limiter.aacquire(tokens)
+            try:
+                with stage("request"):
+                    return await call()
+            except Exception as e:
+                if (
+                    attempt >= self.retry_policy.max_retries
+                    or not self.retry_policy.is_retryable(e)
+                ):
+                    raise
+                delay = self.retry_policy.delay(attempt, e)
+                logger.warning(
+                    f"Request to '{self.model_name}' failed ({e}), retrying in {delay:.1f}s "
+                    f"(retry {attempt + 1}/{self.retry_policy.max_retries})"
+                )
+                record_retry()
+                with stage("retry_backoff"):
+                    await asyncio.sleep(delay)
+
+    def _open_stream(
+        self, open_stream: Callable[[], Iterable], input: str
+    ) -> Iterator:
+        """
+        Opens a streaming request through `_call_with_retries`.
+        Generator-based SDK streams only send the request when the first chunk
+        is read, so the first chunk is read inside the retried call. Errors after
+        the first chunk are not retried, as deltas were already yielded.
+        Args:
+            open_stream (Callable[[], Iterable]): Starts the stream with the provider SDK.
+            input (str): The input prompt, used to estimate the request's tokens.
+        Returns:
+            Iterator: All chunks of the stream.
+        """
+
+        def call():
+            stream = iter(open_stream())
+            return next(stream, None), stream
+
+        first, stream = self._call_with_retries(call, input)
+        if first is None:
+            return iter(())
+        return itertools.chain([first], stream)
+
+    async def _agenerate(self, input: str) -> Iterable:
+        """
+        Asynchronously generates a response from the model based on the input prompt.
+        Providers override this with their SDK's async client. The default runs
+        `_generate` in a worker thread.
+        Args:
+            input (str): The input prompt to generate a response for.
+        Returns:
+            Iterable: An iterable containing the generated response.
+        """
+        return await asyncio.to_thread(self._generate, input)
+
     @abstractmethod
     def _generate(self, input: str) -> Iterable:
         """
@@ -211,6 +402,63 @@ class LLMTranslator(TranslatorBase):
             "This method should be implemented in subclasses."
         )
 
+    def _generate_stream(self, input: str) -> Iterator[str]:
+        """
+        Generates a response from the model and yields it in text deltas as they arrive.
+        Providers override this with their SDK's streaming API and record the token
+        usage reported with the last chunk. The default waits for the full response
+        and yields it at once.
+        Args:
+            input (str): The input prompt to generate a response for.
+        Yields:
+            str: The generated text deltas.
+        """
+        yield self._process_response(self._generate(input))
+
+    def _submit_batch_requests(self, prompts: dict[str, str]) -> str:
+        """
+        Submits rendered prompts to the provider's asynchronous batch API.
+        Providers with a batch API override this method.
+        Args:
+            prompts (dict[str, str]): A mapping from custom id to rendered prompt.
+        Returns:
+            str: The provider's id of the created batch.
+        Raises:
+            NotImplementedError: If the provider has no batch API.
+        """
+        raise NotImplementedError(
+            f"{self.__class__.__name__} does not support the provider batch API."
+        )
+
+    def _get_batch_status(self, batch_id: str) -> str:
+        """
+        Retrieves the status of a batch from the provider.
+        Args:
+            batch_id (str): The provider's id of the batch.
+        Returns:
+            str: One of "in_progress", "completed" or "failed".
+        Raises:
+            NotImplementedError: If the provider has no batch API.
+        """
+        raise NotImplementedError(
+            f"{self.__class__.__name__} does not support the provider batch API."
+        )
+
+    def _get_batch_results(self, batch_id: str) -> dict[str, Any]:
+        """
+        Downloads the results of a finished batch from the provider.
+        Args:
+            batch_id (str): The provider's id of the batch.
+        Returns:
+            dict[str, Any]: A mapping from custom id to the raw response, which is
+                passed to `_post_process`, or to the exception of a failed request.
+        Raises:
+            NotImplementedError: If the provider has no batch API.
+        """
+        raise NotImplementedError(
+            f"{self.__class__.__name__} does not support the provider batch API."
+        )
+
     @abstractmethod
     def _post_process(self, raw_response: Iterable) -> str:
         """
@@ -225,6 +473,30 @@ class LLMTranslator(TranslatorBase):
             "This method should be implemented in subclasses."
         )
 
+    def _response_usage(self, raw_response: Any) -> dict[str, Optional[int]]:
+        """
+        Extracts the token usage from a raw response for the metrics hooks.
+        Providers override this to read the usage data of their SDK's responses.
+        Args:
+            raw_response (Any): The raw response from the model.
+        Returns:
+            dict[str, Optional[int]]: Counts for the fields in `metrics.USAGE_FIELDS`.
+                Defaults to no usage data.
+        """
+        return {}
+
+    def _process_response(self, raw_response: Any) -> str:
+        """
+        Records the token usage of a raw response and post-processes it.
+        Args:
+            raw_response (Any): The raw response from the model.
+        Returns:
+            str: The final translated text.
+        """
+        record_usage(**self._response_usage(raw_response))
+        with stage("post_process"):
+            return self._post_process(raw_response)
+
     def translate(self, text: str) -> str:
         """
         Translates the given text using the configured LLM.
@@ -235,6 +507,9 @@ class LLMTranslator(TranslatorBase):
         3. Sending the prompt to the LLM via `_generate`.
         4. Post-processing the LLM's response via `_post_process`.
 
+        The timings of these stages, the token usage and retries are reported to
+        the hooks registered with `metrics.add_metrics_hook`.
+
         Args:
             text: The text to be translated.
 
@@ -247,17 +522,668 @@ class LLMTranslator(TranslatorBase):
         """
         LLMTranslator._validate_basic_text_to_translate(text)
 
-        rendered_prompt = self._render_prompt(text_to_translate=text)
+        return self._translate_text(text)
+
+    def _translate_text(
+        self, text: str, source_lang: Optional[str] = None
+    ) -> str:
+        """
+        Renders the prompt for a validated text, sends it to the LLM and post-processes the response.
+        Args:
+            text (str): The validated text to be translated.
+            source_lang (Optional[str]): The source language to use instead of `self.source_lang`.
+                Defaults to None.
+        Returns:
+            str: The translated text.
+        """
+        with measure(self, "translate"):
+            with stage("render"):
+                rendered_prompt = self._render_prompt(
+                    text_to_translate=text, source_lang=source_lang
+                )
+
+            logger.debug(
+                f"LLM '{self.model_name}' ({self.__class__.__name__}) - "
+                f"Style '{self.prompt_style.name}' - Final Prompt: {rendered_prompt}"
+            )
 
+            raw_llm_output = self._generate(rendered_prompt)
+            translated_text = self._process_response(raw_llm_output)
         logger.debug(
-            f"LLM '{self.model_name}' ({self.__class__.__name__}) - "
-            f"Style '{self.prompt_style.name}' - Final Prompt: {rendered_prompt}"
+            f"LLM '{self.model_name}' - Post-processed translation: {translated_text}"
         )
 
-        raw_llm_output = self._generate(rendered_prompt)
-        translated_text = self._post_process(raw_llm_output)
+        return translated_text
+
+    @staticmethod
+    def _strip_stream(deltas: Iterable[str]) -> Iterator[str]:
+        """
+        Strips leading and trailing whitespace from a stream of text deltas, like
+        `str.strip` does for a full response. Whitespace inside the text is kept.
+        Args:
+            deltas (Iterable[str]): The raw text deltas.
+        Yields:
+            str: The non-empty text deltas.
+        """
+        started = False
+        pending = ""
+        for delta in deltas:
+            if not started:
+                delta = delta.lstrip()
+                if not delta:
+                    continue
+                started = True
+            content = delta.rstrip()
+            if content:
+                yield pending + content
+                pending = delta[len(content) :]
+            else:
+                pending += delta
+
+    def translate_stream(self, text: str) -> Iterator[str]:
+        """
+        Translates the given text and yields the translation in pieces as the
+        LLM generates them, so the first words can be shown before the response
+        is complete.
+
+        Args:
+            text: The text to be translated.
+
+        Yields:
+            The translated text in consecutive pieces. Joined, they form the
+            same text `translate` would return.
+
+        Raises:
+            ValueError: If input text validation fails, language detection fails
+                when required, or prompt rendering fails.
+        """
+        LLMTranslator._validate_basic_text_to_translate(text)
+
+        # The measured stream runs in its own context, so the metrics of the
+        # stream do not leak into the caller's code between two pieces.
+        context = contextvars.copy_context()
+        stream = self._measured_stream(text)
+        try:
+            while True:
+                try:
+                    piece = context.run(next, stream)
+                except StopIteration:
+                    return
+                yield piece
+        finally:
+            context.run(stream.close)
+
+    def _measured_stream(self, text: str) -> Iterator[str]:
+        """
+        Renders the prompt for a validated text and streams the stripped
+        translation, measured as one "translate_stream" call.
+        Args:
+            text (str): The validated text to be translated.
+        Yields:
+            str: The translated text in consecutive pieces.
+        """
+        with measure(self, "translate_stream"):
+            with stage("render"):
+                rendered_prompt = self._render_prompt(text_to_translate=text)
+            logger.debug(
+                f"LLM '{self.model_name}' ({self.__class__.__name__}) - "
+                f"Style '{self.prompt_style.name}' - Streaming prompt: {rendered_prompt}"
+            )
+
+            yield from self._strip_stream(
+                self._generate_stream(rendered_prompt)
+            )
+
+    @staticmethod
+    def _validate_max_concurrency(max_concurrency: int):
+        """
+        Validates the maximum number of concurrent requests.
+        Args:
+            max_concurrency (int): The maximum number of concurrent requests.
+        Raises:
+            ValueError: If max_concurrency is not a positive integer.
+        """
+        if not isinstance(max_concurrency, int) or max_concurrency <= 0:
+            raise ValueError("max_concurrency must be a positive integer.")
+
+    def translate_batch(self, texts: list, max_concurrency: int = 8) -> list:
+        """
+        Translates a batch of texts with up to `max_concurrency` requests in flight.
+
+        The requests are sent from a thread pool, so the batch is no longer bound
+        to one round-trip per text. Every item is attempted even if others fail.
+
+        Args:
+            texts (list): A list of texts to be translated.
+            max_concurrency (int): The maximum number of concurrent requests. Defaults to 8.
+
+        Returns:
+            list: A list of translated texts, in the same order as the input.
+
+        Raises:
+            ValueError: If max_concurrency is invalid or any text is invalid.
+            BatchTranslationError: If one or more translations fail. It carries the
+                per-item errors and the translations that succeeded.
+        """
+        self._validate_max_concurrency(max_concurrency)
+        for text in texts:
+            self._validate_basic_text_to_translate(text)
+
+        return self._run_concurrently(self.translate, texts, max_concurrency)
+
+    def _run_concurrently(
+        self,
+        translate: Callable[[Any], Any],
+        texts: list,
+        max_concurrency: int,
+    ) -> list:
+        """
+        Runs `translate` on every item from a thread pool and collects the results in order.
+        Args:
+            translate (Callable[[Any], Any]): The function translating a single item.
+            texts (list): The validated items, usually texts.
+            max_concurrency (int): The maximum number of concurrent requests.
+        Returns:
+            list: The results, in the same order as the input.
+        Raises:
+            BatchTranslationError: If one or more translations fail.
+        """
+        results: list[Optional[str]] = [None] * len(texts)
+        errors: dict[int, Exception] = {}
+        if not texts:
+            return results
+
+        with ThreadPoolExecutor(
+            max_workers=min(max_concurrency, len(texts)),
+            thread_name_prefix=f"{self.__class__.__name__}-batch",
+        ) as executor:
+            # Each item runs in a copy of the caller's context, so metrics
+            # attribution (e.g. translation cache hits) carries over to the workers.
+            futures = [
+                executor.submit(
+                    contextvars.copy_context().run, translate, text
+                )
+                for text in texts
+            ]
+            for index, future in enumerate(futures):
+                try:
+                    results[index] = future.result()
+                except Exception as e:
+                    logger.warning(
+                        f"Translation of batch item {index} failed: {e}"
+                    )
+                    errors[index] = e
+
+        if errors:
+            raise BatchTranslationError(errors, results)
+
+        return results
+
+    def _render_packed_prompt(
+        self, texts: list[str], source_lang: Optional[str]
+    ) -> RenderedPrompt:
+        """
+        Renders one prompt for several segments, numbered from 1 in a JSON object.
+        Args:
+            texts (list[str]): The segments to translate.
+            source_lang (Optional[str]): The source language of all segments.
+        Returns:
+            RenderedPrompt: The rendered prompt string, whose text is the JSON object
+                of segments and whose static part only depends on the segment count.
+        """
+        segments = {str(number): text for number, text in enumerate(texts, 1)}
+        base_prompt = self._render_prompt(
+            json.dumps(segments, ensure_ascii=False, indent=2), source_lang
+        )
+        template = self._get_prompt_template(PACKED_SEGMENTS_TEMPLATE_PATH)
+        return RenderedPrompt(
+            template.render(base_prompt=base_prompt, segment_count=len(texts)),
+            static=template.render(
+                base_prompt=base_prompt.static, segment_count=len(texts)
+            ),
+            text=base_prompt.text,
+        )
+
+    @staticmethod
+    def _parse_packed_response(response: str, count: int) -> dict[int, str]:
+        """
+        Extracts the translated segments from a packed reply.
+        Args:
+            response (str): The post-processed reply of the LLM.
+            count (int): The number of segments that were sent.
+        Returns:
+            dict[int, str]: The translation of every segment that could be parsed, keyed
+                by zero-based segment index. Empty if the reply is not a JSON object.
+        """
+        start, end = response.find("{"), response.rfind("}")
+        if start == -1 or end < start:
+            return {}
+        try:
+            parsed = json.loads(response[start : end + 1])
+        except json.JSONDecodeError:
+            return {}
+        if not isinstance(parsed, dict):
+            return {}
+
+        return {
+            number - 1: parsed[str(number)]
+            for number in range(1, count + 1)
+            if isinstance(parsed.get(str(number)), str)
+        }
+
+    def _translate_pack(
+        self, texts: list[str], source_lang: Optional[str]
+    ) -> list[str]:
+        """
+        Translates several segments with one request. Segments missing from an
+        unparsable or incomplete reply are translated one by one instead.
+        Args:
+            texts (list[str]): The validated segments, all in `source_lang`.
+            source_lang (Optional[str]): The source language of the segments.
+        Returns:
+            list[str]: The translated segments, in the same order as the input.
+        """
+        if len(texts) == 1:
+            return [self._translate_text(texts[0], source_lang)]
+
+        with measure(self, "translate_packed", items=len(texts)):
+            with stage("render"):
+                rendered_prompt = self._render_packed_prompt(
+                    texts, source_lang
+                )
+            logger.debug(
+                f"LLM '{self.model_name}' - Packed prompt for {len(texts)} segments: {rendered_prompt}"
+            )
+            response = self._process_response(self._generate(rendered_prompt))
+            with stage("post_process"):
+                parsed = self._parse_packed_response(response, len(texts))
+
+        if len(parsed) < len(texts):
+            logger.warning(
+                f"Packed reply contained {len(parsed)} of {len(texts)} segments, "
+                "translating the missing segments one by one"
+            )
+        return [
+            parsed[index]
+            if index in parsed
+            else self._translate_text(text, source_lang)
+            for index, text in enumerate(texts)
+        ]
+
+    def translate_packed(
+        self,
+        texts: list,
+        max_segments: int = 20,
+        max_concurrency: int = 8,
+    ) -> list:
+        """
+        Translates many short texts with few requests by packing several of them
+        into one prompt.
+
+        The texts are grouped by source language and packed into numbered JSON
+        objects of up to `max_segments` texts whose estimated size fits half of
+        `max_tokens`. The reply is parsed back into one translation per text. If a
+        reply cannot be parsed, the affected texts are translated one by one.
+        Packs are sent with up to `max_concurrency` requests in flight.
+
+        Args:
+            texts (list): A list of texts to be translated.
+            max_segments (int): The maximum number of texts per request. Defaults to 20.
+            max_concurrency (int): The maximum number of concurrent requests. Defaults to 8.
+
+        Returns:
+            list: A list of translated texts, in the same order as the input.
+
+        Raises:
+            ValueError: If max_segments, max_concurrency or any text is invalid.
+            BatchTranslationError: If one or more requests fail. Every text of a
+                failed request is reported with that request's error.
+        """
+        if not isinstance(max_segments, int) or max_segments <= 0:
+            raise ValueError("max_segments must be a positive integer.")
+        self._validate_max_concurrency(max_concurrency)
+        for text in texts:
+            self._validate_basic_text_to_translate(text)
+
+        if self.source_lang is not None:
+            langs = [self.source_lang] * len(texts)
+        else:
+            langs = self.detect_languages(texts)
+
+        budget = max(self.max_tokens // 2, 1)
+        packs: list[tuple[Optional[str], list[int]]] = []
+        current: dict[str, tuple[list[int], int]] = {}
+        for index, (text, lang, tokens) in enumerate(
+            zip(texts, langs, self._estimate_tokens(texts))
+        ):
+            indices, pack_tokens = current.get(lang, ([], 0))
+            if indices and (
+                len(indices) >= max_segments or pack_tokens + tokens > budget
+            ):
+                packs.append((lang, indices))
+                indices, pack_tokens = [], 0
+            current[lang] = (indices + [index], pack_tokens + tokens)
+        packs.extend((lang, indices) for lang, (indices, _) in current.items())
+
+        logger.info(
+            f"Translating {len(texts)} texts in {len(packs)} packed requests"
+        )
+
+        def translate_pack(pack: tuple[Optional[str], list[int]]) -> list[str]:
+            lang, indices = pack
+            return self._translate_pack([texts[i] for i in indices], lang)
+
+        results: list[Optional[str]] = [None] * len(texts)
+        errors: dict[int, Exception] = {}
+        try:
+            outputs = self._run_concurrently(
+                translate_pack, packs, max_concurrency
+            )
+        except BatchTranslationError as e:
+            outputs = e.results
+            for pack_index, error in e.errors.items():
+                errors.update(dict.fromkeys(packs[pack_index][1], error))
+
+        for (_, indices), output in zip(packs, outputs):
+            if output is not None:
+                for index, translation in zip(indices, output):
+                    results[index] = translation
+
+        if errors:
+            raise BatchTranslationError(errors, results)
+
+        return results
+
+    def _estimate_tokens(self, texts: list[str]) -> list[int]:
+        """
+        Estimates the number of tokens of each text without calling the provider.
+
+        Latin-script characters are counted as `1 / CHARS_PER_TOKEN` tokens, other
+        characters (e.g. CJK) as one token each, since they rarely share a token.
+        Args:
+            texts (list[str]): The texts to measure.
+        Returns:
+            list[int]: The estimated number of tokens for each text.
+        """
+        estimates = []
+        for text in texts:
+            ascii_chars = sum(1 for char in text if char.isascii())
+            estimates.append(
+                math.ceil(
+                    ascii_chars / self.CHARS_PER_TOKEN
+                    + (len(text) - ascii_chars)
+                )
+            )
+        return estimates
+
+    def translate_document(
+        self,
+        text: str,
+        max_chunk_tokens: Optional[int] = None,
+        max_concurrency: int = 8,
+    ) -> str:
+        """
+        Translates a long text as several smaller requests sent concurrently.
+
+        The text is split at paragraph boundaries (blank lines) into chunks whose
+        estimated size fits `max_chunk_tokens`. Paragraphs that fit together share a
+        chunk, paragraphs that are too long are split at sentence boundaries. The
+        source language is detected once for the whole text. The translated chunks
+        are joined in order with the original paragraph breaks.
+
+        Args:
+            text (str): The text to be translated.
+            max_chunk_tokens (Optional[int]): The maximum estimated number of input tokens
+                per chunk. Defaults to half of `max_tokens`, which leaves room for
+                translations that are longer than their source.
+            max_concurrency (int): The maximum number of concurrent requests. Defaults to 8.
+
+        Returns:
+            str: The translated text.
+
+        Raises:
+            ValueError: If the text, max_chunk_tokens or max_concurrency is invalid.
+            BatchTranslationError: If one or more chunks fail. The errors and results
+                are indexed by chunk.
+        """
+        self._validate_basic_text_to_translate(text)
+        self._validate_max_concurrency(max_concurrency)
+
+        if max_chunk_tokens is None:
+            max_chunk_tokens = max(self.max_tokens // 2, 1)
+        if not isinstance(max_chunk_tokens, int) or max_chunk_tokens <= 0:
+            raise ValueError("max_chunk_tokens must be a positive integer.")
+
+        source_lang = self.source_lang or self.detect_language(text)
+        chunked = ChunkedText.split(
+            text,
+            max_chunk_tokens,
+            self._estimate_tokens,
+            paragraph_pattern=PARAGRAPH_BREAK_PATTERN,
+            merge_paragraphs=True,
+        )
+        logger.info(
+            f"Translating document in {len(chunked)} chunks of at most ~{max_chunk_tokens} tokens"
+        )
+
+        def translate_chunk(chunk: str) -> str:
+            return self._translate_text(chunk, source_lang)
+
+        translations = self._run_concurrently(
+            translate_chunk, chunked.chunks, max_concurrency
+        )
+        return chunked.join(translations)
+
+    async def atranslate(self, text: str) -> str:
+        """
+        Asynchronously translates the given text using the configured LLM.
+
+        Works like `translate`, but awaits the provider's async client instead of
+        blocking on the request.
+
+        Args:
+            text: The text to be translated.
+
+        Returns:
+            The translated text.
+
+        Raises:
+            ValueError: If input text validation fails, language detection fails
+                when required, or prompt rendering fails.
+        """
+        LLMTranslator._validate_basic_text_to_translate(text)
+
+        with measure(self, "atranslate"):
+            with stage("render"):
+                rendered_prompt = self._render_prompt(text_to_translate=text)
+
+            logger.debug(
+                f"LLM '{self.model_name}' ({self.__class__.__name__}) - "
+                f"Style '{self.prompt_style.name}' - Final Prompt: {rendered_prompt}"
+            )
+
+            raw_llm_output = await self._agenerate(rendered_prompt)
+            translated_text = self._process_response(raw_llm_output)
         logger.debug(
             f"LLM '{self.model_name}' - Post-processed translation: {translated_text}"
         )
 
         return translated_text
+
+    async def atranslate_batch(
+        self, texts: list, max_concurrency: int = 8
+    ) -> list:
+        """
+        Asynchronously translates a batch of texts with up to `max_concurrency`
+        requests in flight, bounded by a semaphore.
+
+        Args:
+            texts (list): A list of texts to be translated.
+            max_concurrency (int): The maximum number of concurrent requests. Defaults to 8.
+
+        Returns:
+            list: A list of translated texts, in the same order as the input.
+
+        Raises:
+            ValueError: If max_concurrency is invalid or any text is invalid.
+            BatchTranslationError: If one or more translations fail. It carries the
+                per-item errors and the translations that succeeded.
+        """
+        self._validate_max_concurrency(max_concurrency)
+        for text in texts:
+            self._validate_basic_text_to_translate(text)
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def translate_item(text: str) -> str:
+            async with semaphore:
+                return await self.atranslate(text)
+
+        outcomes = await asyncio.gather(
+            *(translate_item(text) for text in texts), return_exceptions=True
+        )
+
+        results: list[Optional[str]] = [None] * len(texts)
+        errors: dict[int, Exception] = {}
+        for index, outcome in enumerate(outcomes):
+            if isinstance(outcome, BaseException):
+                if not isinstance(outcome, Exception):
+                    raise outcome
+                logger.warning(
+                    f"Translation of batch item {index} failed: {outcome}"
+                )
+                errors[index] = outcome
+            else:
+                results[index] = outcome
+
+        if errors:
+            raise BatchTranslationError(errors, results)
+
+        return results
+
+    def submit_batch(
+        self, texts: list, manifest_path: Optional[Union[str, Path]] = None
+    ) -> BatchJob:
+        """
+        Submits texts to the provider's asynchronous batch API.
+
+        Bulk endpoints are cheaper and not subject to the per-request rate limits,
+        but results can take up to a day. The prompts are rendered like in
+        `translate`. The returned job is saved as a JSON manifest, so it can be
+        resumed later with `BatchJob.load`, `poll` and `collect`.
+
+        Args:
+            texts (list): A list of texts to be translated.
+            manifest_path (Optional[Union[str, Path]]): Where to save the job manifest.
+                Defaults to `<cache dir>/batch_jobs/<batch id>.json`.
+
+        Returns:
+            BatchJob: The submitted job.
+
+        Raises:
+            ValueError: If any text is invalid.
+            NotImplementedError: If the provider has no batch API.
+        """
+        for text in texts:
+            self._validate_basic_text_to_translate(text)
+
+        if self.source_lang is not None:
+            langs = [self.source_lang] * len(texts)
+        else:
+            langs = self.detect_languages(texts)
+
+        prompts = {
+            BatchJob.custom_id(index): self._render_prompt(text, lang)
+            for index, (text, lang) in enumerate(zip(texts, langs))
+        }
+        batch_id = self._submit_batch_requests(prompts)
+
+        job = BatchJob(
+            provider=self.__class__.__name__,
+            model_name=self.model_name,
+            batch_id=batch_id,
+            count=len(texts),
+            path=manifest_path or BATCH_JOBS_DIR / f"{batch_id}.json",
+        )
+        job.save()
+        logger.info(
+            f"Submitted batch {batch_id} with {len(texts)} texts, manifest: {job.path}"
+        )
+        return job
+
+    def _validate_batch_job(self, job: BatchJob):
+        """
+        Validates that a batch job was submitted by this kind of translator.
+        Args:
+            job (BatchJob): The job to validate.
+        Raises:
+            ValueError: If the job belongs to another provider.
+        """
+        if job.provider != self.__class__.__name__:
+            raise ValueError(
+                f"Batch job {job.batch_id} was submitted by {job.provider}, not {self.__class__.__name__}."
+            )
+
+    def poll(self, job: BatchJob) -> str:
+        """
+        Refreshes the status of a batch job and saves it to the manifest.
+
+        Args:
+            job (BatchJob): The job to poll.
+
+        Returns:
+            str: One of "in_progress", "completed" or "failed".
+
+        Raises:
+            ValueError: If the job belongs to another provider.
+        """
+        self._validate_batch_job(job)
+
+        status = self._get_batch_status(job.batch_id)
+        if status != job.status:
+            logger.info(f"Batch {job.batch_id} is now {status}")
+            job.status = status
+            job.save()
+        return status
+
+    def collect(self, job: BatchJob) -> list:
+        """
+        Downloads and post-processes the translations of a completed batch job.
+
+        Args:
+            job (BatchJob): The completed job.
+
+        Returns:
+            list: A list of translated texts, in the same order as the submitted texts.
+
+        Raises:
+            ValueError: If the job belongs to another provider.
+            RuntimeError: If the job has not completed.
+            BatchTranslationError: If one or more requests of the batch failed. It
+                carries the per-item errors and the translations that succeeded.
+        """
+        if self.poll(job) != BATCH_COMPLETED:
+            raise RuntimeError(
+                f"Batch {job.batch_id} is {job.status}, results can only be collected once it is completed."
+            )
+
+        raw_results = self._get_batch_results(job.batch_id)
+
+        results: list[Optional[str]] = [None] * job.count
+        errors: dict[int, Exception] = {}
+        for index, custom_id in enumerate(job.custom_ids):
+            raw = raw_results.get(custom_id)
+            if raw is None:
+                raw = RuntimeError(f"No result for {custom_id}.")
+            if isinstance(raw, Exception):
+                errors[index] = raw
+                continue
+            try:
+                results[index] = self._post_process(raw)
+            except Exception as e:
+                errors[index] = e
+
+        if errors:
+            raise BatchTranslationError(errors, results)
+
+        return results
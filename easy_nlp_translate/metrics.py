@@ -0,0 +1,366 @@
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+# Token counters of `RequestMetrics` that providers can report with `record_usage`.
+USAGE_FIELDS = (
+    "input_tokens",
+    "output_tokens",
+    "cache_read_tokens",
+    "cache_write_tokens",
+)
+
+
+class RequestMetrics:
+    """
+    The measurements of one translation call.
+
+    Stage timings are exclusive: time spent in a nested stage (e.g. "detect"
+    inside "render") is only counted for the nested stage, so the stages add up
+    to at most `duration`.
+
+    Attributes:
+        translator (str): The class name of the translator.
+        model_name (Optional[str]): The model of the translator, if it has one.
+        operation (str): The measured call, e.g. "translate" or "translate_batch".
+        items (int): The number of texts translated by the call.
+        stages (dict[str, float]): Seconds spent per stage, e.g. "detect", "render",
+            "rate_limit", "request" and "post_process" for LLMs or "tokenize",
+            "generate" and "decode" for Hugging Face models.
+        input_tokens (int): The prompt tokens reported by the provider or tokenizer.
+        output_tokens (int): The generated tokens.
+        cache_read_tokens (int): The prompt tokens read from the provider's prompt cache.
+        cache_write_tokens (int): The prompt tokens written to the provider's prompt cache.
+        cache_hits (int): The texts answered from the translation cache.
+        retries (int): The number of retried requests.
+        duration (float): The total seconds of the call.
+        error (Optional[str]): The exception class name if the call failed.
+    """
+
+    def __init__(
+        self,
+        translator: str,
+        model_name: Optional[str],
+        operation: str,
+        items: int = 1,
+    ):
+        self.translator = translator
+        self.model_name = model_name
+        self.operation = operation
+        self.items = items
+        self.stages: dict[str, float] = {}
+        self.input_tokens = 0
+        self.output_tokens = 0
+        self.cache_read_tokens = 0
+        self.cache_write_tokens = 0
+        self.cache_hits = 0
+        self.retries = 0
+        self.duration = 0.0
+        self.error: Optional[str] = None
+        self._nested: list[float] = []
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """
+        Times a stage of the call. Repeated stages add up.
+
+        Args:
+            name (str): The stage name.
+        """
+        start = time.perf_counter()
+        self._nested.append(0.0)
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            nested = self._nested.pop()
+            self.stages[name] = self.stages.get(name, 0.0) + elapsed - nested
+            if self._nested:
+                self._nested[-1] += elapsed
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Converts the measurements to a JSON-serializable dictionary.
+
+        Returns:
+            dict[str, Any]: All attributes listed in the class docstring.
+        """
+        return {
+            "translator": self.translator,
+            "model_name": self.model_name,
+            "operation": self.operation,
+            "items": self.items,
+            "stages": dict(self.stages),
+            **{field: getattr(self, field) for field in USAGE_FIELDS},
+            "cache_hits": self.cache_hits,
+            "retries": self.retries,
+            "duration": self.duration,
+            "error": self.error,
+        }
+
+
+MetricsHook = Callable[[RequestMetrics], None]
+
+_hooks: list[MetricsHook] = []
+_hooks_lock = threading.Lock()
+_current_metrics: ContextVar[Optional[RequestMetrics]] = ContextVar(
+    "easy_nlp_translate_metrics", default=None
+)
+_pending_cache_hits: ContextVar[Optional[list[int]]] = ContextVar(
+    "easy_nlp_translate_cache_hits", default=None
+)
+_pending_cache_hits_lock = threading.Lock()
+
+
+def add_metrics_hook(hook: MetricsHook) -> MetricsHook:
+    """
+    Registers a callback that receives the `RequestMetrics` of every translation call
+    in the process.
+
+    Hooks run in the thread that made the call, so they should return quickly.
+    Exceptions raised by a hook are logged and ignored.
+
+    Args:
+        hook (MetricsHook): The callback, e.g. `OpenTelemetryMetricsHook(meter)`.
+
+    Returns:
+        MetricsHook: The hook, so it can later be passed to `remove_metrics_hook`.
+    """
+    with _hooks_lock:
+        _hooks.append(hook)
+    return hook
+
+
+def remove_metrics_hook(hook: MetricsHook):
+    """
+    Unregisters a callback added with `add_metrics_hook`.
+
+    Args:
+        hook (MetricsHook): The callback to remove.
+
+    Raises:
+        ValueError: If the hook is not registered.
+    """
+    with _hooks_lock:
+        _hooks.remove(hook)
+
+
+def current_metrics() -> Optional[RequestMetrics]:
+    """
+    Returns the measurements of the call running in the current context, if any.
+    """
+    return _current_metrics.get()
+
+
+@contextmanager
+def measure(
+    translator: Any, operation: str, items: int = 1
+) -> Iterator[RequestMetrics]:
+    """
+    Measures a translation call and passes the result to the registered hooks.
+
+    Stages, usage and retries recorded with the module functions while the
+    block runs are attributed to this call.
+
+    Args:
+        translator (Any): The translator making the call.
+        operation (str): The name of the call.
+        items (int): The number of texts translated by the call. Defaults to 1.
+
+    Yields:
+        RequestMetrics: The measurements of the call.
+    """
+    metrics = RequestMetrics(
+        type(translator).__name__,
+        getattr(translator, "model_name", None)
+        or getattr(translator, "MODEL_NAME", None),
+        operation,
+        items,
+    )
+    metrics.cache_hits = _claim_cache_hits()
+    token = _current_metrics.set(metrics)
+    start = time.perf_counter()
+    try:
+        yield metrics
+    except GeneratorExit:
+        # A stream closed by its consumer before the end did not fail.
+        raise
+    except BaseException as e:
+        metrics.error = type(e).__name__
+        raise
+    finally:
+        metrics.duration = time.perf_counter() - start
+        _current_metrics.reset(token)
+        _emit(metrics)
+
+
+@contextmanager
+def attribute_cache_hits(count: int) -> Iterator[list[int]]:
+    """
+    Attributes translation cache hits to the first call measured in the block,
+    so a caching wrapper does not report a second measurement for the same request.
+
+    Args:
+        count (int): The number of texts answered from the translation cache.
+
+    Yields:
+        list[int]: A one-element list with the hits no measured call has claimed yet.
+    """
+    pending = [count]
+    token = _pending_cache_hits.set(pending)
+    try:
+        yield pending
+    finally:
+        _pending_cache_hits.reset(token)
+
+
+def _claim_cache_hits() -> int:
+    """
+    Takes the pending cache hits of the current context, see `attribute_cache_hits`.
+
+    Returns:
+        int: The cache hits, 0 if there are none or another call claimed them.
+    """
+    pending = _pending_cache_hits.get()
+    if pending is None:
+        return 0
+    with _pending_cache_hits_lock:
+        count, pending[0] = pending[0], 0
+    return count
+
+
+def _emit(metrics: RequestMetrics):
+    """
+    Passes finished measurements to every registered hook.
+
+    Args:
+        metrics (RequestMetrics): The measurements of a finished call.
+    """
+    with _hooks_lock:
+        hooks = list(_hooks)
+    for hook in hooks:
+        try:
+            hook(metrics)
+        except Exception as e:
+            logger.warning(f"Metrics hook {hook!r} failed: {e}")
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """
+    Times a stage of the current call. Does nothing outside of `measure`.
+
+    Args:
+        name (str): The stage name.
+    """
+    metrics = _current_metrics.get()
+    if metrics is None:
+        yield
+        return
+    with metrics.stage(name):
+        yield
+
+
+def record_usage(**usage: Optional[int]):
+    """
+    Adds token counts to the current call. Does nothing outside of `measure`.
+
+    Args:
+        **usage (Optional[int]): Counts for the fields in `USAGE_FIELDS`. None is
+            treated as 0.
+
+    Raises:
+        ValueError: If an unknown field is given.
+    """
+    metrics = _current_metrics.get()
+    if metrics is None:
+        return
+    for field, count in usage.items():
+        if field not in USAGE_FIELDS:
+            raise ValueError(f"Unknown usage field: {field}")
+        setattr(metrics, field, getattr(metrics, field) + (count or 0))
+
+
+def record_retry():
+    """
+    Counts a retried request for the current call. Does nothing outside of `measure`.
+    """
+    metrics = _current_metrics.get()
+    if metrics is not None:
+        metrics.retries += 1
+
+
+class OpenTelemetryMetricsHook:
+    """
+    A metrics hook that records measurements with an OpenTelemetry meter.
+
+    The meter is only used through `create_histogram` and `create_counter`, so
+    the package does not depend on OpenTelemetry itself. Every instrument gets the
+    attributes "translator", "model" and "operation", and failed calls also "error".
+
+    Example:
+        >>> from opentelemetry import metrics
+        >>> add_metrics_hook(OpenTelemetryMetricsHook(metrics.get_meter("easy_nlp_translate")))
+    """
+
+    def __init__(self, meter: Any, prefix: str = "easy_nlp_translate"):
+        """
+        Creates the instruments.
+
+        Args:
+            meter (Any): An `opentelemetry.metrics.Meter`.
+            prefix (str): The prefix of the instrument names. Defaults to "easy_nlp_translate".
+        """
+        self.duration = meter.create_histogram(
+            f"{prefix}.request.duration",
+            unit="s",
+            description="Duration of translation calls.",
+        )
+        self.stage_duration = meter.create_histogram(
+            f"{prefix}.stage.duration",
+            unit="s",
+            description="Duration of the stages of translation calls.",
+        )
+        self.requests = meter.create_counter(
+            f"{prefix}.requests", description="Number of translation calls."
+        )
+        self.tokens = meter.create_counter(
+            f"{prefix}.tokens", unit="{token}", description="Number of tokens."
+        )
+        self.cache_hits = meter.create_counter(
+            f"{prefix}.cache_hits",
+            description="Number of texts answered from the translation cache.",
+        )
+        self.retries = meter.create_counter(
+            f"{prefix}.retries", description="Number of retried requests."
+        )
+
+    def __call__(self, metrics: RequestMetrics):
+        attributes = {
+            "translator": metrics.translator,
+            "model": metrics.model_name or "",
+            "operation": metrics.operation,
+        }
+        if metrics.error is not None:
+            attributes["error"] = metrics.error
+
+        self.duration.record(metrics.duration, attributes)
+        self.requests.add(1, attributes)
+        for name, seconds in metrics.stages.items():
+            self.stage_duration.record(seconds, {**attributes, "stage": name})
+        for field in USAGE_FIELDS:
+            count = getattr(metrics, field)
+            if count:
+                self.tokens.add(
+                    count,
+                    {**attributes, "type": field.removesuffix("_tokens")},
+                )
+        if metrics.cache_hits:
+            self.cache_hits.add(metrics.cache_hits, attributes)
+        if metrics.retries:
+            self.retries.add(metrics.retries, attributes)
@@ -0,0 +1,107 @@
+import logging
+import threading
+from typing import Any, Callable, Hashable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class _RegistryEntry:
+    """
+    A single registry slot holding a loaded value and its reference count.
+    """
+
+    def __init__(self):
+        self.value: Optional[Any] = None
+        self.refcount: int = 0
+        self.load_lock = threading.Lock()
+
+
+class SharedModelRegistry:
+    """
+    A process-wide, reference-counted registry for loaded models and tokenizers.
+
+    Translators acquire an entry by key and release it when they are done. The first
+    acquire for a key runs the loader, later ones reuse the loaded value. Once the last
+    holder releases the key, the entry is dropped so the objects can be garbage collected.
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty registry.
+        """
+        self._entries: dict[Hashable, _RegistryEntry] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """
+        Returns the value registered under `key`, loading it first if needed.
+
+        Every call increments the reference count of the key and must be paired
+        with a call to `release`.
+
+        Args:
+            key (Hashable): The key identifying the shared value.
+            loader (Callable[[], Any]): A function that loads the value if it is not registered yet.
+
+        Returns:
+            Any: The shared value.
+        """
+        with self._lock:
+            entry = self._entries.setdefault(key, _RegistryEntry())
+            entry.refcount += 1
+
+        with entry.load_lock:
+            if entry.value is None:
+                try:
+                    logger.info(f"Loading shared model for key {key}")
+                    entry.value = loader()
+                except Exception:
+                    self.release(key)
+                    raise
+            else:
+                logger.info(
+                    f"Reusing shared model for key {key} (users: {entry.refcount})"
+                )
+
+        return entry.value
+
+    def release(self, key: Hashable):
+        """
+        Decrements the reference count of `key` and drops the entry when it reaches zero.
+
+        Args:
+            key (Hashable): The key to release. Unknown keys are ignored.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return
+            entry.refcount -= 1
+            if entry.refcount <= 0:
+                del self._entries[key]
+                logger.info(f"Released shared model for key {key}")
+
+    def refcount(self, key: Hashable) -> int:
+        """
+        Returns the number of current users of `key`.
+
+        Args:
+            key (Hashable): The key to look up.
+
+        Returns:
+            int: The reference count, or 0 if the key is not registered.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry.refcount if entry is not None else 0
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+shared_model_registry = SharedModelRegistry()
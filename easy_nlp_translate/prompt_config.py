@@ -1,9 +1,44 @@
+import threading
 from enum import Enum as PyEnum
+from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import List, Optional
+
+from jinja2 import Environment, FileSystemLoader, Template
 
 _PROMPT_CONFIG_MODULE_DIR = Path(__file__).resolve().parent
 SHARED_LLM_PROMPT_TEMPLATES_DIR = _PROMPT_CONFIG_MODULE_DIR / "prompts"
+PACKED_SEGMENTS_TEMPLATE_PATH = (
+    SHARED_LLM_PROMPT_TEMPLATES_DIR / "packed_segments.jinja"
+)
+# Stands in for the text in the static part of a prompt, see `RenderedPrompt`.
+PROMPT_TEXT_PLACEHOLDER = "(the text in the <text_to_translate> tags below)"
+# Texts used to check that a template inserts the text verbatim, see `render_prompt`.
+_PROBE_TEXTS = ("\x00probe\x00", "\x00probe\n" + "x" * 4096 + "\nprobe\x00")
+
+_environments: dict[Path, Environment] = {}
+_environments_lock = threading.Lock()
+
+
+class RenderedPrompt(str):
+    """
+    A rendered prompt that also knows its static and dynamic parts.
+
+    The string value is the full prompt. `static` is the same template rendered
+    with `PROMPT_TEXT_PLACEHOLDER` instead of the text, i.e. the instructions and
+    language pair, which are identical for every text. `text` is the text to
+    translate. Providers that support prompt caching send the static part first
+    and the text after it, wrapped in `<text_to_translate>` tags.
+    """
+
+    static: str
+    text: str
+
+    def __new__(cls, prompt: str, static: str, text: str):
+        obj = super().__new__(cls, prompt)
+        obj.static = static
+        obj.text = text
+        return obj
 
 
 class PromptStyle(PyEnum):
@@ -72,3 +107,133 @@ class PromptStyle(PyEnum):
         Returns a list of all available prompt style codes.
         """
         return [member.value for member in cls]
+
+
+def get_prompt_environment(templates_dir: Path) -> Environment:
+    """
+    Returns the Jinja environment for a templates directory, shared by all translators.
+
+    The environment caches compiled templates, so every template file is read and
+    compiled once per process. Template files are not reloaded when they change.
+
+    Args:
+        templates_dir (Path): The directory containing the prompt templates.
+
+    Returns:
+        Environment: The shared Jinja environment.
+    """
+    templates_dir = Path(templates_dir).resolve()
+    with _environments_lock:
+        environment = _environments.get(templates_dir)
+        if environment is None:
+            environment = Environment(
+                loader=FileSystemLoader(templates_dir), auto_reload=False
+            )
+            _environments[templates_dir] = environment
+        return environment
+
+
+def load_prompt_template(prompt_path: Path) -> Template:
+    """
+    Returns the compiled template of a prompt file from the shared environment.
+
+    Args:
+        prompt_path (Path): The path to the prompt template file.
+
+    Returns:
+        Template: The compiled Jinja template.
+    """
+    prompt_path = Path(prompt_path)
+    return get_prompt_environment(prompt_path.parent).get_template(
+        prompt_path.name
+    )
+
+
+def preload_prompt_templates(
+    templates_dir: Path = SHARED_LLM_PROMPT_TEMPLATES_DIR,
+) -> list[Template]:
+    """
+    Compiles the templates of all prompt styles and the packed segments template,
+    e.g. at service start, so the first translators do not pay for it.
+
+    Args:
+        templates_dir (Path): The directory containing the prompt templates.
+            Defaults to the templates shipped with the package.
+
+    Returns:
+        list[Template]: The compiled templates.
+    """
+    templates = [
+        load_prompt_template(Path(templates_dir) / style.template_filename)
+        for style in PromptStyle
+    ]
+    if Path(templates_dir).resolve() == SHARED_LLM_PROMPT_TEMPLATES_DIR:
+        templates.append(load_prompt_template(PACKED_SEGMENTS_TEMPLATE_PATH))
+    return templates
+
+
+@lru_cache(maxsize=1024)
+def _split_template(
+    template: Template, **template_kwargs: Optional[str]
+) -> tuple[str, Optional[tuple[str, str]]]:
+    """
+    Renders the static part of a prompt and the parts around the text.
+
+    Args:
+        template (Template): The prompt template.
+        **template_kwargs (Optional[str]): The template variables besides the text.
+
+    Returns:
+        tuple[str, Optional[tuple[str, str]]]: The static part and the text before and
+            after the text to translate, or None if the template does not insert
+            the text verbatim (e.g. it applies a filter to it).
+    """
+    static = template.render(
+        text_to_translate=PROMPT_TEXT_PLACEHOLDER, **template_kwargs
+    )
+    probe = template.render(
+        text_to_translate=_PROBE_TEXTS[0], **template_kwargs
+    )
+    if probe.count(_PROBE_TEXTS[0]) != 1:
+        return static, None
+
+    prefix, suffix = probe.split(_PROBE_TEXTS[0])
+    if any(
+        template.render(text_to_translate=text, **template_kwargs)
+        != prefix + text + suffix
+        for text in (PROMPT_TEXT_PLACEHOLDER, _PROBE_TEXTS[1])
+    ):
+        return static, None
+    return static, (prefix, suffix)
+
+
+def render_prompt(
+    template: Template,
+    text_to_translate: str,
+    **template_kwargs: Optional[str],
+) -> RenderedPrompt:
+    """
+    Renders a prompt template for a text.
+
+    The static part and the text around the text to translate are rendered once
+    per template and variables, so rendering a prompt for another text only
+    concatenates strings. Templates that do not insert the text verbatim are
+    rendered in full every time.
+
+    Args:
+        template (Template): The prompt template.
+        text_to_translate (str): The text to translate.
+        **template_kwargs (Optional[str]): The template variables besides the text,
+            e.g. the source and target language.
+
+    Returns:
+        RenderedPrompt: The rendered prompt with its static part and the text.
+    """
+    static, parts = _split_template(template, **template_kwargs)
+    if parts is None:
+        prompt = template.render(
+            text_to_translate=text_to_translate, **template_kwargs
+        )
+    else:
+        prompt = parts[0] + text_to_translate + parts[1]
+    return RenderedPrompt(prompt, static=static, text=text_to_translate)
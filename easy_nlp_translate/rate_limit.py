@@ -0,0 +1,302 @@
+import asyncio
+import logging
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# HTTP status codes worth retrying: rate limits, server errors and overloads.
+RETRYABLE_STATUS_CODES = frozenset({408, 409, 429, 500, 502, 503, 504, 529})
+
+
+class TokenBucket:
+    """
+    A thread-safe token bucket refilled continuously at `rate_per_minute`.
+
+    Callers reserve capacity and are told how long to wait for it, so the
+    bucket can be shared by threads and event loops alike.
+    """
+
+    def __init__(
+        self, rate_per_minute: float, capacity: Optional[float] = None
+    ):
+        """
+        Initializes a full bucket.
+
+        Args:
+            rate_per_minute (float): The number of units added per minute.
+            capacity (Optional[float]): The maximum number of stored units, i.e. the
+                largest burst. Defaults to `rate_per_minute`.
+
+        Raises:
+            ValueError: If rate_per_minute or capacity is not positive.
+        """
+        if rate_per_minute <= 0:
+            raise ValueError("rate_per_minute must be a positive number.")
+        if capacity is not None and capacity <= 0:
+            raise ValueError("capacity must be a positive number.")
+
+        self.rate = rate_per_minute / 60.0
+        self.capacity = capacity if capacity is not None else rate_per_minute
+        self._level = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, amount: float = 1.0) -> float:
+        """
+        Takes `amount` units from the bucket, going into debt if needed.
+
+        Args:
+            amount (float): The number of units to take. Defaults to 1.
+
+        Returns:
+            float: The number of seconds the caller has to wait before using the units.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._level = min(
+                self.capacity, self._level + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._level -= amount
+            return max(0.0, -self._level / self.rate)
+
+
+class RateLimiter:
+    """
+    A client-side limit on requests and tokens per minute for one provider.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+    ):
+        """
+        Initializes the rate limiter.
+
+        Args:
+            requests_per_minute (Optional[float]): The maximum number of requests per minute.
+                None means no limit. Defaults to None.
+            tokens_per_minute (Optional[float]): The maximum number of input and output
+                tokens per minute. None means no limit. Defaults to None.
+        """
+        self.requests = (
+            TokenBucket(requests_per_minute) if requests_per_minute else None
+        )
+        self.tokens = (
+            TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        )
+
+    def _reserve(self, tokens: int) -> float:
+        """
+        Reserves one request and `tokens` tokens.
+
+        Args:
+            tokens (int): The estimated number of tokens of the request.
+
+        Returns:
+            float: The number of seconds to wait before sending the request.
+        """
+        wait = 0.0
+        if self.requests is not None:
+            wait = max(wait, self.requests.reserve(1))
+        if self.tokens is not None:
+            wait = max(wait, self.tokens.reserve(tokens))
+        if wait > 0:
+            logger.debug(f"Rate limit reached, waiting {wait:.2f}s")
+        return wait
+
+    def acquire(self, tokens: int = 0):
+        """
+        Blocks until a request of `tokens` tokens may be sent.
+
+        Args:
+            tokens (int): The estimated number of tokens of the request. Defaults to 0.
+        """
+        wait = self._reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def aacquire(self, tokens: int = 0):
+        """
+        Waits asynchronously until a request of `tokens` tokens may be sent.
+
+        Args:
+            tokens (int): The estimated number of tokens of the request. Defaults to 0.
+        """
+        wait = self._reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+class RetryPolicy:
+    """
+    Exponential backoff with full jitter for rate-limit, server and connection errors.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 5,
+        base_delay: float = 1.0,
+        max_delay: float = 60.0,
+    ):
+        """
+        Initializes the retry policy.
+
+        Args:
+            max_retries (int): The maximum number of retries after the first attempt. Defaults to 5.
+            base_delay (float): The backoff ceiling of the first retry in seconds. Defaults to 1.
+            max_delay (float): The maximum backoff in seconds. Defaults to 60.
+
+        Raises:
+            ValueError: If max_retries is negative or a delay is not positive.
+        """
+        if not isinstance(max_retries, int) or max_retries < 0:
+            raise ValueError("max_retries must be a non-negative integer.")
+        if base_delay <= 0 or max_delay <= 0:
+            raise ValueError("base_delay and max_delay must be positive.")
+
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    @staticmethod
+    def _status_code(error: Exception) -> Optional[int]:
+        """
+        Extracts the HTTP status code from a provider SDK exception.
+
+        Args:
+            error (Exception): The exception raised by the SDK.
+
+        Returns:
+            Optional[int]: The status code, or None if the error has none.
+        """
+        for attribute in ("status_code", "code"):
+            status = getattr(error, attribute, None)
+            if isinstance(status, int):
+                return status
+        return None
+
+    @staticmethod
+    def retry_after(error: Exception) -> Optional[float]:
+        """
+        Reads the Retry-After header of the response attached to an SDK exception.
+
+        Args:
+            error (Exception): The exception raised by the SDK.
+
+        Returns:
+            Optional[float]: The number of seconds the server asked to wait, if any.
+        """
+        headers = getattr(getattr(error, "response", None), "headers", None)
+        if not headers:
+            return None
+
+        retry_after_ms = headers.get("retry-after-ms")
+        if retry_after_ms:
+            try:
+                return float(retry_after_ms) / 1000
+            except ValueError:
+                pass
+
+        retry_after = headers.get("retry-after")
+        if not retry_after:
+            return None
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+        try:
+            return max(
+                0.0,
+                parsedate_to_datetime(retry_after).timestamp() - time.time(),
+            )
+        except (TypeError, ValueError):
+            return None
+
+    def is_retryable(self, error: Exception) -> bool:
+        """
+        Decides whether a failed request should be retried.
+
+        Args:
+            error (Exception): The exception raised by the SDK.
+
+        Returns:
+            bool: True for rate-limit, overload, server, timeout and connection errors.
+        """
+        status = self._status_code(error)
+        if status is not None:
+            return status in RETRYABLE_STATUS_CODES
+        return isinstance(error, (ConnectionError, TimeoutError)) or type(
+            error
+        ).__name__.endswith(("ConnectionError", "TimeoutError"))
+
+    def delay(self, attempt: int, error: Exception) -> float:
+        """
+        Computes the wait before the next attempt.
+
+        Args:
+            attempt (int): The number of the failed attempt, starting at 0.
+            error (Exception): The exception of the failed attempt.
+
+        Returns:
+            float: A random backoff up to the exponential ceiling, or the server's
+                Retry-After if that is longer.
+        """
+        ceiling = min(self.max_delay, self.base_delay * 2**attempt)
+        backoff = random.uniform(0, ceiling)
+        retry_after = self.retry_after(error)
+        if retry_after is not None:
+            return max(backoff, min(retry_after, self.max_delay))
+        return backoff
+
+
+_rate_limiters: dict[str, RateLimiter] = {}
+_rate_limiters_lock = threading.Lock()
+
+
+def configure_rate_limit(
+    provider: str,
+    requests_per_minute: Optional[float] = None,
+    tokens_per_minute: Optional[float] = None,
+) -> RateLimiter:
+    """
+    Sets the client-side rate limit of a provider for all translators in the process.
+
+    Args:
+        provider (str): The provider name, e.g. "openai", "anthropic", "gemini" or "ollama".
+        requests_per_minute (Optional[float]): The maximum number of requests per minute.
+            None means no limit. Defaults to None.
+        tokens_per_minute (Optional[float]): The maximum number of tokens per minute.
+            None means no limit. Defaults to None.
+
+    Returns:
+        RateLimiter: The new rate limiter of the provider.
+    """
+    limiter = RateLimiter(requests_per_minute, tokens_per_minute)
+    with _rate_limiters_lock:
+        _rate_limiters[provider] = limiter
+    logger.info(
+        f"Rate limit for {provider}: {requests_per_minute} requests/min, {tokens_per_minute} tokens/min"
+    )
+    return limiter
+
+
+def get_rate_limiter(provider: str) -> RateLimiter:
+    """
+    Returns the shared rate limiter of a provider, unlimited until configured.
+
+    Args:
+        provider (str): The provider name.
+
+    Returns:
+        RateLimiter: The provider's rate limiter.
+    """
+    with _rate_limiters_lock:
+        if provider not in _rate_limiters:
+            _rate_limiters[provider] = RateLimiter()
+        return _rate_limiters[provider]
@@ -0,0 +1,461 @@
+import bisect
+import contextvars
+import logging
+import math
+import threading
+import time
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+from typing import Optional
+
+from .exceptions import BatchTranslationError, RoutingError
+from .translator_base import TranslatorBase
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds of the latency buckets in seconds. Failures land in the last, unbounded bucket.
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0, 60.0)
+
+
+class LatencyHistogram:
+    """
+    A thread-safe latency histogram with exponential decay.
+
+    Once more than `window` observations are stored, all counts are halved,
+    so the histogram follows recent behaviour of a backend.
+    """
+
+    def __init__(self, window: int = 200):
+        """
+        Initializes an empty histogram.
+
+        Args:
+            window (int): The number of observations after which old counts are halved.
+                Defaults to 200.
+
+        Raises:
+            ValueError: If window is not a positive integer.
+        """
+        if not isinstance(window, int) or window <= 0:
+            raise ValueError("window must be a positive integer.")
+
+        self.window = window
+        self.counts = [0.0] * (len(LATENCY_BUCKETS) + 1)
+        self.failures = 0
+        self._lock = threading.Lock()
+
+    @property
+    def count(self) -> float:
+        """
+        The decayed number of observations.
+        """
+        return sum(self.counts)
+
+    def record(self, seconds: float):
+        """
+        Records the latency of a successful request.
+
+        Args:
+            seconds (float): The latency in seconds.
+        """
+        self._add(bisect.bisect_left(LATENCY_BUCKETS, seconds))
+
+    def record_failure(self):
+        """
+        Records a failed request as an unbounded latency.
+        """
+        with self._lock:
+            self.failures += 1
+        self._add(len(LATENCY_BUCKETS))
+
+    def _add(self, bucket: int):
+        with self._lock:
+            self.counts[bucket] += 1
+            if sum(self.counts) > self.window:
+                self.counts = [count / 2 for count in self.counts]
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimates a latency quantile as the upper bound of its bucket.
+
+        Args:
+            q (float): The quantile between 0 and 1, e.g. 0.95.
+
+        Returns:
+            Optional[float]: The latency in seconds, `math.inf` if the quantile falls
+                into the failure bucket, or None if nothing was recorded yet.
+        """
+        with self._lock:
+            total = sum(self.counts)
+            if not total:
+                return None
+            cumulative = 0.0
+            for bound, count in zip(
+                LATENCY_BUCKETS + (math.inf,), self.counts
+            ):
+                cumulative += count
+                if cumulative >= q * total:
+                    return bound
+            return math.inf
+
+
+class RouterTranslator(TranslatorBase):
+    """
+    Routes translations over an ordered list of translators, e.g. Claude, then GPT,
+    then a local Ollama model.
+
+    A request goes to the first backend. If it has not answered after `hedge_after`
+    seconds, a hedged duplicate is sent to the next backend, and the first success
+    wins. Failed backends are skipped right away. Latencies of every backend are
+    tracked in histograms, and with `reorder` the backends are tried in order of
+    their observed tail latency.
+    """
+
+    def __init__(
+        self,
+        translators: list[TranslatorBase],
+        hedge_after: Optional[float] = 2.0,
+        timeout: Optional[float] = None,
+        reorder: bool = True,
+        latency_quantile: float = 0.95,
+        min_samples: int = 5,
+        max_workers: int = 32,
+    ):
+        """
+        Initializes the router.
+
+        Args:
+            translators (list[TranslatorBase]): The backends in order of preference. They
+                must share the target and source language.
+            hedge_after (Optional[float]): The latency budget in seconds after which the
+                next backend is tried in parallel. None disables hedging, so the next
+                backend is only tried after an error. Defaults to 2.
+            timeout (Optional[float]): The maximum number of seconds to wait for a
+                translation. None means no limit. Defaults to None.
+            reorder (bool): Whether to try the backends in order of their observed
+                `latency_quantile`. Defaults to True.
+            latency_quantile (float): The latency quantile used to rank backends.
+                Defaults to 0.95.
+            min_samples (int): The number of observations a backend needs before its
+                latency is used for ranking. Until then, it is assumed to answer
+                within `hedge_after`. Defaults to 5.
+            max_workers (int): The maximum number of backend requests in flight.
+                Defaults to 32.
+
+        Raises:
+            ValueError: If no translators are given, the language pairs differ or a
+                setting is invalid.
+        """
+        if not translators:
+            raise ValueError("At least one translator is required.")
+        if any(
+            translator.target_lang != translators[0].target_lang
+            or translator.source_lang != translators[0].source_lang
+            for translator in translators
+        ):
+            raise ValueError(
+                "All translators must have the same source and target language."
+            )
+        for name, value in (
+            ("hedge_after", hedge_after),
+            ("timeout", timeout),
+        ):
+            if value is not None and value <= 0:
+                raise ValueError(
+                    f"{name} must be a positive number of seconds."
+                )
+        if not 0 < latency_quantile <= 1:
+            raise ValueError("latency_quantile must be between 0 and 1.")
+        if not isinstance(min_samples, int) or min_samples <= 0:
+            raise ValueError("min_samples must be a positive integer.")
+        if not isinstance(max_workers, int) or max_workers <= 0:
+            raise ValueError("max_workers must be a positive integer.")
+
+        self.translators = list(translators)
+        self.hedge_after = hedge_after
+        self.timeout = timeout
+        self.reorder = reorder
+        self.latency_quantile = latency_quantile
+        self.min_samples = min_samples
+        self.histograms = [LatencyHistogram() for _ in self.translators]
+        self.LANGUAGE_CODES = [
+            code
+            for code in translators[0].LANGUAGE_CODES
+            if all(
+                code in translator.LANGUAGE_CODES for translator in translators
+            )
+        ]
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix=f"{self.__class__.__name__}-backend",
+        )
+
+        super().__init__(
+            translators[0].target_lang, translators[0].source_lang
+        )
+
+    def _backend_name(self, index: int) -> str:
+        """
+        Returns a unique name of a backend, also if several backends use the same model.
+
+        Args:
+            index (int): The position of the backend in `translators`.
+
+        Returns:
+            str: The name as "{index}:{provider}:{model_name}".
+        """
+        translator = self.translators[index]
+        provider = (
+            getattr(translator, "PROVIDER_NAME", None)
+            or type(translator).__name__
+        )
+        model_name = getattr(translator, "model_name", None) or getattr(
+            translator, "MODEL_NAME", None
+        )
+        return f"{index}:{provider}:{model_name}"
+
+    def _score(self, index: int) -> float:
+        """
+        Returns the ranking latency of a backend.
+
+        Args:
+            index (int): The position of the backend in `translators`.
+
+        Returns:
+            float: The observed latency quantile, or `hedge_after` (infinity without
+                hedging) while the backend has fewer than `min_samples` observations.
+        """
+        histogram = self.histograms[index]
+        if histogram.count < self.min_samples:
+            return (
+                self.hedge_after if self.hedge_after is not None else math.inf
+            )
+        return histogram.quantile(self.latency_quantile)
+
+    def backend_order(self) -> list[int]:
+        """
+        Returns the order in which the backends are tried.
+
+        Returns:
+            list[int]: Positions in `translators`, fastest first if `reorder` is set.
+                Ties keep the configured order.
+        """
+        indices = list(range(len(self.translators)))
+        if not self.reorder:
+            return indices
+        return sorted(indices, key=lambda index: (self._score(index), index))
+
+    def _call_backend(self, index: int, text: str) -> str:
+        """
+        Translates with one backend and records its latency or failure.
+
+        Args:
+            index (int): The position of the backend in `translators`.
+            text (str): The text to translate.
+
+        Returns:
+            str: The translation.
+        """
+        start = time.perf_counter()
+        try:
+            result = self.translators[index].translate(text)
+        except Exception:
+            self.histograms[index].record_failure()
+            raise
+        self.histograms[index].record(time.perf_counter() - start)
+        return result
+
+    def translate(self, text: str) -> str:
+        """
+        Translates a text with the first backend that succeeds, hedging slow
+        requests and failing over on errors.
+
+        Args:
+            text (str): The text to be translated.
+
+        Returns:
+            str: The translated text.
+
+        Raises:
+            ValueError: If the text is invalid.
+            RoutingError: If every backend failed or the timeout was reached.
+        """
+        self._validate_basic_text_to_translate(text)
+
+        order = self.backend_order()
+        deadline = (
+            time.monotonic() + self.timeout
+            if self.timeout is not None
+            else None
+        )
+        pending: dict[Future, int] = {}
+        errors: dict[str, Exception] = {}
+        next_backend = 0
+        start_next = True
+
+        while pending or next_backend < len(order):
+            if start_next and next_backend < len(order):
+                # First request, or failover after an error.
+                start_next = False
+                index = order[next_backend]
+                next_backend += 1
+                pending[
+                    self._executor.submit(
+                        contextvars.copy_context().run,
+                        self._call_backend,
+                        index,
+                        text,
+                    )
+                ] = index
+
+            remaining = (
+                deadline - time.monotonic() if deadline is not None else None
+            )
+            if remaining is not None and remaining <= 0:
+                break
+            wait_for = remaining
+            if self.hedge_after is not None and next_backend < len(order):
+                wait_for = (
+                    self.hedge_after
+                    if remaining is None
+                    else min(self.hedge_after, remaining)
+                )
+
+            done, _ = wait(
+                pending, timeout=wait_for, return_when=FIRST_COMPLETED
+            )
+            if not done:
+                if next_backend < len(order) and (
+                    remaining is None or wait_for < remaining
+                ):
+                    index = order[next_backend]
+                    next_backend += 1
+                    logger.info(
+                        f"No answer within {self.hedge_after}s, hedging with "
+                        f"{self._backend_name(index)}"
+                    )
+                    pending[
+                        self._executor.submit(
+                            contextvars.copy_context().run,
+                            self._call_backend,
+                            index,
+                            text,
+                        )
+                    ] = index
+                continue
+
+            for future in done:
+                index = pending.pop(future)
+                name = self._backend_name(index)
+                try:
+                    return future.result()
+                except Exception as e:
+                    logger.warning(f"Backend {name} failed: {e}")
+                    errors[name] = e
+                    start_next = True
+
+        if pending:
+            for future in pending:
+                future.cancel()
+            raise RoutingError(
+                errors, f"No translation within {self.timeout}s"
+            )
+        raise RoutingError(errors)
+
+    def translate_batch(self, texts: list, max_concurrency: int = 8) -> list:
+        """
+        Translates a batch of texts, routing every text on its own.
+
+        Args:
+            texts (list): A list of texts to be translated.
+            max_concurrency (int): The maximum number of texts routed at the same time.
+                Defaults to 8.
+
+        Returns:
+            list: A list of translated texts, in the same order as the input.
+
+        Raises:
+            ValueError: If max_concurrency is invalid or any text is invalid.
+            BatchTranslationError: If one or more translations fail.
+        """
+        if not isinstance(max_concurrency, int) or max_concurrency <= 0:
+            raise ValueError("max_concurrency must be a positive integer.")
+        for text in texts:
+            self._validate_basic_text_to_translate(text)
+
+        results: list[Optional[str]] = [None] * len(texts)
+        errors: dict[int, Exception] = {}
+        if not texts:
+            return results
+
+        with ThreadPoolExecutor(
+            max_workers=min(max_concurrency, len(texts)),
+            thread_name_prefix=f"{self.__class__.__name__}-batch",
+        ) as executor:
+            futures = [
+                executor.submit(
+                    contextvars.copy_context().run, self.translate, text
+                )
+                for text in texts
+            ]
+            for index, future in enumerate(futures):
+                try:
+                    results[index] = future.result()
+                except Exception as e:
+                    logger.warning(
+                        f"Translation of batch item {index} failed: {e}"
+                    )
+                    errors[index] = e
+
+        if errors:
+            raise BatchTranslationError(errors, results)
+
+        return results
+
+    @property
+    def latency_stats(self) -> list[dict]:
+        """
+        The observed latencies of the backends, in configured order.
+
+        Returns:
+            list[dict]: The backend name, the decayed number of observations, the
+                number of failures and the estimated p50 and p95 latency in seconds.
+        """
+        return [
+            {
+                "backend": self._backend_name(index),
+                "count": histogram.count,
+                "failures": histogram.failures,
+                "p50": histogram.quantile(0.5),
+                "p95": histogram.quantile(0.95),
+            }
+            for index, histogram in enumerate(self.histograms)
+        ]
+
+    def _get_cache_params(self) -> dict:
+        """
+        Returns the backends and their output-relevant settings for cache keys.
+
+        Returns:
+            dict: The settings of every backend, in configured order.
+        """
+        return {
+            "backends": [
+                {
+                    "translator": type(translator).__qualname__,
+                    **translator._get_cache_params(),
+                }
+                for translator in self.translators
+            ]
+        }
+
+    def close(self):
+        """
+        Shuts down the backend thread pool without waiting for hedged requests
+        that lost the race.
+        """
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,234 @@
+import logging
+import re
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+# Whitespace containing a line break separates lines, a blank line separates paragraphs.
+LINE_BREAK_PATTERN = r"\s*\n\s*"
+PARAGRAPH_BREAK_PATTERN = r"\s*\n\s*\n\s*"
+
+_SENTENCE_BREAK = re.compile(r"(?<=[.!?;:。！？；])(\s+)")
+_WORD_BREAK = re.compile(r"(\s+)")
+
+
+class ChunkedText:
+    """
+    A text split into chunks that fit a token budget, together with the
+    whitespace between them.
+
+    The original text is `separators[0] + chunks[0] + separators[1] + ... + chunks[-1] + separators[-1]`,
+    so translated chunks can be put back together with the original whitespace and line breaks.
+    """
+
+    def __init__(self, chunks: list[str], separators: list[str]):
+        """
+        Initializes the chunked text.
+
+        Args:
+            chunks (list[str]): The chunks to translate.
+            separators (list[str]): The whitespace around the chunks. Must have one
+                element more than `chunks`.
+
+        Raises:
+            ValueError: If the number of separators does not match the number of chunks.
+        """
+        if len(separators) != len(chunks) + 1:
+            raise ValueError(
+                "There must be exactly one separator more than chunks."
+            )
+        self.chunks = chunks
+        self.separators = separators
+
+    def __len__(self) -> int:
+        return len(self.chunks)
+
+    def join(self, translations: list[str]) -> str:
+        """
+        Reassembles translated chunks with the original separators.
+
+        Args:
+            translations (list[str]): One translation per chunk, in chunk order.
+
+        Returns:
+            str: The reassembled text.
+
+        Raises:
+            ValueError: If the number of translations does not match the number of chunks.
+        """
+        if len(translations) != len(self.chunks):
+            raise ValueError(
+                f"Expected {len(self.chunks)} translations, got {len(translations)}."
+            )
+        return self.separators[0] + "".join(
+            translation + separator
+            for translation, separator in zip(
+                translations, self.separators[1:]
+            )
+        )
+
+    @classmethod
+    def split(
+        cls,
+        text: str,
+        max_tokens: int,
+        count_tokens: Callable[[list[str]], list[int]],
+        paragraph_pattern: str = LINE_BREAK_PATTERN,
+        merge_paragraphs: bool = False,
+    ) -> "ChunkedText":
+        """
+        Splits a text into chunks of at most `max_tokens` tokens.
+
+        The text is first split into paragraphs at `paragraph_pattern`, then into
+        sentences. Consecutive sentences of a paragraph are packed greedily into
+        chunks. Sentences longer than the budget are split between words, and a
+        single word longer than the budget becomes a chunk of its own. The size of
+        a chunk is estimated as the sum of the token counts of its pieces.
+
+        Args:
+            text (str): The text to split.
+            max_tokens (int): The maximum number of tokens per chunk.
+            count_tokens (Callable[[list[str]], list[int]]): Returns the number of tokens
+                of each given text.
+            paragraph_pattern (str): The regular expression separating paragraphs.
+                Defaults to any line break.
+            merge_paragraphs (bool): Whether consecutive paragraphs may share a chunk
+                if they fit the budget together. The paragraph separator is then kept
+                inside the chunk. Defaults to False.
+
+        Returns:
+            ChunkedText: The chunks and the whitespace between them.
+
+        Raises:
+            ValueError: If max_tokens is not a positive integer.
+        """
+        if not isinstance(max_tokens, int) or max_tokens <= 0:
+            raise ValueError("max_tokens must be a positive integer.")
+
+        body = text.strip()
+        leading = text[: len(text) - len(text.lstrip())]
+        trailing = text[len(text.rstrip()) :] if body else ""
+        if not body:
+            return cls([], [text])
+
+        parts = re.split(f"({paragraph_pattern})", body)
+        paragraphs, paragraph_breaks = parts[::2], parts[1::2]
+
+        # (chunk, tokens, separator after the chunk, whether that separator is a paragraph break)
+        pieces: list[tuple[str, int, str, bool]] = []
+        for number, paragraph in enumerate(paragraphs):
+            paragraph_chunks = cls._pack(
+                _SENTENCE_BREAK.split(paragraph), max_tokens, count_tokens
+            )
+            for chunk, tokens, separator in paragraph_chunks[:-1]:
+                pieces.append((chunk, tokens, separator, False))
+            chunk, tokens, _ = paragraph_chunks[-1]
+            if number < len(paragraph_breaks):
+                pieces.append((chunk, tokens, paragraph_breaks[number], True))
+            else:
+                pieces.append((chunk, tokens, trailing, False))
+
+        if merge_paragraphs:
+            pieces = cls._merge_paragraphs(pieces, max_tokens)
+
+        chunked = cls(
+            [chunk for chunk, _, _, _ in pieces],
+            [leading] + [separator for _, _, separator, _ in pieces],
+        )
+        logger.debug(f"Split text into {len(chunked)} chunks")
+        return chunked
+
+    @staticmethod
+    def _pack(
+        parts: list[str],
+        max_tokens: int,
+        count_tokens: Callable[[list[str]], list[int]],
+    ) -> list[tuple[str, int, str]]:
+        """
+        Greedily packs the sentences of a paragraph into chunks.
+
+        Args:
+            parts (list[str]): Sentences at even and the whitespace between them at odd positions.
+            max_tokens (int): The maximum number of tokens per chunk.
+            count_tokens (Callable[[list[str]], list[int]]): The token counting function.
+
+        Returns:
+            list[tuple[str, int, str]]: The chunks with their estimated token counts and
+                the whitespace following them. The whitespace after the last chunk is empty.
+        """
+        sentences, separators = parts[::2], parts[1::2] + [""]
+
+        # (text, tokens, whitespace after the text)
+        atoms: list[tuple[str, int, str]] = []
+        for sentence, separator, tokens in zip(
+            sentences, separators, count_tokens(sentences)
+        ):
+            words = _WORD_BREAK.split(sentence)
+            if tokens <= max_tokens or len(words) == 1:
+                atoms.append((sentence, tokens, separator))
+                continue
+            word_separators = words[1::2] + [separator]
+            atoms.extend(
+                zip(words[::2], count_tokens(words[::2]), word_separators)
+            )
+
+        chunks: list[tuple[str, int, str]] = []
+        current: list[tuple[str, int, str]] = []
+        current_tokens = 0
+        for atom in atoms:
+            if current and current_tokens + atom[1] > max_tokens:
+                chunks.append(ChunkedText._join_atoms(current))
+                current, current_tokens = [], 0
+            current.append(atom)
+            current_tokens += atom[1]
+        chunks.append(ChunkedText._join_atoms(current))
+
+        return chunks
+
+    @staticmethod
+    def _join_atoms(atoms: list[tuple[str, int, str]]) -> tuple[str, int, str]:
+        """
+        Joins consecutive atoms into one chunk.
+
+        Args:
+            atoms (list[tuple[str, int, str]]): The atoms with token counts and following whitespace.
+
+        Returns:
+            tuple[str, int, str]: The chunk, its token count and the whitespace following it.
+        """
+        text = "".join(unit + separator for unit, _, separator in atoms[:-1])
+        last_unit, _, last_separator = atoms[-1]
+        return (
+            text + last_unit,
+            sum(tokens for _, tokens, _ in atoms),
+            last_separator,
+        )
+
+    @staticmethod
+    def _merge_paragraphs(
+        pieces: list[tuple[str, int, str, bool]], max_tokens: int
+    ) -> list[tuple[str, int, str, bool]]:
+        """
+        Merges consecutive chunks across paragraph breaks while they fit the budget.
+
+        Args:
+            pieces (list[tuple[str, int, str, bool]]): The chunks with token counts,
+                following separators and paragraph break flags.
+            max_tokens (int): The maximum number of tokens per chunk.
+
+        Returns:
+            list[tuple[str, int, str, bool]]: The merged chunks.
+        """
+        merged = [pieces[0]]
+        for chunk, tokens, separator, is_break in pieces[1:]:
+            last_chunk, last_tokens, last_separator, last_is_break = merged[-1]
+            if last_is_break and last_tokens + tokens <= max_tokens:
+                merged[-1] = (
+                    last_chunk + last_separator + chunk,
+                    last_tokens + tokens,
+                    separator,
+                    is_break,
+                )
+            else:
+                merged.append((chunk, tokens, separator, is_break))
+        return merged
@@ -2,10 +2,15 @@ import logging
 from abc import ABC, abstractmethod
 from typing import Optional
 
-from langdetect import detect
-
 from .config import available_language_codes
 from .exceptions import DetectionError
+from .metrics import stage
+from .language_detection import (
+    DetectionCache,
+    LanguageDetector,
+    default_language_detector,
+    detection_cache,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -24,11 +29,17 @@ class TranslatorBase(ABC):
         source_lang (Optional[str]): The source language code for translation.
             If None, auto-detection is typically attempted.
         target_lang (str): The target language code for translation.
+        language_detector (LanguageDetector): The backend used for language detection.
+            Defaults to a seeded langdetect backend.
+        detection_cache (DetectionCache): The LRU cache for detected languages.
+            Shared by all translators in the process by default.
     """
 
     LANGUAGE_CODES: list[str] = (
         available_language_codes  # needs to be overwritten in smaller huggingface model classes
     )
+    language_detector: LanguageDetector = default_language_detector
+    detection_cache: DetectionCache = detection_cache
 
     def __init__(self, target_lang: str, source_lang: Optional[str] = None):
         """
@@ -70,7 +81,10 @@ class TranslatorBase(ABC):
 
     def detect_language(self, text: str) -> str:
         """
-        Detects the language of the given text using langdetect.
+        Detects the language of the given text using `language_detector`.
+
+        Results are memoized in `detection_cache`, so repeated texts are only
+        detected once.
 
         Args:
             text: The text whose language is to be detected.
@@ -80,22 +94,66 @@ class TranslatorBase(ABC):
 
         Raises:
             ValueError: If the text is empty or invalid for detection.
-            LangDetectException: If language detection by the `langdetect`
-                library fails for other reasons (e.g., text too short, no features).
+            DetectionError: If language detection by the backend fails
+                (e.g., text too short, no features).
             ValueError: If the detected language is not in `self.LANGUAGE_CODES`.
         """
-        TranslatorBase._validate_basic_text_to_translate(text)
+        return self.detect_languages([text])[0]
+
+    def detect_languages(self, texts: list[str]) -> list[str]:
+        """
+        Detects the languages of many texts in one pass.
+
+        Cached texts are answered from `detection_cache`, the remaining texts are
+        scored together with `language_detector.detect_batch`.
 
-        try:
-            lang = detect(text)
-        except Exception as e:
-            raise DetectionError(
-                f"Language detection failed for text snippet '{text[:50]}...': Original error: {str(e)}"
-            ) from e
+        Args:
+            texts: The texts whose languages are to be detected.
 
-        self._validate_langauge(lang)
+        Returns:
+            The detected language codes, in the same order as the input.
 
-        return lang
+        Raises:
+            ValueError: If any text is empty or invalid for detection.
+            DetectionError: If language detection by the backend fails.
+            ValueError: If a detected language is not in `self.LANGUAGE_CODES`.
+        """
+        for text in texts:
+            TranslatorBase._validate_basic_text_to_translate(text)
+
+        detector_id = self.language_detector.cache_id
+        langs = [self.detection_cache.get(text, detector_id) for text in texts]
+        missing = list(
+            dict.fromkeys(
+                text for text, lang in zip(texts, langs) if lang is None
+            )
+        )
+
+        if missing:
+            try:
+                with stage("detect"):
+                    detected = self.language_detector.detect_batch(missing)
+            except Exception as e:
+                if len(missing) == 1:
+                    raise DetectionError(
+                        f"Language detection failed for text snippet '{missing[0][:50]}...': Original error: {str(e)}"
+                    ) from e
+                raise DetectionError(
+                    f"Language detection failed for a batch of {len(missing)} texts: Original error: {str(e)}"
+                ) from e
+
+            detected_by_text = dict(zip(missing, detected))
+            for text, lang in detected_by_text.items():
+                self.detection_cache.put(text, lang, detector_id)
+            langs = [
+                lang if lang is not None else detected_by_text[text]
+                for text, lang in zip(texts, langs)
+            ]
+
+        for lang in langs:
+            self._validate_langauge(lang)
+
+        return langs
 
     def _validate_language_pair(
         self, source_lang: Optional[str], target_lang: str
@@ -142,6 +200,16 @@ class TranslatorBase(ABC):
         if not isinstance(text, str) or not text.strip():
             raise ValueError("Text to translate must be a non-empty string.")
 
+    def _get_cache_params(self) -> dict:
+        """
+        Returns the settings that influence the translation output, beyond the
+        text and language pair. Used to build translation cache keys.
+
+        Returns:
+            dict: A JSON-serializable mapping of setting names to values.
+        """
+        return {}
+
     @abstractmethod
     def translate(self, text: str) -> str:
         """
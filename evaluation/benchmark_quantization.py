@@ -0,0 +1,152 @@
+"""Benchmark fp32 against dynamic int8 quantized mBART-50 inference on CPU.
+
+Run from the `evaluation` directory:
+
+    python benchmark_quantization.py
+
+For every language pair the script translates the same WMT19 samples once
+with the fp32 model and once with `quantization="int8"`, and reports
+throughput, resident memory added by the model and BLEU.
+"""
+
+import gc
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import evaluate
+import pandas as pd
+from datasets import load_dataset
+
+from configs.config import DATASET_NAME, OUTPUT_DIR
+from easy_nlp_translate.huggingface_models import MBARTTranslator
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+handler = logging.StreamHandler()
+handler.setFormatter(
+    logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
+)
+logger.addHandler(handler)
+
+LANGUAGE_PAIRS: List[str] = ["de-en", "ru-en", "fi-en"]
+BENCHMARK_SPLIT: str = "train[:200]"
+QUANTIZATION_MODES: List[Optional[str]] = [None, "int8"]
+BATCH_SIZE: int = 8
+
+# WMT19 language codes that differ from the package's generic codes
+WMT_TO_GENERIC_CODE: Dict[str, str] = {"zh": "zh-cn"}
+
+
+def current_rss_mb() -> float:
+    """Return the resident set size of the current process in MB.
+
+    Returns:
+        float: The resident memory in megabytes (Linux only).
+    """
+    with open("/proc/self/statm", "r") as f:
+        resident_pages = int(f.read().split()[1])
+    return resident_pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+
+
+def benchmark_mode(
+    quantization: Optional[str],
+    src_lang: str,
+    tgt_lang: str,
+    inputs: List[str],
+    references: List[str],
+    bleu: evaluate.EvaluationModule,
+) -> Dict[str, float]:
+    """Translate the inputs with one quantization mode and collect metrics.
+
+    Args:
+        quantization (Optional[str]): None for fp32 or "int8".
+        src_lang (str): Generic source language code (e.g. "de").
+        tgt_lang (str): Generic target language code (e.g. "en").
+        inputs (List[str]): Source sentences.
+        references (List[str]): Reference translations.
+        bleu (evaluate.EvaluationModule): The loaded BLEU metric.
+
+    Returns:
+        Dict[str, float]: Sentences per second, model RSS in MB and BLEU.
+    """
+    gc.collect()
+    rss_before = current_rss_mb()
+
+    translator = MBARTTranslator(
+        target_lang=tgt_lang,
+        source_lang=src_lang,
+        device="cpu",
+        quantization=quantization,
+        share_model=False,
+    )
+    rss_model = current_rss_mb() - rss_before
+
+    start = time.perf_counter()
+    translations = translator.translate_batch(inputs, batch_size=BATCH_SIZE)
+    elapsed = time.perf_counter() - start
+
+    score = bleu.compute(
+        predictions=translations, references=[[r] for r in references]
+    )["bleu"]
+
+    translator.close()
+    del translator
+    gc.collect()
+
+    return {
+        "sentences_per_second": len(inputs) / elapsed,
+        "model_rss_mb": rss_model,
+        "bleu": score,
+    }
+
+
+def run_benchmark(
+    language_pairs: List[str], split: str, output_dir: Path
+) -> pd.DataFrame:
+    """Benchmark every quantization mode on every language pair.
+
+    Args:
+        language_pairs (List[str]): WMT19 language pairs (e.g. "de-en").
+        split (str): Dataset split specifier (e.g. "train[:200]").
+        output_dir (Path): Directory in which to write the CSV report.
+
+    Returns:
+        pd.DataFrame: One row per language pair and quantization mode.
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    bleu = evaluate.load("bleu")
+    rows = []
+
+    for lang_pair in language_pairs:
+        src_lang, tgt_lang = lang_pair.split("-", 1)
+        ds = load_dataset(DATASET_NAME, lang_pair, split=split)
+        inputs = [ex["translation"][src_lang] for ex in ds]
+        references = [ex["translation"][tgt_lang] for ex in ds]
+
+        for quantization in QUANTIZATION_MODES:
+            mode = quantization or "fp32"
+            logger.info("Benchmarking %s on %s", mode, lang_pair)
+            metrics = benchmark_mode(
+                quantization,
+                WMT_TO_GENERIC_CODE.get(src_lang, src_lang),
+                WMT_TO_GENERIC_CODE.get(tgt_lang, tgt_lang),
+                inputs,
+                references,
+                bleu,
+            )
+            rows.append({"lang_pair": lang_pair, "mode": mode, **metrics})
+
+    df = pd.DataFrame(rows).round(4)
+    logger.info("===== Quantization Benchmark =====\n%s", df.to_string())
+
+    report_file = output_dir / "mbart50_quantization_benchmark.csv"
+    df.to_csv(report_file, index=False)
+    logger.info("Results saved to: %s", report_file)
+    return df
+
+
+if __name__ == "__main__":
+    run_benchmark(LANGUAGE_PAIRS, BENCHMARK_SPLIT, OUTPUT_DIR)
@@ -85,6 +85,12 @@ class ConcreteHuggingFaceTranslator(HuggingFaceTranslator):
         """Dummy translate method for testing."""
         return f"translated_{self.target_lang}:{text}"
 
+    def _generate_translations(self, texts: list[str]) -> list[str]:
+        """Dummy batched generation method for testing."""
+        self.generated_batches = getattr(self, "generated_batches", [])
+        self.generated_batches.append(list(texts))
+        return [self.translate(text) for text in texts]
+
 
 @pytest.fixture
 def mock_tokenizer_instance():
@@ -87,3 +87,75 @@ def test_translate_no_source_lang(get_mbart):
     translated_text = translator.translate(text_to_translate)
 
     assert translated_text == "This is a dog."
+
+
+def test_translate_batch(get_mbart):
+    """
+    Test the batched translate_batch method.
+    """
+
+    translator = get_mbart(
+        target_lang="en",
+        source_lang="de",
+    )
+
+    texts = ["Das ist ein Hund.", "Das ist eine Katze.", "Das ist ein Hund."]
+    translated_texts = translator.translate_batch(texts, batch_size=2)
+
+    assert len(translated_texts) == 3
+    assert translated_texts[0] == "This is a dog."
+    assert translated_texts[0] == translated_texts[2]
+
+
+def test_translate_batch_invalid_batch_size(get_mbart):
+    """
+    Test the translate_batch method with an invalid batch size.
+    """
+
+    translator = get_mbart(
+        target_lang="en",
+        source_lang="de",
+    )
+
+    with pytest.raises(ValueError) as excinfo:
+        translator.translate_batch(["Das ist ein Hund."], batch_size=0)
+
+    assert "batch_size must be a positive integer." in str(excinfo.value)
+
+
+def test_translate_batch_mixed_source_languages(get_mbart):
+    """
+    Test the translate_batch method with texts in different source languages.
+    """
+
+    translator = get_mbart(
+        target_lang="en",
+    )
+
+    texts = [
+        "Das ist ein Hund.",
+        "C'est un chien.",
+        "Das ist eine Katze.",
+    ]
+    groups = translator._group_by_source_language(texts)
+    translated_texts = translator.translate_batch(texts)
+
+    assert groups == {"de_DE": [0, 2], "fr_XX": [1]}
+    assert len(translated_texts) == 3
+    assert translated_texts[0] == "This is a dog."
+
+
+def test_translate_stream(get_mbart):
+    """
+    Test that translate_stream yields the translation in several pieces.
+    """
+
+    translator = get_mbart(
+        target_lang="en",
+        source_lang="de",
+    )
+
+    pieces = list(translator.translate_stream("Das ist ein Hund."))
+
+    assert len(pieces) > 1
+    assert "".join(pieces).strip() == "This is a dog."
@@ -0,0 +1,222 @@
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from easy_nlp_translate.batch_jobs import BatchJob
+from easy_nlp_translate.exceptions import BatchTranslationError
+from easy_nlp_translate.llm_provider.openai import GPTTranslator
+
+
+class OpenAIBatchStandIn(BaseHTTPRequestHandler):
+    """
+    A minimal local stand-in for the OpenAI files and batches endpoints.
+
+    Every uploaded request is answered with a completion echoing the text to
+    translate from its prompt, except prompts containing "FAIL", which get a 500 error.
+    Batches report "in_progress" until `completed` is set.
+    """
+
+    files: dict[str, str] = {}
+    batches: dict[str, dict] = {}
+    completed: bool = False
+
+    def log_message(self, *args):
+        pass
+
+    def _send_json(self, payload: dict):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _batch(self, batch_id: str) -> dict:
+        batch = self.batches[batch_id]
+        status = "completed" if self.completed else "in_progress"
+        return {
+            "id": batch_id,
+            "object": "batch",
+            "endpoint": "/v1/chat/completions",
+            "completion_window": "24h",
+            "created_at": 0,
+            "input_file_id": batch["input_file_id"],
+            "status": status,
+            "output_file_id": batch["output_file_id"]
+            if status == "completed"
+            else None,
+            "error_file_id": None,
+        }
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"])).decode(
+            "utf-8"
+        )
+
+        if self.path == "/v1/files":
+            file_id = f"file-{len(self.files)}"
+            requests = [
+                json.loads(line)
+                for line in body.splitlines()
+                if line.startswith('{"custom_id"')
+            ]
+            self.files[file_id] = requests
+            self._send_json(
+                {
+                    "id": file_id,
+                    "object": "file",
+                    "bytes": len(body),
+                    "created_at": 0,
+                    "filename": "batch_input.jsonl",
+                    "purpose": "batch",
+                    "status": "processed",
+                }
+            )
+        elif self.path == "/v1/batches":
+            payload = json.loads(body)
+            batch_id = f"batch-{len(self.batches)}"
+            output_id = f"file-output-{batch_id}"
+            lines = []
+            for request in self.files[payload["input_file_id"]]:
+                prompt = request["body"]["messages"][-1]["content"]
+                if "FAIL" in prompt:
+                    response = {"status_code": 500, "body": {"error": "boom"}}
+                else:
+                    lines_of_prompt = prompt.splitlines()
+                    text = lines_of_prompt[
+                        lines_of_prompt.index("Text to translate: ") + 1
+                    ]
+                    response = {
+                        "status_code": 200,
+                        "body": {
+                            "id": "chatcmpl",
+                            "object": "chat.completion",
+                            "created": 0,
+                            "model": request["body"]["model"],
+                            "choices": [
+                                {
+                                    "index": 0,
+                                    "finish_reason": "stop",
+                                    "message": {
+                                        "role": "assistant",
+                                        "content": f"en:{text}",
+                                    },
+                                }
+                            ],
+                        },
+                    }
+                lines.append(
+                    json.dumps(
+                        {
+                            "custom_id": request["custom_id"],
+                            "response": response,
+                        }
+                    )
+                )
+            self.files[output_id] = "\n".join(lines)
+            self.batches[batch_id] = {
+                "input_file_id": payload["input_file_id"],
+                "output_file_id": output_id,
+            }
+            self._send_json(self._batch(batch_id))
+        else:
+            self.send_error(404)
+
+    def do_GET(self):
+        content = re.fullmatch(r"/v1/files/(.+)/content", self.path)
+        batch = re.fullmatch(r"/v1/batches/(.+)", self.path)
+        if content:
+            body = self.files[content.group(1)].encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        elif batch:
+            self._send_json(self._batch(batch.group(1)))
+        else:
+            self.send_error(404)
+
+
+@pytest.fixture
+def openai_stand_in(monkeypatch):
+    """
+    Starts the local OpenAI stand-in server and points the OpenAI client at it.
+    """
+    OpenAIBatchStandIn.files = {}
+    OpenAIBatchStandIn.batches = {}
+    OpenAIBatchStandIn.completed = False
+    server = ThreadingHTTPServer(("127.0.0.1", 0), OpenAIBatchStandIn)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setenv(
+        "OPENAI_BASE_URL", f"http://127.0.0.1:{server.server_address[1]}/v1"
+    )
+    yield server
+
+    server.shutdown()
+    server.server_close()
+
+
+def test_batch_job_manifest_round_trip(tmp_path):
+    """
+    Test that a batch job can be saved and loaded again.
+    """
+    job = BatchJob(
+        provider="GPTTranslator",
+        model_name="gpt-4.1-mini",
+        batch_id="batch-1",
+        count=3,
+        path=tmp_path / "job.json",
+    )
+    job.save()
+
+    loaded = BatchJob.load(tmp_path / "job.json")
+
+    assert loaded.to_dict() == job.to_dict()
+    assert loaded.custom_ids == ["item-0", "item-1", "item-2"]
+
+
+def test_submit_poll_collect_is_resumable(openai_stand_in, tmp_path):
+    """
+    Test the batch workflow against the stand-in server, resuming from the manifest.
+    """
+    translator = GPTTranslator(
+        model_name="gpt-4.1-mini", target_lang="en", source_lang="de"
+    )
+    texts = ["Hallo", "Speichern", "Abbrechen"]
+
+    job = translator.submit_batch(texts, manifest_path=tmp_path / "job.json")
+
+    assert translator.poll(job) == "in_progress"
+    with pytest.raises(RuntimeError, match="completed"):
+        translator.collect(BatchJob.load(job.path))
+
+    openai_stand_in.RequestHandlerClass.completed = True
+    resumed = BatchJob.load(tmp_path / "job.json")
+    assert translator.collect(resumed) == [f"en:{text}" for text in texts]
+    assert BatchJob.load(tmp_path / "job.json").status == "completed"
+
+
+def test_collect_reports_failed_items(openai_stand_in, tmp_path):
+    """
+    Test that failed batch requests are reported per item.
+    """
+    translator = GPTTranslator(
+        model_name="gpt-4.1-mini", target_lang="en", source_lang="de"
+    )
+
+    job = translator.submit_batch(
+        ["Hallo", "FAIL"], manifest_path=tmp_path / "job.json"
+    )
+    openai_stand_in.RequestHandlerClass.completed = True
+
+    with pytest.raises(BatchTranslationError) as excinfo:
+        translator.collect(job)
+
+    assert list(excinfo.value.errors) == [1]
+    assert excinfo.value.results == ["en:Hallo", None]
@@ -0,0 +1,208 @@
+import pytest
+
+from easy_nlp_translate.cache import CachedTranslator, TranslationCache
+from easy_nlp_translate.exceptions import BatchTranslationError
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """
+    Provides a TranslationCache in a temporary directory.
+    """
+    translation_cache = TranslationCache(tmp_path / "cache.sqlite3")
+    yield translation_cache
+    translation_cache.close()
+
+
+@pytest.fixture
+def cached_translator(concrete_translator_class, cache, mocker):
+    """
+    Provides a CachedTranslator wrapping a ConcreteTranslator with a spied translate method.
+    """
+    translator = concrete_translator_class(target_lang="de", source_lang="en")
+    mocker.spy(translator, "translate")
+    return CachedTranslator(translator, cache)
+
+
+def test_translate_uses_cache(cached_translator, cache):
+    """
+    Test that a repeated translation is served from the cache.
+    """
+    first = cached_translator.translate("Hello")
+    second = cached_translator.translate("  Hello ")
+
+    assert first == second == "translated_de:Hello"
+    assert cached_translator.translator.translate.call_count == 1
+    assert cache.stats["hits"] == 1
+    assert cache.stats["misses"] == 1
+
+
+def test_translate_batch_only_sends_misses(cached_translator, cache):
+    """
+    Test that batch calls only translate cache misses, once per unique text.
+    """
+    cached_translator.translate("Hello")
+    cached_translator.translator.translate.reset_mock()
+
+    translations = cached_translator.translate_batch(
+        ["Hello", "World", "World", "Dog"]
+    )
+
+    assert translations == [
+        "translated_de:Hello",
+        "translated_de:World",
+        "translated_de:World",
+        "translated_de:Dog",
+    ]
+    assert cached_translator.translator.translate.call_count == 2
+
+
+def test_cache_persists_across_instances(concrete_translator_class, tmp_path):
+    """
+    Test that cached translations survive reopening the cache file.
+    """
+    path = tmp_path / "cache.sqlite3"
+    translator = concrete_translator_class(target_lang="de", source_lang="en")
+
+    CachedTranslator(translator, TranslationCache(path)).translate("Hello")
+    reopened = TranslationCache(path)
+
+    assert len(reopened) == 1
+    assert (
+        CachedTranslator(translator, reopened).translate("Hello")
+        == "translated_de:Hello"
+    )
+    assert reopened.stats["hits"] == 1
+
+
+def test_key_covers_language_pair(concrete_translator_class, cache):
+    """
+    Test that the same text for another target language is a miss.
+    """
+    to_de = CachedTranslator(
+        concrete_translator_class(target_lang="de", source_lang="en"), cache
+    )
+    to_custom = CachedTranslator(
+        concrete_translator_class(
+            target_lang="custom_test_lang", source_lang="en"
+        ),
+        cache,
+    )
+
+    assert to_de.translate("Hello") == "translated_de:Hello"
+    assert to_custom.translate("Hello") == "translated_custom_test_lang:Hello"
+
+
+def test_lru_eviction(tmp_path, mocker):
+    """
+    Test that the least recently used entries are evicted above the size cap.
+    """
+    mocker.patch("easy_nlp_translate.cache.time.time", side_effect=range(100))
+    cache = TranslationCache(tmp_path / "cache.sqlite3", max_entries=2)
+    cache.set("a", "1")
+    cache.set("b", "2")
+    cache.get("a")
+    cache.set("c", "3")
+
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") == "1"
+    assert cache.stats["evictions"] == 1
+
+
+def test_ttl_expiry(tmp_path, mocker):
+    """
+    Test that entries older than the TTL are treated as misses.
+    """
+    clock = mocker.patch("easy_nlp_translate.cache.time.time", return_value=0)
+    cache = TranslationCache(tmp_path / "cache.sqlite3", ttl=10)
+    cache.set("a", "1")
+
+    clock.return_value = 5
+    assert cache.get("a") == "1"
+
+    clock.return_value = 11
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_translate_batch_partial_failure(cached_translator, cache, mocker):
+    """
+    Test that successful items of a failed batch are cached and that the error
+    refers to the original input positions.
+    """
+    cached_translator.translate("Hello")
+    failure = ValueError("boom")
+    mocker.patch.object(
+        cached_translator.translator,
+        "translate_batch",
+        side_effect=BatchTranslationError(
+            {1: failure}, ["translated_de:World", None]
+        ),
+    )
+
+    with pytest.raises(BatchTranslationError) as excinfo:
+        cached_translator.translate_batch(["Hello", "World", "Dog", "Dog"])
+
+    assert excinfo.value.errors == {2: failure, 3: failure}
+    assert excinfo.value.results == [
+        "translated_de:Hello",
+        "translated_de:World",
+        None,
+        None,
+    ]
+    assert cached_translator._cache_key("World") in cache.get_many(
+        [cached_translator._cache_key("World")]
+    )
+
+
+def test_eviction_in_chunks(tmp_path, mocker):
+    """
+    Test that an eviction frees a chunk of entries and keeps the size in sync.
+    """
+    mocker.patch("easy_nlp_translate.cache.time.time", side_effect=range(1000))
+    mocker.patch.object(TranslationCache, "EVICTION_FRACTION", 0.5)
+    cache = TranslationCache(tmp_path / "cache.sqlite3", max_entries=4)
+    cache.set_many({"a": "1", "b": "2", "c": "3", "d": "4"})
+    cache.set("a", "5")
+    count = mocker.spy(cache, "_count")
+
+    cache.set("e", "6")
+
+    assert len(cache) == 2
+    assert cache.get_many(["a", "e"]) == {"a": "5", "e": "6"}
+    assert cache.stats["evictions"] == 3
+
+    count.reset_mock()
+    cache.set("f", "7")
+    assert count.call_count == 0
+
+
+def test_created_at_is_indexed(cache):
+    """
+    Test that expired entries are purged with an index instead of a table scan.
+    """
+    plan = cache._connection.execute(
+        "EXPLAIN QUERY PLAN DELETE FROM translations WHERE created_at < ?",
+        (0,),
+    ).fetchall()
+
+    assert "translations_created_at" in str(plan)
+
+
+def test_uncached_methods_are_not_forwarded(
+    patched_llm_translator_class, cache
+):
+    """
+    Test that translation methods that bypass the cache are not forwarded.
+    """
+    translator = CachedTranslator(
+        patched_llm_translator_class(model_name="model_a", target_lang="de"),
+        cache,
+    )
+
+    with pytest.raises(AttributeError, match="does not cache"):
+        translator.translate_stream
+    with pytest.raises(AttributeError, match="does not cache"):
+        translator.atranslate
+    assert translator.model_name == "model_a"
@@ -0,0 +1,113 @@
+from types import SimpleNamespace
+
+import pytest
+
+from easy_nlp_translate.llm_provider.anthropic import ClaudeTranslator
+
+
+@pytest.fixture
+def claude_translator(monkeypatch):
+    """
+    Provides a ClaudeTranslator with a dummy API key.
+    """
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+    return ClaudeTranslator(
+        model_name="claude-sonnet-4-0", target_lang="en", source_lang="de"
+    )
+
+
+def test_short_prompt_is_sent_unchanged(claude_translator):
+    """
+    Test that prompts below the cache minimum are sent as one user message.
+    """
+    prompt = claude_translator._render_prompt("Hallo Welt")
+    request = claude_translator._request_kwargs(prompt)
+
+    assert "system" not in request
+    assert request["messages"] == [{"role": "user", "content": prompt}]
+
+
+def test_request_caches_long_static_prompt(monkeypatch):
+    """
+    Test that a long rules block is sent as a cached block before the delimited text.
+    """
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+    translator = ClaudeTranslator(
+        model_name="claude-sonnet-4-0",
+        target_lang="en",
+        source_lang="de",
+        prompt_type="custom",
+        custom_prompt="- Keep product names untranslated.\n" * 200,
+    )
+
+    request = translator._request_kwargs(
+        translator._render_prompt("Wie spät ist es?")
+    )
+
+    assert "system" not in request
+    (message,) = request["messages"]
+    cached, text = message["content"]
+    assert message["role"] == "user"
+    assert cached["cache_control"] == {"type": "ephemeral"}
+    assert "Keep product names untranslated" in cached["text"]
+    assert "Wie spät ist es?" not in cached["text"]
+    assert text == {
+        "type": "text",
+        "text": "<text_to_translate>\nWie spät ist es?\n</text_to_translate>",
+    }
+
+
+def test_plain_prompt_is_sent_as_user_message(claude_translator):
+    """
+    Test that prompts without static part are sent unchanged.
+    """
+    request = claude_translator._request_kwargs("Translate this.")
+
+    assert "system" not in request
+    assert request["messages"] == [
+        {"role": "user", "content": "Translate this."}
+    ]
+
+
+def test_post_process_reports_cache_usage(claude_translator, caplog):
+    """
+    Test that cache read tokens are logged at DEBUG level for every response.
+    """
+    response = SimpleNamespace(
+        content=[SimpleNamespace(text=" Hello world ")],
+        usage=SimpleNamespace(
+            input_tokens=5,
+            output_tokens=3,
+            cache_read_input_tokens=1200,
+            cache_creation_input_tokens=0,
+        ),
+    )
+
+    with caplog.at_level("INFO"):
+        claude_translator._post_process(response)
+    assert "cache read" not in caplog.text
+
+    with caplog.at_level("DEBUG"):
+        assert claude_translator._post_process(response) == "Hello world"
+
+    assert "cache read: 1200" in caplog.text
+
+
+def test_translate_stream_goes_through_retries(claude_translator, mocker):
+    """
+    Test that the stream is opened through the retry loop and closed afterwards.
+    """
+    stream = mocker.MagicMock(text_stream=iter(["Hello", " world"]))
+    manager = mocker.MagicMock()
+    manager.__enter__.return_value = stream
+    mocker.patch.object(
+        claude_translator.model.messages, "stream", return_value=manager
+    )
+    call_with_retries = mocker.spy(claude_translator, "_call_with_retries")
+
+    assert list(claude_translator.translate_stream("Hallo Welt")) == [
+        "Hello",
+        " world",
+    ]
+    assert call_with_retries.call_count == 1
+    stream.close.assert_called_once()
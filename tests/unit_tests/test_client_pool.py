@@ -0,0 +1,136 @@
+import threading
+
+import httpx
+import pytest
+
+from easy_nlp_translate.client_pool import (
+    SharedClientPool,
+    configure_client_pool,
+    shared_client_pool,
+)
+from easy_nlp_translate.llm_provider.gemini import GeminiTranslator
+from easy_nlp_translate.llm_provider.openai import GPTTranslator
+
+
+@pytest.fixture
+def pool():
+    """
+    Provides an empty client pool.
+    """
+    return SharedClientPool()
+
+
+def test_get_creates_client_once(pool):
+    """
+    Test that concurrent lookups of the same key share one client.
+    """
+    created = []
+
+    def factory(limits):
+        created.append(limits)
+        return object()
+
+    key = pool.make_key("openai", "key-1")
+    clients = []
+    threads = [
+        threading.Thread(target=lambda: clients.append(pool.get(key, factory)))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(created) == 1
+    assert all(client is clients[0] for client in clients)
+    assert isinstance(created[0], httpx.Limits)
+
+
+def test_keys_separate_credentials_and_settings(pool):
+    """
+    Test that different credentials or settings get their own client.
+    """
+    first = pool.get(pool.make_key("openai", "key-1"), lambda _: object())
+    second = pool.get(pool.make_key("openai", "key-2"), lambda _: object())
+    third = pool.get(
+        pool.make_key("openai", "key-1", "http://localhost"),
+        lambda _: object(),
+    )
+
+    assert len({id(first), id(second), id(third)}) == 3
+    assert "key-1" not in str(pool.make_key("openai", "key-1"))
+
+
+def test_configure_sets_limits(pool):
+    """
+    Test that configured limits are passed to new clients.
+    """
+    pool.configure(
+        max_connections=10, max_keepalive_connections=5, keepalive_expiry=1.5
+    )
+
+    limits = pool.get(pool.make_key("gemini", "key"), lambda limits: limits)
+
+    assert limits.max_connections == 10
+    assert limits.max_keepalive_connections == 5
+    assert limits.keepalive_expiry == 1.5
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"max_connections": 0},
+        {"max_keepalive_connections": -1},
+        {"keepalive_expiry": 0},
+    ],
+)
+def test_configure_invalid_limits(pool, kwargs):
+    """
+    Test that non-positive limits are rejected.
+    """
+    with pytest.raises(ValueError):
+        pool.configure(**kwargs)
+
+
+def test_gpt_translators_share_client(monkeypatch):
+    """
+    Test that GPT translators with the same API key share one client and
+    that reconfiguring the pool gives new translators a new client.
+    """
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.delenv("OPENAI_BASE_URL", raising=False)
+    shared_client_pool.clear()
+
+    first = GPTTranslator(model_name="gpt-4.1-mini", target_lang="en")
+    second = GPTTranslator(model_name="gpt-4.1-mini", target_lang="de")
+
+    assert first.model is second.model
+
+    configure_client_pool(max_connections=50)
+    third = GPTTranslator(model_name="gpt-4.1-mini", target_lang="en")
+
+    assert third.model is not first.model
+    configure_client_pool()
+
+
+def test_gemini_key_covers_base_url_and_http_options(monkeypatch):
+    """
+    Test that Gemini translators with another base URL or http options get their own client.
+    """
+    monkeypatch.setenv("GEMINI_API_KEY", "test-key")
+    monkeypatch.delenv("GOOGLE_GEMINI_BASE_URL", raising=False)
+    shared_client_pool.clear()
+    model_name = GeminiTranslator.AVAILABLE_MODELS[0]
+
+    first = GeminiTranslator(model_name=model_name, target_lang="en")
+    second = GeminiTranslator(model_name=model_name, target_lang="de")
+    monkeypatch.setenv("GOOGLE_GEMINI_BASE_URL", "http://localhost:8080")
+    proxied = GeminiTranslator(model_name=model_name, target_lang="en")
+    monkeypatch.setattr(
+        GeminiTranslator, "HTTP_OPTIONS", {"api_version": "v1"}
+    )
+    versioned = GeminiTranslator(model_name=model_name, target_lang="en")
+
+    assert first.model is second.model
+    assert len({id(first.model), id(proxied.model), id(versioned.model)}) == 3
+    shared_client_pool.clear()
@@ -49,3 +49,381 @@ def test_init_validation_errors(
         patched_huggingface_translator_class(
             target_lang="fr", max_length=max_l_param, num_beams=num_b_param
         )
+
+
+def test_build_batches_fixed_size(patched_huggingface_translator_class):
+    """
+    Tests that without a token budget the batches are chunks in input order.
+    """
+    batches = patched_huggingface_translator_class._build_batches(
+        [0, 0, 0, 0, 0], batch_size=2
+    )
+
+    assert batches == [[0, 1], [2, 3], [4]]
+
+
+def test_build_batches_token_budget(patched_huggingface_translator_class):
+    """
+    Tests that with a token budget the batches are sorted by length and
+    the padded size of every batch stays within the budget.
+    """
+    lengths = [400, 5, 6, 390, 5]
+    batches = patched_huggingface_translator_class._build_batches(
+        lengths, batch_size=None, max_batch_tokens=800
+    )
+
+    assert batches == [[1, 4, 2], [3, 0]]
+    for batch in batches:
+        assert max(lengths[i] for i in batch) * len(batch) <= 800
+
+
+def test_translate_batch_token_budget_keeps_order(
+    patched_huggingface_translator_class, mock_tokenizer_instance
+):
+    """
+    Tests that token-budget batching restores the original input order.
+    """
+    texts = ["long text", "a", "b", "long text 2"]
+    mock_tokenizer_instance.return_value = {
+        "input_ids": [[0] * 50, [0] * 3, [0] * 4, [0] * 60]
+    }
+    translator = patched_huggingface_translator_class(
+        source_lang="en", target_lang="fr"
+    )
+
+    translations = translator.translate_batch(texts, max_batch_tokens=64)
+
+    assert translations == [f"translated_fr:{text}" for text in texts]
+    assert translator.generated_batches == [
+        ["a", "b"],
+        ["long text"],
+        ["long text 2"],
+    ]
+
+
+def test_translate_batch_invalid_parameters(
+    patched_huggingface_translator_class,
+):
+    """
+    Tests that invalid batching parameters raise a ValueError.
+    """
+    translator = patched_huggingface_translator_class(
+        source_lang="en", target_lang="fr"
+    )
+
+    with pytest.raises(ValueError, match="max_batch_tokens must be"):
+        translator.translate_batch(["a"], max_batch_tokens=0)
+    with pytest.raises(ValueError, match="batch_size must be"):
+        translator.translate_batch(["a"], batch_size=-1)
+
+
+def test_instances_share_model(
+    patched_huggingface_translator_class, mock_model_instance
+):
+    """
+    Tests that translators for different language pairs share one loaded model
+    and that it is released once the last translator is closed.
+    """
+    from easy_nlp_translate.model_registry import shared_model_registry
+
+    translator_fr = patched_huggingface_translator_class(
+        source_lang="en", target_lang="fr"
+    )
+    translator_de = patched_huggingface_translator_class(
+        source_lang="en", target_lang="de"
+    )
+
+    assert translator_fr.model is translator_de.model is mock_model_instance
+    assert translator_fr._init_model.call_count == 1
+    assert shared_model_registry.refcount(translator_fr.model_key) == 2
+
+    translator_fr.close()
+    translator_fr.close()
+    assert shared_model_registry.refcount(translator_de.model_key) == 1
+
+    translator_de.close()
+    assert translator_de.model_key not in shared_model_registry
+
+
+def test_model_key_covers_loading_arguments(
+    patched_huggingface_translator_class,
+):
+    """
+    Tests that translators loading the model with other arguments do not share it.
+    """
+    default = patched_huggingface_translator_class(
+        source_lang="en", target_lang="fr", lazy=True
+    )
+    same = patched_huggingface_translator_class(
+        source_lang="en", target_lang="de", lazy=True
+    )
+    revision = patched_huggingface_translator_class(
+        source_lang="en",
+        target_lang="fr",
+        model_kwargs={"revision": "main"},
+        lazy=True,
+    )
+    tokenizer = patched_huggingface_translator_class(
+        source_lang="en",
+        target_lang="fr",
+        tokenizer_kwargs={"use_fast": False},
+        lazy=True,
+    )
+    max_length = patched_huggingface_translator_class(
+        source_lang="en", target_lang="fr", max_length=128, lazy=True
+    )
+
+    assert default.model_key == same.model_key
+    assert (
+        len(
+            {
+                default.model_key,
+                revision.model_key,
+                tokenizer.model_key,
+                max_length.model_key,
+            }
+        )
+        == 4
+    )
+
+
+def test_init_int8_quantization(patched_huggingface_translator_class, mocker):
+    """
+    Tests that int8 quantization is applied at load time and is part of the model key.
+    """
+    quantized_model = object()
+    quantize = mocker.patch(
+        "torch.ao.quantization.quantize_dynamic", return_value=quantized_model
+    )
+
+    translator = patched_huggingface_translator_class(
+        source_lang="en", target_lang="fr", device="cpu", quantization="int8"
+    )
+
+    assert translator.model is quantized_model
+    assert quantize.call_count == 1
+    assert quantize.call_args.kwargs["inplace"] is True
+    assert translator.model_key[3] == "int8"
+
+
+@pytest.mark.parametrize(
+    "quantization, device, expected_error_msg_part",
+    [
+        ("int4", "cpu", "Quantization 'int4' is not supported."),
+        ("int8", "cuda", "only supported on CPU"),
+    ],
+)
+def test_init_invalid_quantization(
+    patched_huggingface_translator_class,
+    quantization,
+    device,
+    expected_error_msg_part,
+):
+    with pytest.raises(ValueError, match=expected_error_msg_part):
+        patched_huggingface_translator_class(
+            target_lang="fr", device=device, quantization=quantization
+        )
+
+
+@pytest.mark.parametrize(
+    "backend, device, quantization, expected_error_msg_part",
+    [
+        ("tensorrt", "cpu", None, "Backend 'tensorrt' is not supported."),
+        ("onnx", "cuda", None, "only supports CPU"),
+        ("onnx", "cpu", "int8", "not supported with the 'onnx' backend"),
+    ],
+)
+def test_init_invalid_backend(
+    patched_huggingface_translator_class,
+    backend,
+    device,
+    quantization,
+    expected_error_msg_part,
+):
+    with pytest.raises(ValueError, match=expected_error_msg_part):
+        patched_huggingface_translator_class(
+            target_lang="fr",
+            device=device,
+            quantization=quantization,
+            backend=backend,
+        )
+
+
+def test_onnx_export_dir_is_keyed_on_model_name(
+    patched_huggingface_translator_class, monkeypatch, tmp_path
+):
+    """
+    Tests that the ONNX export is cached in a directory per model name.
+    """
+    monkeypatch.setattr(
+        "easy_nlp_translate.huggingface_translator_base.ONNX_CACHE_DIR",
+        tmp_path,
+    )
+    monkeypatch.setattr(
+        patched_huggingface_translator_class, "MODEL_NAME", "org/model"
+    )
+    translator = patched_huggingface_translator_class(
+        target_lang="fr", device="cpu", backend="onnx"
+    )
+
+    assert translator._get_onnx_export_dir() == tmp_path / "org--model"
+    assert translator.model_key[4] == "onnx"
+
+
+def test_lazy_init_defers_loading(
+    patched_huggingface_translator_class, mock_model_instance
+):
+    """
+    Tests that lazy translators load the model on first access.
+    """
+    translator = patched_huggingface_translator_class(
+        source_lang="en", target_lang="fr", lazy=True
+    )
+
+    assert not translator.is_loaded
+    assert not translator.is_ready
+    assert translator._init_model.call_count == 0
+
+    assert translator.model is mock_model_instance
+    assert translator.is_loaded
+    assert translator.is_ready
+
+
+def test_warmup_in_background(patched_huggingface_translator_class):
+    """
+    Tests that warmup loads the model in a background thread and runs a dummy generation.
+    """
+    translator = patched_huggingface_translator_class(
+        source_lang="en", target_lang="fr", lazy=True
+    )
+
+    thread = translator.warmup()
+
+    assert thread is not None
+    assert translator.wait_until_ready(timeout=5)
+    assert translator.generated_batches == [[translator.WARMUP_TEXT]]
+
+
+def test_warmup_failure_is_not_ready(patched_huggingface_translator_class):
+    """
+    Tests that a failed warm-up is reported through is_ready.
+    """
+    translator = patched_huggingface_translator_class(
+        source_lang="en", target_lang="fr", lazy=True
+    )
+    translator._init_model.side_effect = OSError("download failed")
+
+    translator.warmup()
+
+    assert not translator.wait_until_ready(timeout=5)
+    assert isinstance(translator._warmup_error, OSError)
+
+
+def test_translate_document_chunks_and_reassembles(
+    patched_huggingface_translator_class, mock_tokenizer_instance
+):
+    """
+    Tests that long documents are chunked, batched and reassembled with the original whitespace.
+    """
+    mock_tokenizer_instance.side_effect = lambda texts, **kwargs: {
+        "input_ids": [text.split() for text in texts]
+    }
+    translator = patched_huggingface_translator_class(
+        source_lang="en", target_lang="fr"
+    )
+
+    translation = translator.translate_document(
+        "First sentence. Second one.\n\nThird.",
+        max_chunk_tokens=2,
+        batch_size=8,
+    )
+
+    assert translation == (
+        "translated_fr:First sentence. translated_fr:Second one.\n\ntranslated_fr:Third."
+    )
+    assert translator.generated_batches == [
+        ["First sentence.", "Second one.", "Third."]
+    ]
+
+    with pytest.raises(ValueError, match="max_chunk_tokens must be"):
+        translator.translate_document("Text.", max_chunk_tokens=0)
+
+
+def test_translate_document_without_max_length(
+    patched_huggingface_translator_class, mock_tokenizer_instance
+):
+    """
+    Tests that the chunk budget falls back to the tokenizer limit without max_length.
+    """
+    mock_tokenizer_instance.side_effect = lambda texts, **kwargs: {
+        "input_ids": [text.split() for text in texts]
+    }
+    mock_tokenizer_instance.model_max_length = 4
+    mock_tokenizer_instance.num_special_tokens_to_add.return_value = 1
+    translator = patched_huggingface_translator_class(
+        source_lang="en", target_lang="fr", max_length=None
+    )
+
+    translator.translate_document("One two three. Four five six.")
+
+    assert translator.generated_batches == [
+        ["One two three.", "Four five six."]
+    ]
+
+
+@pytest.fixture
+def onnx_translator(
+    patched_huggingface_translator_class, monkeypatch, tmp_path
+):
+    """
+    Provides an ONNX translator whose ONNX cache lives in a temporary directory.
+    """
+    monkeypatch.setattr(
+        "easy_nlp_translate.huggingface_translator_base.ONNX_CACHE_DIR",
+        tmp_path,
+    )
+    monkeypatch.setattr(
+        patched_huggingface_translator_class, "MODEL_NAME", "org/model"
+    )
+    return patched_huggingface_translator_class(
+        target_lang="fr", device="cpu", backend="onnx", lazy=True
+    )
+
+
+def test_init_onnx_model_exports_atomically(onnx_translator, mocker, tmp_path):
+    """
+    Tests that the first load exports the model and moves it into the cache in one step.
+    """
+    ort_model = mocker.patch("optimum.onnxruntime.ORTModelForSeq2SeqLM")
+    exported = ort_model.from_pretrained.return_value
+    exported.save_pretrained.side_effect = lambda path: (
+        path / "config.json"
+    ).write_text("{}")
+
+    model = onnx_translator._init_onnx_model()
+
+    assert model is exported
+    assert ort_model.from_pretrained.call_args.args == ("org/model",)
+    assert ort_model.from_pretrained.call_args.kwargs["export"] is True
+    saved_to = exported.save_pretrained.call_args.args[0]
+    assert saved_to.parent == tmp_path and saved_to != tmp_path / "org--model"
+    assert (tmp_path / "org--model" / "config.json").exists()
+    assert [path.name for path in tmp_path.iterdir()] == ["org--model"]
+
+
+def test_init_onnx_model_loads_cached_export(
+    onnx_translator, mocker, tmp_path
+):
+    """
+    Tests that a cached export is loaded without exporting again.
+    """
+    export_dir = tmp_path / "org--model"
+    export_dir.mkdir()
+    (export_dir / "config.json").write_text("{}")
+    ort_model = mocker.patch("optimum.onnxruntime.ORTModelForSeq2SeqLM")
+
+    model = onnx_translator._init_onnx_model()
+
+    assert model is ort_model.from_pretrained.return_value
+    assert ort_model.from_pretrained.call_args.args == (export_dir,)
+    assert "export" not in ort_model.from_pretrained.call_args.kwargs
@@ -1,3 +1,7 @@
+import subprocess
+import sys
+from pathlib import Path
+
 import pytest
 from easy_nlp_translate.initialize import initialize_translator
 
@@ -35,3 +39,44 @@ def test_initialize_translator_missing_source_lang():
     assert translator is not None
     assert translator.target_lang == "en"
     assert translator.source_lang is None
+
+
+def test_resolve_translator_class_is_lazy():
+    """
+    Test that registry entries are resolved to their classes on first use.
+    """
+    from easy_nlp_translate.initialize import (
+        TRANSLATOR_REGISTRY,
+        _resolve_translator_class,
+    )
+    from easy_nlp_translate.llm_provider.openai import GPTTranslator
+
+    assert _resolve_translator_class("gpt") is GPTTranslator
+    assert TRANSLATOR_REGISTRY["gpt"] is GPTTranslator
+
+
+def test_package_import_does_not_load_heavy_dependencies():
+    """
+    Test that importing the package neither imports torch, transformers
+    nor any provider SDK, and stays fast.
+    """
+    repo_root = Path(__file__).resolve().parents[2]
+    script = (
+        "import sys, time\n"
+        "start = time.perf_counter()\n"
+        "import easy_nlp_translate\n"
+        "print(time.perf_counter() - start)\n"
+        "heavy = ['torch', 'transformers', 'anthropic', 'openai', 'ollama', 'google.genai']\n"
+        "print(','.join(m for m in heavy if m in sys.modules))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=repo_root,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    import_seconds, loaded_modules = result.stdout.splitlines()
+
+    assert loaded_modules == ""
+    assert float(import_seconds) < 2.0
@@ -0,0 +1,171 @@
+import pytest
+
+from easy_nlp_translate.exceptions import DetectionError
+from easy_nlp_translate.language_detection import (
+    DetectionCache,
+    LangdetectDetector,
+    LanguageDetector,
+)
+
+
+def test_detection_cache_hit_and_miss():
+    """
+    Test that stored detections are returned and counted.
+    """
+    cache = DetectionCache(maxsize=2)
+
+    assert cache.get("Hallo Welt") is None
+    cache.put("Hallo Welt", "de")
+
+    assert cache.get("Hallo Welt") == "de"
+    assert cache.stats["hits"] == 1
+    assert cache.stats["misses"] == 1
+    assert cache.stats["hit_rate"] == 0.5
+
+
+def test_detection_cache_evicts_least_recently_used():
+    """
+    Test that the least recently used entry is evicted when the cache is full.
+    """
+    cache = DetectionCache(maxsize=2)
+    cache.put("a", "en")
+    cache.put("b", "de")
+    cache.get("a")
+    cache.put("c", "fr")
+
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") == "en"
+
+
+def test_detection_cache_disabled():
+    """
+    Test that a disabled cache neither stores nor returns detections.
+    """
+    cache = DetectionCache()
+    cache.put("a", "en")
+    cache.configure(enabled=False)
+    cache.put("b", "de")
+
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_detection_cache_invalid_maxsize():
+    """
+    Test that an invalid maxsize raises a ValueError.
+    """
+    with pytest.raises(
+        ValueError, match="maxsize must be a positive integer."
+    ):
+        DetectionCache(maxsize=0)
+
+
+def test_detect_language_is_memoized(concrete_translator_class, mocker):
+    """
+    Test that detect_language only runs langdetect once per text.
+    """
+    translator = concrete_translator_class(target_lang="en")
+    translator.detection_cache = DetectionCache()
+    detect_batch = mocker.patch.object(
+        translator.language_detector, "detect_batch", return_value=["de"]
+    )
+
+    assert translator.detect_language("Der Hund jagt die Katze.") == "de"
+    assert translator.detect_language("Der Hund jagt die Katze.") == "de"
+    assert detect_batch.call_count == 1
+
+
+def test_langdetect_detector_is_deterministic():
+    """
+    Test that the seeded langdetect backend gives the same result every time.
+    """
+    detector = LangdetectDetector(seed=0)
+    text = "Das ist ein Hund."
+
+    assert {detector.detect(text) for _ in range(5)} == {"de"}
+
+
+def test_detect_languages_batch(concrete_translator_class, mocker):
+    """
+    Test that detect_languages scores only uncached, unique texts in one batch call.
+    """
+    translator = concrete_translator_class(target_lang="de")
+    translator.detection_cache = DetectionCache()
+    translator.detection_cache.put(
+        "Hello", "en", translator.language_detector.cache_id
+    )
+    detect_batch = mocker.spy(translator.language_detector, "detect_batch")
+
+    langs = translator.detect_languages(
+        ["Hello", "Der Hund jagt die Katze.", "Der Hund jagt die Katze."]
+    )
+
+    assert langs == ["en", "de", "de"]
+    detect_batch.assert_called_once_with(["Der Hund jagt die Katze."])
+
+
+def test_custom_detector_backend(concrete_translator_class):
+    """
+    Test that a custom backend is used and its failures become DetectionErrors.
+    """
+
+    class FailingDetector(LanguageDetector):
+        def detect(self, text):
+            raise RuntimeError("backend down")
+
+    translator = concrete_translator_class(target_lang="de")
+    translator.detection_cache = DetectionCache()
+    translator.language_detector = FailingDetector()
+
+    with pytest.raises(DetectionError, match="backend down"):
+        translator.detect_language("Hello world")
+    with pytest.raises(DetectionError, match="batch of 2 texts"):
+        translator.detect_languages(["Hello world", "Guten Morgen"])
+
+
+def test_detection_cache_is_keyed_on_detector(concrete_translator_class):
+    """
+    Test that detectors sharing a cache do not see each other's results.
+    """
+
+    class FixedDetector(LanguageDetector):
+        def __init__(self, lang):
+            self.lang = lang
+
+        @property
+        def cache_id(self):
+            return f"FixedDetector({self.lang})"
+
+        def detect(self, text):
+            return self.lang
+
+    cache = DetectionCache()
+    first = concrete_translator_class(target_lang="de")
+    second = concrete_translator_class(target_lang="de")
+    first.detection_cache = second.detection_cache = cache
+    first.language_detector = FixedDetector("en")
+    second.language_detector = FixedDetector("de")
+
+    assert first.detect_language("Hello") == "en"
+    assert second.detect_language("Hello") == "de"
+    assert len(cache) == 2
+    assert (
+        LangdetectDetector(seed=0).cache_id
+        != LangdetectDetector(seed=1).cache_id
+    )
+
+
+def test_langdetect_batch_loads_factory_once(mocker):
+    """
+    Test that the langdetect batch path reuses one loaded factory.
+    """
+    detector = LangdetectDetector(seed=0)
+    get_factory = mocker.spy(detector, "_get_factory")
+
+    langs = detector.detect_batch(
+        ["Der Hund jagt die Katze.", "The dog chases the cat."]
+    )
+
+    assert langs == ["de", "en"]
+    assert get_factory.call_count == 1
@@ -1,3 +1,6 @@
+import asyncio
+import json
+
 import pytest
 from typing import Iterable
 from easy_nlp_translate.prompt_config import PromptStyle
@@ -119,6 +122,25 @@ def test_render_prompt(patched_llm_translator_class):
     assert "English" in rendered_prompt
 
 
+def test_render_prompt_static_part(patched_llm_translator_class):
+    """
+    Test that the static part of a rendered prompt does not depend on the text.
+    """
+    translator = patched_llm_translator_class(
+        model_name="model_a",
+        target_lang="en",
+        source_lang="de",
+    )
+
+    first = translator._render_prompt("Hallo Welt")
+    second = translator._render_prompt("Guten Morgen")
+
+    assert first.static == second.static
+    assert "Hallo Welt" not in first.static
+    assert "German" in first.static and "Rules for output" in first.static
+    assert first.text == "Hallo Welt"
+
+
 def test_render_prompt_without_source_lang(patched_llm_translator_class):
     """
     Test the render_prompt method of the LLMTranslator class.
@@ -257,3 +279,287 @@ def test_post_process(patched_llm_translator_class):
     raw_response = ["my mocked translation"]
     post_processed_text = translator._post_process(raw_response)
     assert post_processed_text == "my mocked translation"
+
+
+# --- translate batch
+def test_translate_batch_concurrent_keeps_order(
+    patched_llm_translator_class, mocker
+):
+    """
+    Test that concurrent batch translation returns results in input order.
+    """
+    translator = patched_llm_translator_class(
+        model_name="model_a",
+        target_lang="en",
+        source_lang="de",
+    )
+    mocker.patch.object(
+        translator, "translate", side_effect=lambda text: f"en:{text}"
+    )
+
+    texts = [f"Text {i}" for i in range(20)]
+    translated_texts = translator.translate_batch(texts, max_concurrency=4)
+
+    assert translated_texts == [f"en:{text}" for text in texts]
+
+
+def test_translate_batch_reports_item_errors(
+    patched_llm_translator_class, mocker
+):
+    """
+    Test that failing items are reported per index without losing the others.
+    """
+    from easy_nlp_translate.exceptions import BatchTranslationError
+
+    translator = patched_llm_translator_class(
+        model_name="model_a",
+        target_lang="en",
+        source_lang="de",
+    )
+
+    def fake_translate(text):
+        if text == "bad":
+            raise RuntimeError("provider error")
+        return f"en:{text}"
+
+    mocker.patch.object(translator, "translate", side_effect=fake_translate)
+
+    with pytest.raises(BatchTranslationError) as excinfo:
+        translator.translate_batch(["good", "bad", "fine"])
+
+    assert list(excinfo.value.errors) == [1]
+    assert excinfo.value.results == ["en:good", None, "en:fine"]
+
+
+def test_translate_batch_invalid_max_concurrency(patched_llm_translator_class):
+    """
+    Test that an invalid max_concurrency raises a ValueError.
+    """
+    translator = patched_llm_translator_class(
+        model_name="model_a",
+        target_lang="en",
+        source_lang="de",
+    )
+
+    with pytest.raises(ValueError) as excinfo:
+        translator.translate_batch(["Hallo"], max_concurrency=0)
+
+    assert "max_concurrency must be a positive integer." in str(excinfo.value)
+
+
+# --- async translate
+def test_atranslate(patched_llm_translator_class):
+    """
+    Test the atranslate method falls back to the synchronous _generate.
+    """
+    translator = patched_llm_translator_class(
+        model_name="model_a",
+        target_lang="en",
+        source_lang="de",
+    )
+
+    translated_text = asyncio.run(translator.atranslate("Hallo Welt"))
+
+    assert translated_text == "my mocked translation"
+
+
+def test_atranslate_batch_bounds_concurrency(patched_llm_translator_class):
+    """
+    Test that atranslate_batch keeps the order and never exceeds max_concurrency.
+    """
+    translator = patched_llm_translator_class(
+        model_name="model_a",
+        target_lang="en",
+        source_lang="de",
+    )
+    in_flight = 0
+    peak = 0
+
+    async def fake_agenerate(input):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return [input.split("Text to translate:")[1].split()[0]]
+
+    translator._agenerate = fake_agenerate
+    texts = [f"Text{i}" for i in range(10)]
+
+    translated_texts = asyncio.run(
+        translator.atranslate_batch(texts, max_concurrency=3)
+    )
+
+    assert translated_texts == texts
+    assert peak == 3
+
+
+# --- translate document
+def test_estimate_tokens(patched_llm_translator_class):
+    """
+    Test that token estimates count Latin characters in groups and other characters individually.
+    """
+    translator = patched_llm_translator_class(
+        model_name="model_a",
+        target_lang="en",
+        source_lang="de",
+    )
+
+    assert translator._estimate_tokens(["abcdefgh", "日本語", "abcd日本"]) == [
+        2,
+        3,
+        3,
+    ]
+
+
+def test_translate_document_chunks_by_paragraph(
+    patched_llm_translator_class, mocker
+):
+    """
+    Test that long documents are split at paragraph breaks, paragraphs that fit
+    together share a request, and the translations are joined in order.
+    """
+    translator = patched_llm_translator_class(
+        model_name="model_a",
+        target_lang="en",
+        source_lang="de",
+        max_tokens=20,
+    )
+    mocker.patch.object(
+        translator,
+        "_render_prompt",
+        side_effect=lambda text_to_translate, source_lang: text_to_translate,
+    )
+    generate = mocker.patch.object(
+        translator, "_generate", side_effect=lambda prompt: [f"en:{prompt}"]
+    )
+
+    paragraphs = [
+        "Erster Absatz hier.",
+        "Zweiter Absatz.",
+        "Dritter Absatz da.",
+    ]
+    translation = translator.translate_document(
+        "\n\n".join(paragraphs) + "\n", max_concurrency=2
+    )
+
+    assert translation == (
+        "en:Erster Absatz hier.\n\nZweiter Absatz.\n\nen:Dritter Absatz da.\n"
+    )
+    assert generate.call_count == 2
+
+    with pytest.raises(ValueError, match="max_chunk_tokens must be"):
+        translator.translate_document("Text.", max_chunk_tokens=0)
+
+
+# --- translate packed
+def test_translate_packed_single_request(patched_llm_translator_class, mocker):
+    """
+    Test that several short texts are translated with one request per pack.
+    """
+    translator = patched_llm_translator_class(
+        model_name="model_a",
+        target_lang="en",
+        source_lang="de",
+    )
+
+    def fake_generate(prompt):
+        assert "independent segments" in prompt
+        start = prompt.index("{")
+        end = prompt.index("}", start)
+        segments = json.loads(prompt[start : end + 1])
+        return [json.dumps({k: f"en:{v}" for k, v in segments.items()})]
+
+    generate = mocker.patch.object(
+        translator, "_generate", side_effect=fake_generate
+    )
+
+    texts = ["Hallo", "Speichern", "Abbrechen", "Datei", "Hilfe"]
+    translations = translator.translate_packed(texts, max_segments=3)
+
+    assert translations == [f"en:{text}" for text in texts]
+    assert generate.call_count == 2
+
+
+def test_render_packed_prompt_static_part(patched_llm_translator_class):
+    """
+    Test that packed prompts carry a static part that does not depend on the segments.
+    """
+    translator = patched_llm_translator_class(
+        model_name="model_a", target_lang="en", source_lang="de"
+    )
+
+    first = translator._render_packed_prompt(["Hallo", "Welt"], "de")
+    second = translator._render_packed_prompt(["Guten", "Morgen"], "de")
+
+    assert first.static == second.static
+    assert "Hallo" not in first.static and "Hallo" in first
+    assert "2 independent segments" in first.static
+    assert '"1": "Hallo"' in first.text
+
+
+def test_translate_packed_falls_back_per_item(
+    patched_llm_translator_class, mocker
+):
+    """
+    Test that segments missing from the packed reply are translated one by one.
+    """
+    translator = patched_llm_translator_class(
+        model_name="model_a",
+        target_lang="en",
+        source_lang="de",
+    )
+    mocker.patch.object(
+        translator,
+        "_generate",
+        side_effect=[['```json\n{"1": "Hello"}\n```'], ["Save"]],
+    )
+
+    assert translator.translate_packed(["Hallo", "Speichern"]) == [
+        "Hello",
+        "Save",
+    ]
+
+    with pytest.raises(ValueError, match="max_segments must be"):
+        translator.translate_packed(["Hallo"], max_segments=0)
+
+
+# --- translate stream
+def test_translate_stream_default_yields_full_response(
+    patched_llm_translator_class,
+):
+    """
+    Test that providers without streaming support yield the whole translation at once.
+    """
+    translator = patched_llm_translator_class(
+        model_name="model_a",
+        target_lang="en",
+        source_lang="de",
+    )
+
+    assert list(translator.translate_stream("Hallo")) == [
+        "my mocked translation"
+    ]
+
+
+def test_translate_stream_strips_outer_whitespace(
+    patched_llm_translator_class, mocker
+):
+    """
+    Test that streamed deltas are yielded in order without leading and trailing whitespace.
+    """
+    translator = patched_llm_translator_class(
+        model_name="model_a",
+        target_lang="en",
+        source_lang="de",
+    )
+    mocker.patch.object(
+        translator,
+        "_generate_stream",
+        return_value=iter(["\n  Hel", "lo ", " ", "world  \n"]),
+    )
+
+    pieces = list(translator.translate_stream("Hallo Welt"))
+
+    assert pieces == ["Hel", "lo", "  world"]
+    assert "".join(pieces) == "Hello  world"
@@ -0,0 +1,275 @@
+import time
+
+import pytest
+
+from easy_nlp_translate.cache import CachedTranslator, TranslationCache
+from easy_nlp_translate.metrics import (
+    OpenTelemetryMetricsHook,
+    add_metrics_hook,
+    current_metrics,
+    measure,
+    record_usage,
+    remove_metrics_hook,
+    stage,
+)
+from easy_nlp_translate.rate_limit import RetryPolicy
+
+
+@pytest.fixture
+def recorded():
+    """
+    Registers a hook collecting all measurements and removes it afterwards.
+    """
+    records = []
+    hook = add_metrics_hook(records.append)
+    yield records
+    remove_metrics_hook(hook)
+
+
+class Usage:
+    def __init__(self, **usage):
+        self.usage = usage
+
+
+def test_stages_are_exclusive(recorded):
+    """
+    Test that nested stages are not counted twice.
+    """
+    with measure(object(), "translate") as metrics:
+        with stage("render"):
+            time.sleep(0.02)
+            with stage("detect"):
+                time.sleep(0.05)
+        record_usage(input_tokens=3, output_tokens=None)
+
+    assert recorded == [metrics]
+    assert metrics.stages["detect"] >= 0.05
+    assert 0.02 <= metrics.stages["render"] < 0.05
+    assert sum(metrics.stages.values()) <= metrics.duration
+    assert metrics.input_tokens == 3
+    assert metrics.output_tokens == 0
+
+
+def test_module_functions_outside_measure_do_nothing(recorded):
+    """
+    Test that stages and usage outside of a measured call are ignored.
+    """
+    with stage("render"):
+        record_usage(input_tokens=1)
+
+    assert recorded == []
+
+
+def test_failed_call_and_failing_hook(recorded):
+    """
+    Test that failed calls are reported and failing hooks are ignored.
+    """
+
+    def broken_hook(metrics):
+        raise RuntimeError("broken")
+
+    add_metrics_hook(broken_hook)
+    try:
+        with pytest.raises(KeyError):
+            with measure(object(), "translate"):
+                raise KeyError("boom")
+    finally:
+        remove_metrics_hook(broken_hook)
+
+    assert recorded[0].error == "KeyError"
+
+
+def test_llm_translate_reports_stages_and_usage(
+    patched_llm_translator_class, recorded, mocker
+):
+    """
+    Test that an LLM translation reports its stages, usage and retries.
+    """
+    translator = patched_llm_translator_class(
+        model_name="model_a", target_lang="de"
+    )
+    mocker.patch.object(
+        translator, "retry_policy", RetryPolicy(base_delay=0.001)
+    )
+    failures = [ConnectionError("reset")]
+
+    def generate(input):
+        def call():
+            if failures:
+                raise failures.pop()
+            return Usage(input_tokens=12, output_tokens=4)
+
+        return translator._call_with_retries(call, input)
+
+    mocker.patch.object(translator, "_generate", side_effect=generate)
+    mocker.patch.object(translator, "_post_process", return_value="Hallo Welt")
+    mocker.patch.object(
+        translator, "_response_usage", side_effect=lambda raw: raw.usage
+    )
+
+    assert translator.translate("Hello world") == "Hallo Welt"
+
+    (metrics,) = recorded
+    assert metrics.translator == "ConcreteLLMTranslator"
+    assert metrics.model_name == "model_a"
+    assert metrics.operation == "translate"
+    assert {
+        "detect",
+        "render",
+        "rate_limit",
+        "request",
+        "retry_backoff",
+        "post_process",
+    } <= set(metrics.stages)
+    assert metrics.retries == 1
+    assert (metrics.input_tokens, metrics.output_tokens) == (12, 4)
+
+
+def test_llm_translate_stream_is_measured(
+    patched_llm_translator_class, recorded, mocker
+):
+    """
+    Test that a stream is reported once, with the usage of its last chunk, and
+    that its metrics do not leak into the caller between pieces.
+    """
+    translator = patched_llm_translator_class(
+        model_name="model_a", target_lang="de", source_lang="en"
+    )
+
+    def generate_stream(input):
+        yield "Hallo"
+        yield " Welt"
+        record_usage(input_tokens=7, output_tokens=2)
+
+    mocker.patch.object(
+        translator, "_generate_stream", side_effect=generate_stream
+    )
+
+    pieces = []
+    for piece in translator.translate_stream("Hello world"):
+        assert current_metrics() is None
+        pieces.append(piece)
+
+    assert pieces == ["Hallo", " Welt"]
+    (metrics,) = recorded
+    assert metrics.operation == "translate_stream"
+    assert "render" in metrics.stages
+    assert (metrics.input_tokens, metrics.output_tokens) == (7, 2)
+
+    for _ in translator.translate_stream("Hello world"):
+        break
+    assert len(recorded) == 2
+    assert recorded[1].error is None
+
+
+def test_huggingface_translate_batch_is_measured(
+    patched_huggingface_translator_class, recorded
+):
+    """
+    Test that a Hugging Face batch translation reports one measurement.
+    """
+    translator = patched_huggingface_translator_class(
+        source_lang="en", target_lang="fr"
+    )
+
+    translator.translate_batch(["a", "b", "c"], batch_size=2)
+
+    (metrics,) = recorded
+    assert metrics.operation == "translate_batch"
+    assert metrics.items == 3
+    assert metrics.error is None
+
+
+def test_cached_translator_reports_cache_hits(
+    patched_llm_translator_class, recorded, tmp_path
+):
+    """
+    Test that every cached call is reported once, with its cache hits.
+    """
+    cache = TranslationCache(tmp_path / "cache.sqlite3")
+    translator = CachedTranslator(
+        patched_llm_translator_class(
+            model_name="model_a", target_lang="de", source_lang="en"
+        ),
+        cache,
+    )
+    translator.translate("Hello")
+    translator.translate_batch(["Hello", "World"])
+    translator.translate_batch(["Hello", "World"])
+    cache.close()
+
+    assert [
+        (metrics.translator, metrics.cache_hits) for metrics in recorded
+    ] == [
+        ("ConcreteLLMTranslator", 0),
+        ("ConcreteLLMTranslator", 1),
+        ("CachedTranslator", 2),
+    ]
+
+
+def test_unclaimed_cache_hits_are_reported(
+    concrete_translator_class, recorded, tmp_path
+):
+    """
+    Test that cache hits are reported when the wrapped translator reports nothing.
+    """
+    cache = TranslationCache(tmp_path / "cache.sqlite3")
+    translator = CachedTranslator(
+        concrete_translator_class(target_lang="de", source_lang="en"), cache
+    )
+    translator.translate("Hello")
+    translator.translate_batch(["Hello", "World"])
+    cache.close()
+
+    (metrics,) = recorded
+    assert metrics.operation == "translate_batch"
+    assert metrics.cache_hits == metrics.items == 1
+
+
+class FakeInstrument:
+    def __init__(self):
+        self.values = []
+
+    def record(self, value, attributes):
+        self.values.append((value, attributes))
+
+    add = record
+
+
+class FakeMeter:
+    def __init__(self):
+        self.instruments = {}
+
+    def create_histogram(self, name, **kwargs):
+        return self.instruments.setdefault(name, FakeInstrument())
+
+    create_counter = create_histogram
+
+
+def test_opentelemetry_hook():
+    """
+    Test that the OpenTelemetry hook records durations, stages and tokens.
+    """
+    meter = FakeMeter()
+    hook = OpenTelemetryMetricsHook(meter)
+
+    with measure(object(), "translate") as metrics:
+        with stage("request"):
+            pass
+        record_usage(input_tokens=5, cache_read_tokens=2)
+    metrics.retries = 1
+    hook(metrics)
+
+    instruments = meter.instruments
+    assert len(instruments["easy_nlp_translate.request.duration"].values) == 1
+    ((_, stage_attributes),) = instruments[
+        "easy_nlp_translate.stage.duration"
+    ].values
+    assert stage_attributes["stage"] == "request"
+    assert {
+        (count, attributes["type"])
+        for count, attributes in instruments[
+            "easy_nlp_translate.tokens"
+        ].values
+    } == {(5, "input"), (2, "cache_read")}
+    assert instruments["easy_nlp_translate.retries"].values[0][0] == 1
@@ -0,0 +1,53 @@
+import pytest
+
+from easy_nlp_translate.model_registry import SharedModelRegistry
+
+
+def test_acquire_loads_once():
+    """
+    Test that the loader only runs for the first acquire of a key.
+    """
+    registry = SharedModelRegistry()
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return object()
+
+    first = registry.acquire("key", loader)
+    second = registry.acquire("key", loader)
+
+    assert first is second
+    assert len(calls) == 1
+    assert registry.refcount("key") == 2
+
+
+def test_release_drops_entry_after_last_user():
+    """
+    Test that the entry is dropped once every user has released it.
+    """
+    registry = SharedModelRegistry()
+    registry.acquire("key", object)
+    registry.acquire("key", object)
+
+    registry.release("key")
+    assert "key" in registry
+
+    registry.release("key")
+    assert "key" not in registry
+    assert len(registry) == 0
+
+
+def test_failed_load_does_not_leak_reference():
+    """
+    Test that a failing loader does not leave a reference behind.
+    """
+    registry = SharedModelRegistry()
+
+    def loader():
+        raise OSError("download failed")
+
+    with pytest.raises(OSError):
+        registry.acquire("key", loader)
+
+    assert registry.refcount("key") == 0
@@ -0,0 +1,128 @@
+from types import SimpleNamespace
+
+import pytest
+
+from easy_nlp_translate.llm_provider.ollama import OllamaTranslator
+from easy_nlp_translate.rate_limit import RetryPolicy
+
+
+@pytest.fixture
+def mock_ollama_list(mocker, monkeypatch):
+    """
+    Mocks `ollama.list` and resets the cached model list of OllamaTranslator.
+    """
+    monkeypatch.setattr(OllamaTranslator, "_models_cache", None)
+    monkeypatch.setattr(OllamaTranslator, "_models_cache_time", 0.0)
+    return mocker.patch(
+        "easy_nlp_translate.llm_provider.ollama.ollama.list",
+        return_value={"models": [SimpleNamespace(model="llama3.2:3b")]},
+    )
+
+
+def test_available_models_are_cached(mock_ollama_list):
+    """
+    Test that the daemon is only queried once within the cache TTL.
+    """
+    assert OllamaTranslator.get_available_models() == ["llama3.2:3b"]
+    assert OllamaTranslator.get_available_models() == ["llama3.2:3b"]
+    assert mock_ollama_list.call_count == 1
+
+    OllamaTranslator.get_available_models(refresh=True)
+    assert mock_ollama_list.call_count == 2
+
+
+def test_available_models_attribute_is_lazy(mock_ollama_list):
+    """
+    Test that AVAILABLE_MODELS queries the daemon on access, not on import.
+    """
+    assert mock_ollama_list.call_count == 0
+
+    assert OllamaTranslator.AVAILABLE_MODELS == ["llama3.2:3b"]
+    assert OllamaTranslator.AVAILABLE_MODELS == ["llama3.2:3b"]
+    assert mock_ollama_list.call_count == 1
+
+
+def test_available_models_expire_after_ttl(mock_ollama_list, monkeypatch):
+    """
+    Test that the cached model list is refreshed once the TTL has passed.
+    """
+    monkeypatch.setattr(OllamaTranslator, "MODELS_CACHE_TTL", 0.0)
+
+    OllamaTranslator.get_available_models()
+    OllamaTranslator.get_available_models()
+
+    assert mock_ollama_list.call_count == 2
+
+
+def test_validate_model_name_uses_cache(mock_ollama_list):
+    """
+    Test that a known model is validated from the cache and that an unknown
+    model triggers a single refresh before failing.
+    """
+    translator = OllamaTranslator(model_name="llama3.2:3b", target_lang="en")
+    assert translator.model_name == "llama3.2:3b"
+    assert mock_ollama_list.call_count == 1
+
+    with pytest.raises(ValueError) as excinfo:
+        translator._validate_model_name("mistral:7b")
+
+    assert "Model 'mistral:7b' is not available." in str(excinfo.value)
+    assert mock_ollama_list.call_count == 2
+
+
+def test_unreachable_daemon(mock_ollama_list):
+    """
+    Test that an unreachable daemon raises a RuntimeError on use, not on import.
+    """
+    mock_ollama_list.side_effect = ConnectionError("connection refused")
+
+    with pytest.raises(RuntimeError, match="Failed to list Ollama models"):
+        OllamaTranslator.get_available_models()
+
+
+def test_translate_stream(mock_ollama_list, mocker):
+    """
+    Test that streamed Ollama chunks are yielded as text deltas.
+    """
+    generate = mocker.patch(
+        "easy_nlp_translate.llm_provider.ollama.ollama.generate",
+        return_value=iter(
+            [{"response": "Hello"}, {"response": " world"}, {"response": ""}]
+        ),
+    )
+    translator = OllamaTranslator(
+        model_name="llama3.2:3b", target_lang="en", source_lang="de"
+    )
+
+    assert list(translator.translate_stream("Hallo Welt")) == [
+        "Hello",
+        " world",
+    ]
+    assert generate.call_args.kwargs["stream"] is True
+
+
+def test_translate_stream_is_retried(mock_ollama_list, mocker):
+    """
+    Test that a stream failing before its first chunk is retried.
+    """
+
+    def generate(**kwargs):
+        if generate_mock.call_count == 1:
+            raise ConnectionError("connection reset")
+        yield {"response": "Hello"}
+
+    generate_mock = mocker.patch(
+        "easy_nlp_translate.llm_provider.ollama.ollama.generate",
+        side_effect=generate,
+    )
+    translator = OllamaTranslator(
+        model_name="llama3.2:3b", target_lang="en", source_lang="de"
+    )
+    mocker.patch.object(
+        translator, "retry_policy", RetryPolicy(base_delay=0.001)
+    )
+    acquire = mocker.spy(translator.rate_limiter, "acquire")
+
+    assert list(translator.translate_stream("Hallo")) == ["Hello"]
+    assert generate_mock.call_count == 2
+    assert acquire.call_count == 2
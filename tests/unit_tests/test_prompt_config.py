@@ -1,6 +1,13 @@
 import pytest
 
-from easy_nlp_translate.prompt_config import PromptStyle
+from easy_nlp_translate.prompt_config import (
+    PROMPT_TEXT_PLACEHOLDER,
+    SHARED_LLM_PROMPT_TEMPLATES_DIR,
+    PromptStyle,
+    load_prompt_template,
+    preload_prompt_templates,
+    render_prompt,
+)
 
 
 def test_from_code_valid_codes():
@@ -60,3 +67,72 @@ def test_enum_member_attributes():
     assert poetic_style.value == "poetic"
     assert poetic_style.description == "Poetic Translation"
     assert poetic_style.template_filename == "poetic_translation.jinja"
+
+
+def test_templates_are_compiled_once(patched_llm_translator_class):
+    """
+    Test that translators share the compiled prompt template.
+    """
+    first = patched_llm_translator_class(
+        model_name="model_a", target_lang="de"
+    )
+    second = patched_llm_translator_class(
+        model_name="model_b", target_lang="en"
+    )
+
+    assert first.prompt is second.prompt
+    assert (
+        load_prompt_template(
+            SHARED_LLM_PROMPT_TEMPLATES_DIR
+            / PromptStyle.DEFAULT.template_filename
+        )
+        is first.prompt
+    )
+
+
+@pytest.mark.parametrize("style", list(PromptStyle))
+def test_render_prompt_matches_full_render(style):
+    """
+    Test that the fast path renders the same prompt as Jinja.
+    """
+    template = load_prompt_template(
+        SHARED_LLM_PROMPT_TEMPLATES_DIR / style.template_filename
+    )
+    kwargs = {
+        "source_language": "English",
+        "target_language": "German",
+        "custom_prompt": "Be brief.",
+    }
+    text = "Line one {{ not a variable }}\nLine two\n"
+
+    rendered = render_prompt(template, text, **kwargs)
+
+    assert rendered == template.render(text_to_translate=text, **kwargs)
+    assert rendered.text == text
+    assert PROMPT_TEXT_PLACEHOLDER in rendered.static
+
+
+def test_render_prompt_falls_back_for_filtered_text(tmp_path):
+    """
+    Test that templates transforming the text are rendered in full.
+    """
+    (tmp_path / "upper.jinja").write_text(
+        "Translate to {{ target_language }}: {{ text_to_translate | upper }}"
+    )
+    template = load_prompt_template(tmp_path / "upper.jinja")
+
+    rendered = render_prompt(template, "hello", target_language="German")
+
+    assert rendered == "Translate to German: HELLO"
+
+
+def test_preload_prompt_templates():
+    """
+    Test that preloading compiles every prompt style and the packed template.
+    """
+    templates = preload_prompt_templates()
+
+    assert len(templates) == len(PromptStyle) + 1
+    assert templates[0] is load_prompt_template(
+        SHARED_LLM_PROMPT_TEMPLATES_DIR / PromptStyle.DEFAULT.template_filename
+    )
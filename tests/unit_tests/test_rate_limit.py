@@ -0,0 +1,102 @@
+from types import SimpleNamespace
+
+import pytest
+
+from easy_nlp_translate.rate_limit import (
+    RateLimiter,
+    RetryPolicy,
+    TokenBucket,
+    configure_rate_limit,
+    get_rate_limiter,
+)
+
+
+class FakeAPIError(Exception):
+    """An SDK-style error carrying a status code and response headers."""
+
+    def __init__(self, status_code: int, headers: dict = None):
+        super().__init__(f"status {status_code}")
+        self.status_code = status_code
+        self.response = SimpleNamespace(headers=headers or {})
+
+
+def test_token_bucket_waits_for_refill(mocker):
+    """
+    Test that the bucket allows a burst up to its capacity and then asks to wait.
+    """
+    mocker.patch(
+        "easy_nlp_translate.rate_limit.time.monotonic", return_value=100.0
+    )
+    bucket = TokenBucket(rate_per_minute=60)
+
+    assert bucket.reserve(60) == 0.0
+    assert bucket.reserve(1) == pytest.approx(1.0)
+    assert bucket.reserve(2) == pytest.approx(3.0)
+
+
+def test_rate_limiter_is_shared_per_provider():
+    """
+    Test that translators of a provider share one limiter until it is reconfigured.
+    """
+    limiter = configure_rate_limit("test-provider", requests_per_minute=10)
+
+    assert get_rate_limiter("test-provider") is limiter
+    assert limiter.requests is not None and limiter.tokens is None
+    assert get_rate_limiter("other-provider") is not limiter
+
+
+def test_retry_policy_classifies_errors():
+    """
+    Test that rate-limit, server and connection errors are retried, client errors are not.
+    """
+    policy = RetryPolicy()
+
+    assert policy.is_retryable(FakeAPIError(429))
+    assert policy.is_retryable(FakeAPIError(503))
+    assert policy.is_retryable(ConnectionError("reset"))
+    assert not policy.is_retryable(FakeAPIError(400))
+    assert not policy.is_retryable(ValueError("bad input"))
+
+
+def test_retry_policy_honors_retry_after(mocker):
+    """
+    Test that Retry-After is used when it is longer than the jittered backoff.
+    """
+    mocker.patch(
+        "easy_nlp_translate.rate_limit.random.uniform", return_value=0.5
+    )
+    policy = RetryPolicy(base_delay=1.0, max_delay=30.0)
+
+    assert policy.delay(0, FakeAPIError(429, {"retry-after": "7"})) == 7.0
+    assert policy.delay(0, FakeAPIError(429, {"retry-after-ms": "250"})) == 0.5
+    assert policy.delay(0, FakeAPIError(429, {"retry-after": "120"})) == 30.0
+
+
+def test_call_with_retries(patched_llm_translator_class, mocker):
+    """
+    Test that retryable errors are retried with backoff and other errors are raised at once.
+    """
+    sleep = mocker.patch("easy_nlp_translate.llm_translator_base.time.sleep")
+    translator = patched_llm_translator_class(
+        model_name="model_a", target_lang="en", source_lang="de"
+    )
+    translator.retry_policy = RetryPolicy(max_retries=2, base_delay=0.1)
+    acquire = mocker.patch.object(RateLimiter, "acquire")
+
+    call = mocker.Mock(
+        side_effect=[FakeAPIError(429), FakeAPIError(502), "ok"]
+    )
+    assert translator._call_with_retries(call, "Hallo") == "ok"
+    assert call.call_count == 3
+    assert sleep.call_count == 2
+    assert acquire.call_count == 3
+
+    call = mocker.Mock(side_effect=FakeAPIError(401))
+    with pytest.raises(FakeAPIError):
+        translator._call_with_retries(call, "Hallo")
+    assert call.call_count == 1
+
+    call = mocker.Mock(side_effect=FakeAPIError(429))
+    with pytest.raises(FakeAPIError):
+        translator._call_with_retries(call, "Hallo")
+    assert call.call_count == 3
@@ -0,0 +1,240 @@
+import threading
+import time
+
+import pytest
+
+from easy_nlp_translate.exceptions import BatchTranslationError, RoutingError
+from easy_nlp_translate.initialize import initialize_translator
+from easy_nlp_translate.metrics import current_metrics, measure
+from easy_nlp_translate.router import LatencyHistogram, RouterTranslator
+from easy_nlp_translate.translator_base import TranslatorBase
+
+
+class FakeBackend(TranslatorBase):
+    """
+    A fake backend that answers after `delay` seconds, or raises if `fail` is set.
+    """
+
+    def __init__(self, name: str, delay: float = 0.0, fail: bool = False):
+        self.model_name = name
+        self.delay = delay
+        self.fail = fail
+        self.calls = 0
+        self._lock = threading.Lock()
+        super().__init__(target_lang="de", source_lang="en")
+
+    def translate(self, text: str) -> str:
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.delay)
+        if self.fail:
+            raise ConnectionError(f"{self.model_name} is down")
+        return f"{self.model_name}:{text}"
+
+
+def make_router(*backends: FakeBackend, **kwargs) -> RouterTranslator:
+    return RouterTranslator(list(backends), **kwargs)
+
+
+def test_primary_answers():
+    """
+    Test that a fast primary answers without involving the other backends.
+    """
+    primary, secondary = FakeBackend("primary"), FakeBackend("secondary")
+    router = make_router(primary, secondary, hedge_after=1.0)
+
+    assert router.translate("Hello") == "primary:Hello"
+    assert secondary.calls == 0
+
+
+def test_failover_on_error():
+    """
+    Test that the next backend is tried right away when one fails.
+    """
+    primary = FakeBackend("primary", fail=True)
+    secondary = FakeBackend("secondary")
+    router = make_router(primary, secondary, hedge_after=5.0)
+
+    start = time.perf_counter()
+    assert router.translate("Hello") == "secondary:Hello"
+    assert time.perf_counter() - start < 1.0
+    assert router.latency_stats[0]["failures"] == 1
+
+
+def test_hedges_slow_primary():
+    """
+    Test that a slow primary is hedged and the first success is returned.
+    """
+    primary = FakeBackend("primary", delay=1.0)
+    secondary = FakeBackend("secondary")
+    router = make_router(primary, secondary, hedge_after=0.05)
+
+    start = time.perf_counter()
+    assert router.translate("Hello") == "secondary:Hello"
+    assert time.perf_counter() - start < 0.5
+    assert primary.calls == secondary.calls == 1
+
+
+def test_no_hedging_waits_for_primary():
+    """
+    Test that without a latency budget the slow primary is awaited.
+    """
+    primary = FakeBackend("primary", delay=0.1)
+    secondary = FakeBackend("secondary")
+    router = make_router(primary, secondary, hedge_after=None)
+
+    assert router.translate("Hello") == "primary:Hello"
+    assert secondary.calls == 0
+
+
+def test_all_backends_fail():
+    """
+    Test that a RoutingError carries the error of every backend.
+    """
+    router = make_router(
+        FakeBackend("primary", fail=True), FakeBackend("secondary", fail=True)
+    )
+
+    with pytest.raises(RoutingError) as excinfo:
+        router.translate("Hello")
+
+    assert set(excinfo.value.errors) == {
+        "0:FakeBackend:primary",
+        "1:FakeBackend:secondary",
+    }
+
+
+def test_errors_of_backends_with_the_same_model():
+    """
+    Test that backends with the same model name keep separate errors.
+    """
+    router = make_router(
+        FakeBackend("shared", fail=True), FakeBackend("shared", fail=True)
+    )
+
+    with pytest.raises(RoutingError) as excinfo:
+        router.translate("Hello")
+
+    assert len(excinfo.value.errors) == 2
+
+
+def test_timeout():
+    """
+    Test that the router gives up after the timeout.
+    """
+    router = make_router(FakeBackend("primary", delay=1.0), timeout=0.05)
+
+    with pytest.raises(RoutingError, match="No translation"):
+        router.translate("Hello")
+
+
+def test_reorders_by_latency():
+    """
+    Test that a backend with a slow tail is moved behind a faster one.
+    """
+    primary, secondary = FakeBackend("primary"), FakeBackend("secondary")
+    router = make_router(primary, secondary, hedge_after=1.0, min_samples=2)
+
+    for _ in range(3):
+        router.histograms[0].record(5.0)
+        router.histograms[1].record(0.2)
+
+    assert router.backend_order() == [1, 0]
+    assert router.translate("Hello") == "secondary:Hello"
+
+    router.reorder = False
+    assert router.backend_order() == [0, 1]
+
+
+def test_translate_batch():
+    """
+    Test that batch items are routed on their own and failures are collected.
+    """
+    router = make_router(FakeBackend("primary"))
+
+    assert router.translate_batch(["a", "b"]) == ["primary:a", "primary:b"]
+
+    router.translators[0].fail = True
+    with pytest.raises(BatchTranslationError) as excinfo:
+        router.translate_batch(["a", "b"])
+    assert set(excinfo.value.errors) == {0, 1}
+
+
+def test_latency_histogram_quantiles_and_decay():
+    """
+    Test the bucketed quantiles and that old observations decay.
+    """
+    histogram = LatencyHistogram(window=10)
+    assert histogram.quantile(0.5) is None
+
+    for _ in range(9):
+        histogram.record(0.03)
+    histogram.record_failure()
+
+    assert histogram.quantile(0.5) == 0.05
+    assert histogram.quantile(1.0) == float("inf")
+
+    histogram.record(0.03)
+    assert histogram.count == pytest.approx(5.5)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"hedge_after": 0},
+        {"timeout": -1},
+        {"latency_quantile": 1.5},
+        {"min_samples": 0},
+    ],
+)
+def test_invalid_settings(kwargs):
+    """
+    Test that invalid router settings are rejected.
+    """
+    with pytest.raises(ValueError):
+        make_router(FakeBackend("primary"), **kwargs)
+
+
+def test_mismatched_languages():
+    """
+    Test that backends must share the language pair.
+    """
+    other = FakeBackend("other")
+    other.target_lang = "fr"
+
+    with pytest.raises(ValueError):
+        make_router(FakeBackend("primary"), other)
+
+
+def test_initialize_router():
+    """
+    Test that the router is registered in the translator registry.
+    """
+    router = initialize_translator(
+        "router", translators=[FakeBackend("primary")], hedge_after=0.5
+    )
+
+    assert isinstance(router, RouterTranslator)
+    assert router.target_lang == "de"
+    assert router.source_lang == "en"
+
+
+def test_backends_run_in_callers_context():
+    """
+    Test that backend calls see the caller's context variables, so metrics
+    recorded by a backend land on the caller's measurement.
+    """
+    seen = []
+
+    class ContextBackend(FakeBackend):
+        def translate(self, text: str) -> str:
+            seen.append(current_metrics())
+            return super().translate(text)
+
+    router = make_router(ContextBackend("primary"))
+
+    with measure(router, "translate") as metrics:
+        router.translate("Hello")
+        router.translate_batch(["a", "b"])
+
+    assert seen == [metrics, metrics, metrics]
@@ -0,0 +1,71 @@
+import pytest
+
+from easy_nlp_translate.text_chunking import (
+    PARAGRAPH_BREAK_PATTERN,
+    ChunkedText,
+)
+
+
+def count_words(texts: list[str]) -> list[int]:
+    """Counts whitespace-separated words as tokens."""
+    return [len(text.split()) for text in texts]
+
+
+DOCUMENT = (
+    "  Hello world. This is a test!  Another sentence here.\n\n"
+    " Second paragraph.\nA line that is longer than the budget allows.\n"
+)
+
+
+def test_split_round_trips_whitespace():
+    """
+    Tests that joining the untranslated chunks restores the original text exactly.
+    """
+    chunked = ChunkedText.split(DOCUMENT, 6, count_words)
+
+    assert chunked.join(chunked.chunks) == DOCUMENT
+    assert all(sum(count_words([chunk])) <= 6 for chunk in chunked.chunks)
+
+
+def test_split_packs_sentences_within_lines():
+    """
+    Tests that sentences are packed greedily but never across line breaks.
+    """
+    chunked = ChunkedText.split(DOCUMENT, 6, count_words)
+
+    assert chunked.chunks == [
+        "Hello world. This is a test!",
+        "Another sentence here.",
+        "Second paragraph.",
+        "A line that is longer than",
+        "the budget allows.",
+    ]
+    assert chunked.separators == ["  ", "  ", "\n\n ", "\n", " ", "\n"]
+
+
+def test_split_merges_paragraphs():
+    """
+    Tests that paragraphs share a chunk when they fit the budget together.
+    """
+    chunked = ChunkedText.split(
+        DOCUMENT,
+        20,
+        count_words,
+        PARAGRAPH_BREAK_PATTERN,
+        merge_paragraphs=True,
+    )
+
+    assert len(chunked) == 1
+    assert chunked.join(["translated"]) == "  translated\n"
+
+
+def test_join_and_split_validation():
+    """
+    Tests that invalid budgets and mismatched translations raise a ValueError.
+    """
+    chunked = ChunkedText.split("One. Two.", 1, count_words)
+
+    with pytest.raises(ValueError, match="Expected 2 translations"):
+        chunked.join(["Eins."])
+    with pytest.raises(ValueError, match="max_tokens must be"):
+        ChunkedText.split("One.", 0, count_words)